@@ -64,7 +64,8 @@ __all__ = [
     # module: anchor
     'MeshAnchor', 'MeshAnchorList',
     # module: hook
-    'MeshHook',
+    'MeshHook', 'LoadBalanceHook', 'PhaseTimeHook', 'TraceHook',
+    'IbcStatHook', 'TelemetryHook', 'MemoryHook',
     # module: boundcond
     'BC', 'bctregy',
     # module: domain
@@ -81,22 +82,79 @@ __all__ = [
     'test',
 ]
 
-from .dependency import import_module_may_fail, import_name
-from .cmdutil import Command, go
-from .conf import env
-from .block import Block
-import_name('Table', '.mesh', may_fail=True)
-from .solver import MeshSolver
-from .case import MeshCase
-from .anchor import MeshAnchor, MeshAnchorList
-from .hook import MeshHook
-from .boundcond import BC, bctregy
-from .domain import Domain, Collective, Distributed
-from . import helper
-from .helper import Gmsh
-from . import parcel
-from . import py3kcompat
-from . import exception
+#: Map a public name to the module providing it and the attribute in the
+#: module (``None`` for the module itself).  The module is imported on the
+#: first access to the name, so that ``import solvcon`` stays cheap for the
+#: command line and for spawning workers.
+_LAZY_NAMES = {
+    'import_module_may_fail': ('.dependency', 'import_module_may_fail'),
+    'import_name': ('.dependency', 'import_name'),
+    'go': ('.cmdutil', 'go'),
+    'Command': ('.cmdutil', 'Command'),
+    'env': ('.conf', 'env'),
+    'Block': ('.block', 'Block'),
+    'Table': ('.mesh', 'Table'),
+    'MeshSolver': ('.solver', 'MeshSolver'),
+    'MeshCase': ('.case', 'MeshCase'),
+    'MeshAnchor': ('.anchor', 'MeshAnchor'),
+    'MeshAnchorList': ('.anchor', 'MeshAnchorList'),
+    'MeshHook': ('.hook', 'MeshHook'),
+    'LoadBalanceHook': ('.hook', 'LoadBalanceHook'),
+    'PhaseTimeHook': ('.hook', 'PhaseTimeHook'),
+    'TraceHook': ('.hook', 'TraceHook'),
+    'IbcStatHook': ('.hook', 'IbcStatHook'),
+    'TelemetryHook': ('.hook', 'TelemetryHook'),
+    'MemoryHook': ('.hook', 'MemoryHook'),
+    'BC': ('.boundcond', 'BC'),
+    'bctregy': ('.boundcond', 'bctregy'),
+    'Domain': ('.domain', 'Domain'),
+    'Collective': ('.domain', 'Collective'),
+    'Distributed': ('.domain', 'Distributed'),
+    'helper': ('.helper', None),
+    'Gmsh': ('.helper', 'Gmsh'),
+    'parcel': ('.parcel', None),
+    'py3kcompat': ('.py3kcompat', None),
+    'exception': ('.exception', None),
+}
+
+#: Names that may be missing because their extension module is not built.
+_MAY_FAIL_NAMES = ('Table',)
+
+def __getattr__(name):
+    """
+    Import the module providing *name* and cache the value (PEP 562).
+    """
+    import importlib
+    try:
+        modname, attr = _LAZY_NAMES[name]
+    except KeyError:
+        raise AttributeError("module %r has no attribute %r" % (
+            __name__, name))
+    try:
+        mod = importlib.import_module(modname, __name__)
+    except ImportError as e:
+        if name not in _MAY_FAIL_NAMES:
+            raise
+        import warnings
+        warnings.warn("%s%s isn't built; %s" % (__name__, modname, e),
+                      RuntimeWarning, stacklevel=2)
+        val = None
+    else:
+        val = mod if attr is None else getattr(mod, attr)
+    globals()[name] = val
+    return val
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
+
+import sys as _sys
+if _sys.version_info < (3, 7):
+    # no module __getattr__; load everything as before.
+    for _name in __all__:
+        if _name in _LAZY_NAMES:
+            __getattr__(_name)
+    del _name
+del _sys
 
 def test():
     """
@@ -110,4 +168,5 @@ def test():
     nose.main(argv=['nosetests', '--exe'] + paths)
 
 if __name__ == '__main__':
+    from .cmdutil import go
     go()
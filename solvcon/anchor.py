@@ -37,6 +37,8 @@ The family of :py:class:`MeshAnchor` classes are attached to
 from __future__ import absolute_import, division, print_function
 
 
+import time
+
 # import legacy.
 from .anchor_legacy import(
     Anchor, AnchorList,
@@ -117,7 +119,79 @@ class MeshAnchorList(list):
         runanchors = self.svr.runanchors
         if method == 'postloop' or method == 'exhaust':
             runanchors = reversed(runanchors)
+        tracer = getattr(self.svr, 'tracer', None)
         for anchor in runanchors:
             func = getattr(anchor, method, None)
             if func != None:
-                func()
+                # the no-op methods of the base class are not recorded.
+                if tracer is None or getattr(func, '__func__', None) is \
+                   MeshAnchor.__dict__.get(method):
+                    func()
+                else:
+                    t0 = time.time()
+                    func()
+                    tracer.add('%s.%s' % (type(anchor).__name__, method),
+                               'anchor', t0, time.time())
+
+
+class TraceAnchor(MeshAnchor):
+    """
+    Start recording the spans of the solver into a
+    :py:class:`solvcon.gendata.SpanRecorder` as :py:attr:`MeshSolver.tracer
+    <solvcon.solver.MeshSolver.tracer>`.  It is dropped by
+    :py:class:`solvcon.hook.TraceHook`.
+    """
+
+    def __init__(self, svr, **kw):
+        from .gendata import SpanRecorder
+        super(TraceAnchor, self).__init__(svr, **kw)
+        svrn = svr.svrn if svr.svrn is not None else 0
+        svr.tracer = SpanRecorder(pid=svrn+1, label='solver #%d' % svrn)
+
+
+class IbcStatAnchor(MeshAnchor):
+    """
+    Return the statistics of the interface exchange
+    (:py:attr:`MeshSolver.ibcstat <solvcon.solver.MeshSolver.ibcstat>`) and
+    the marching time of the solver through :py:attr:`MeshSolver.marchret
+    <solvcon.solver.MeshSolver.marchret>`.  The statistics accumulate from the
+    beginning of the run.
+
+    Pair with :py:class:`solvcon.hook.IbcStatHook`.
+    """
+
+    def postmarch(self):
+        svr = self.svr
+        svr.marchret['ibcstat'] = dict(
+            svrn=svr.svrn if svr.svrn is not None else 0,
+            march=svr.timer.get('march', 0.0),
+            stat=dict(svr.ibcstat),
+        )
+
+
+class TelemetryAnchor(MeshAnchor):
+    """
+    Return the wall time of the latest call to :py:meth:`MeshSolver.march
+    <solvcon.solver.MeshSolver.march>` and the resident set size of the
+    process through :py:attr:`MeshSolver.marchret
+    <solvcon.solver.MeshSolver.marchret>`.
+
+    Pair with :py:class:`solvcon.hook.TelemetryHook`.
+    """
+
+    def __init__(self, svr, **kw):
+        super(TelemetryAnchor, self).__init__(svr, **kw)
+        self._marker = None
+
+    def premarch(self):
+        self._marker = time.time()
+
+    def postmarch(self):
+        from .telemetry import get_rss
+        svr = self.svr
+        svr.marchret['telemetry'] = dict(
+            svrn=svr.svrn if svr.svrn is not None else 0,
+            nstep=svr.step_current,
+            elapsed=time.time() - self._marker,
+            rss=get_rss(),
+        )
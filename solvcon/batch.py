@@ -291,6 +291,15 @@ class Batch(with_metaclass(BatchMeta)):
     def nodelist(self):
         raise NotImplementedError
 
+    @property
+    def create_concurrently(self):
+        """
+        Whether :py:meth:`create_worker` can be called from multiple threads
+        at once.  Ports of MPI workers are received one by one.
+        """
+        from .conf import env
+        return not env.mpi
+
     def create_worker(self, *args, **kw):
         """
         True implementations are in create_worker_*() and have identical spec.
@@ -510,6 +519,13 @@ class Torque(Batch):
         thd.join()
         return portq.get()
 
+    @property
+    def create_concurrently(self):
+        from .batch_torque import TaskManager
+        # the TM API is driven from one thread.
+        return (super(Torque, self).create_concurrently
+                and not TaskManager._clib_torque)
+
     def create_worker(self, *args, **kw):
         from .conf import env
         from .batch_torque import TaskManager
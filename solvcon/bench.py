@@ -0,0 +1,340 @@
+# -*- coding: UTF-8 -*-
+#
+# Copyright (c) 2014, Yung-Yu Chen <yyc@solvcon.net>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Micro-benchmarks of the marching kernels of the parcels.  A solver is set up
+on a structured mesh created by
+:py:func:`solvcon.testing.create_structured_blk`, and each of its marching
+methods is timed separately.  The number of OpenMP threads is taken from the
+environment variable ``OMP_NUM_THREADS``, so that a sweep over thread counts
+needs a process for each count (see :py:class:`solvcon.command.bench`).
+
+Running this module as a script reads a JSON object of keyword arguments to
+:py:func:`run_suite` from the first argument and writes the records as JSON to
+the standard output.
+"""
+
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import json
+from timeit import default_timer
+
+
+#: Map the name of a cell shape to the spatial dimension and the cell type.
+SHAPES = {
+    'tri': (2, 3),
+    'quad': (2, 2),
+    'tet': (3, 5),
+    'hex': (3, 4),
+}
+
+#: Fields in a benchmark record.
+FIELDS = ('parcel', 'shape', 'size', 'ncell', 'nthread', 'kernel',
+          'best', 'mean', 'mcps')
+
+
+class KernelBench(object):
+    """
+    Time the marching methods of a solver one by one.  A subclass sets up the
+    solver of a parcel by overriding :py:meth:`create_solver` and
+    :py:meth:`fill`.
+
+    >>> class DummyBench(KernelBench):
+    ...     parcel = 'dummy'
+    ...     def create_solver(self, blk):
+    ...         from solvcon.solver import MeshSolver
+    ...         class DummySolver(MeshSolver):
+    ...             _MMNAMES = MeshSolver.new_method_list()
+    ...             @_MMNAMES.register
+    ...             def calcnothing(self, worker=None):
+    ...                 pass
+    ...         return DummySolver(blk)
+    >>> bench = DummyBench('quad', 4, repeat=2)
+    >>> [(rec['kernel'], rec['ncell']) for rec in bench()]
+    [('calcnothing', 16)]
+    """
+
+    #: Name of the parcel.
+    parcel = None
+    #: Spatial dimensions supported by the parcel.
+    ndims = (2, 3)
+    #: Estimated maximum wave speed of the initial condition, used to set the
+    #: time increment.
+    wavespeed = 1.0
+
+    def __init__(self, shape, size, repeat=10, cfl=0.5):
+        """
+        :param shape: Name of the cell shape, one of the keys of
+            :py:data:`SHAPES`.
+        :type shape: str
+        :param size: Number of cells along each axis of the unit box.
+        :type size: int
+        :keyword repeat: Number of timed invocations of each kernel.
+        :type repeat: int
+        :keyword cfl: CFL number to determine the time increment.
+        :type cfl: float
+        """
+        #: Name of the cell shape.
+        self.shape = shape
+        #: Number of cells along each axis.
+        self.size = int(size)
+        #: Number of timed invocations of each kernel.
+        self.repeat = int(repeat)
+        #: CFL number to determine the time increment.
+        self.cfl = cfl
+
+    @property
+    def ndim(self):
+        return SHAPES[self.shape][0]
+
+    @property
+    def nthread(self):
+        nthread = os.environ.get('OMP_NUM_THREADS', '')
+        return int(nthread) if nthread.isdigit() else None
+
+    def create_bctype(self):
+        """
+        :return: The BC type for the boundary of the box.
+        """
+        return None
+
+    def create_solver(self, blk):
+        """
+        :param blk: The mesh.
+        :type blk: solvcon.block.Block
+        :return: The solver to be benchmarked.
+        :rtype: solvcon.solver.MeshSolver
+        """
+        raise NotImplementedError
+
+    def fill(self, svr):
+        """
+        Set the initial condition after the solver is provided.
+
+        :param svr: The solver.
+        :type svr: solvcon.solver.MeshSolver
+        """
+        pass
+
+    def setup(self):
+        """
+        Create and initialize the solver for benchmarking.
+
+        :return: The solver.
+        :rtype: solvcon.solver.MeshSolver
+        """
+        from .testing import create_structured_blk
+        ndim, cltpn = SHAPES[self.shape]
+        blk = create_structured_blk([self.size]*ndim, cltpn=cltpn,
+                                    unspec_type=self.create_bctype())
+        blk.clgrp.fill(0)
+        blk.grpnames.append('blank')
+        svr = self.create_solver(blk)
+        svr.init()
+        svr.provide()
+        self.fill(svr)
+        svr.preloop()
+        svr.apply_bc()
+        svr.time = 0.0
+        hmin = blk.clvol.min() ** (1.0/ndim)
+        svr.time_increment = self.cfl * hmin / self.wavespeed
+        return svr
+
+    def time(self, func):
+        """
+        :param func: The callable to be timed.
+        :return: The best and mean wall time of a call in second.
+        :rtype: tuple
+        """
+        func()
+        elapses = []
+        for it in range(self.repeat):
+            timer = default_timer()
+            func()
+            elapses.append(default_timer() - timer)
+        return min(elapses), sum(elapses) / len(elapses)
+
+    def __call__(self):
+        """
+        :return: The records of all the timed kernels.
+        :rtype: list of dict
+        """
+        svr = self.setup()
+        records = []
+        for name in svr.mmnames:
+            # interface BCs do nothing without a worker.
+            if name.startswith('ibc'):
+                continue
+            best, mean = self.time(getattr(svr, name))
+            records.append(dict(
+                parcel=self.parcel, shape=self.shape, size=self.size,
+                ncell=svr.ncell, nthread=self.nthread, kernel=name,
+                best=best, mean=mean,
+                mcps=svr.ncell/best/1.e6 if best > 0 else None,
+            ))
+        svr.postloop()
+        return records
+
+
+class GasBench(KernelBench):
+    parcel = 'gas'
+    wavespeed = 1.4**0.5
+
+    def create_bctype(self):
+        from .parcel.gas import GasNonrefl
+        return GasNonrefl
+
+    def create_solver(self, blk):
+        from .parcel.gas import GasSolver
+        return GasSolver(blk)
+
+    def fill(self, svr):
+        # quiescent gas of unit density and pressure.
+        gamma = 1.4
+        svr.amsca.fill(gamma)
+        svr.soln.fill(0.0)
+        svr.soln[:,0] = 1.0
+        svr.soln[:,svr.ndim+1] = 1.0 / (gamma-1)
+        svr.dsoln.fill(0.0)
+
+
+class BulkBench(KernelBench):
+    parcel = 'bulk'
+
+    def __init__(self, *args, **kw):
+        from .parcel.bulk import material
+        super(BulkBench, self).__init__(*args, **kw)
+        self.fluid = material.fluids['air']
+        self.wavespeed = (self.fluid.bulk / self.fluid.rho) ** 0.5
+
+    def create_bctype(self):
+        from .parcel.bulk.solver import BulkNonrefl
+        return BulkNonrefl
+
+    def create_solver(self, blk):
+        from .parcel.bulk import BulkSolver
+        return BulkSolver(blk, p0=0.0, rho0=self.fluid.rho,
+                          fluids=[self.fluid])
+
+
+class LinearBench(KernelBench):
+    parcel = 'linear'
+
+    def __init__(self, *args, **kw):
+        from .parcel.linear.velstress import material
+        super(LinearBench, self).__init__(*args, **kw)
+        self.mtrl = material.RickerSample(al=0.0, be=0.0, ga=0.0)
+        self.wavespeed = 3200.0
+
+    def create_bctype(self):
+        from .parcel.linear import LinearNonrefl
+        return LinearNonrefl
+
+    def create_solver(self, blk):
+        from .parcel.linear.velstress import VslinSolver
+        return VslinSolver(blk, mtrldict={None: self.mtrl})
+
+    def fill(self, svr):
+        svr.soln.fill(0.0)
+        svr.dsoln.fill(0.0)
+
+
+class VewaveBench(KernelBench):
+    parcel = 'vewave'
+    ndims = (3,)
+
+    def __init__(self, *args, **kw):
+        from .parcel.vewave import material
+        super(VewaveBench, self).__init__(*args, **kw)
+        self.mtrl = material.SoftTissue()
+        self.wavespeed = self.mtrl.vp
+
+    def create_bctype(self):
+        from .parcel.vewave import VewaveNonRefl
+        return VewaveNonRefl
+
+    def create_solver(self, blk):
+        from .parcel.vewave import VewaveSolver
+        return VewaveSolver(blk, {None: self.mtrl})
+
+    def fill(self, svr):
+        svr.soln.fill(0.0)
+        svr.dsoln.fill(0.0)
+
+
+#: Map the name of a parcel to its benchmark class.
+BENCHES = {
+    'gas': GasBench,
+    'bulk': BulkBench,
+    'linear': LinearBench,
+    'vewave': VewaveBench,
+}
+
+
+def run_suite(parcels=None, shapes=None, sizes=(32,), repeat=10):
+    """
+    Benchmark the kernels of the given parcels on the given meshes.
+    Combinations of a parcel and a shape that the parcel does not support are
+    skipped.
+
+    :keyword parcels: Names of the parcels.  Default is all of
+        :py:data:`BENCHES`.
+    :type parcels: list of str
+    :keyword shapes: Names of the cell shapes.  Default is all of
+        :py:data:`SHAPES`.
+    :type shapes: list of str
+    :keyword sizes: Numbers of cells along each axis.
+    :type sizes: list of int
+    :keyword repeat: Number of timed invocations of each kernel.
+    :type repeat: int
+    :return: The benchmark records.
+    :rtype: list of dict
+    """
+    parcels = sorted(BENCHES) if parcels is None else parcels
+    shapes = sorted(SHAPES) if shapes is None else shapes
+    records = []
+    for parcel in parcels:
+        bcls = BENCHES[parcel]
+        for shape in shapes:
+            if SHAPES[shape][0] not in bcls.ndims:
+                continue
+            for size in sizes:
+                records.extend(bcls(shape, size, repeat=repeat)())
+    return records
+
+
+if __name__ == '__main__':
+    import sys
+    kw = json.loads(sys.argv[1]) if len(sys.argv) > 1 else {}
+    json.dump(run_suite(**kw), sys.stdout)
+
+# vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
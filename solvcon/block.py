@@ -46,7 +46,7 @@ import json
 
 import numpy as np
 
-from .py3kcompat import with_metaclass
+from .py3kcompat import with_metaclass, basestring
 from . import boundcond
 from . import dependency
 dependency.import_module_may_fail('.mesh')
@@ -194,6 +194,9 @@ class Block(with_metaclass(BlockMeta)):
     FCMND = MAX_FCNND
     CLMND = MAX_CLNND
     CLMFC = MAX_CLNFC
+    #: The "auto" partition method uses recursive bisection below this number
+    #: of parts, and k-way partitioning otherwise.
+    RECURSIVE_NPART = 8
 
     def __init__(self, *args, **kw):
         """
@@ -526,9 +529,102 @@ class Block(with_metaclass(BlockMeta)):
         # return result.
         return ngstnode, ngstface, ngstcell
 
-    def partition(self, npart):
+    def partition(self, npart, vwgt=None, adjwgt=None, method='kway'):
+        """
+        Partition the cells into *npart* parts with METIS.
+
+        @param npart: number of parts.
+        @type npart: int
+        @keyword vwgt: integer weight of each cell; None balances the number
+            of cells.  A two-dimensional array gives one column per
+            constraint; since the METIS interface in use has no
+            multi-constraint routines, each column is normalized to the same
+            total and they are summed.  "bound" balances both the cells and
+            the boundary faces.
+        @type vwgt: numpy.ndarray or str
+        @keyword adjwgt: integer weight of each edge in the order of
+            Mesh.create_csr, or "area" to weigh by the area of the face
+            between the two cells.  None weighs all edges equally, so that
+            the edgecut counts the interface faces, i.e., the ghost cells to
+            be exchanged.
+        @type adjwgt: numpy.ndarray or str
+        @keyword method: "kway", "recursive" (bisection), or "auto".
+        @type method: str
+        @return: edgecut (weighted if adjwgt is given) and the part index of
+            each cell.
+        @rtype: tuple
+        """
         msh = self.create_msh()
-        return msh.partition(npart)
+        if isinstance(vwgt, basestring):
+            if vwgt != 'bound':
+                raise ValueError('unknown vwgt %s' % vwgt)
+            vwgt = np.vstack([np.ones(self.ncell, dtype='int32'),
+                              self.count_bound_faces()]).T
+        if vwgt is not None:
+            vwgt = np.asarray(vwgt)
+            if vwgt.ndim == 2:
+                vwgt = self._combine_constraints(vwgt)
+            vwgt = np.ascontiguousarray(vwgt, dtype='int32')
+            if vwgt.shape != (self.ncell,):
+                raise ValueError('vwgt must have %d elements, not %s' % (
+                    self.ncell, vwgt.shape))
+        if isinstance(adjwgt, basestring):
+            if adjwgt != 'area':
+                raise ValueError('unknown adjwgt %s' % adjwgt)
+            adjwgt = self._scale_weight(self.fcara[self.csr_faces()])
+        elif adjwgt is not None:
+            adjwgt = np.ascontiguousarray(adjwgt, dtype='int32')
+        if method == 'auto':
+            method = 'recursive' if npart < self.RECURSIVE_NPART else 'kway'
+        if method not in ('kway', 'recursive'):
+            raise ValueError('unknown method %s' % method)
+        return msh.partition(npart, vwgtarr=vwgt, adjwgtarr=adjwgt,
+                             recursive=method=='recursive')
+
+    def count_bound_faces(self):
+        """
+        @return: the number of boundary faces of each cell.
+        @rtype: numpy.ndarray
+        """
+        bcls = self.fccls[self.bndfcs[:,0],0]
+        return np.bincount(bcls, minlength=self.ncell).astype('int32')
+
+    def csr_faces(self):
+        """
+        @return: the face between the two cells of each edge in the CSR graph
+            built by Mesh.create_csr, in the same order.
+        @rtype: numpy.ndarray
+        """
+        clnfc = self.clfcs[:,:1]
+        clfcs = self.clfcs[:,1:]
+        icl = np.arange(self.ncell, dtype='int32')[:,None]
+        valid = (np.arange(clfcs.shape[1])[None,:] < clnfc) & (clfcs >= 0)
+        fcs = np.where(valid, clfcs, 0)
+        fccls = self.fccls[fcs]
+        rcl = np.where(fccls[...,0] == icl,
+            np.where(fccls[...,2] != -1, -1, fccls[...,1]),
+            np.where(fccls[...,1] == icl, fccls[...,0], -1))
+        return fcs[valid & (rcl >= 0)]
+
+    @staticmethod
+    def _scale_weight(arr, resolution=100):
+        """
+        Turn positive real weights into integers of the given mean, at least 1.
+        """
+        mean = arr.mean() if len(arr) else 0
+        if not mean > 0:
+            return np.ones(len(arr), dtype='int32')
+        return np.maximum(np.rint(arr*(resolution/mean)), 1).astype('int32')
+
+    @classmethod
+    def _combine_constraints(cls, vwgt):
+        """
+        Sum the constraints (columns) of vwgt after normalizing each of them.
+        """
+        vwgt = vwgt.astype('float64')
+        total = vwgt.sum(axis=0)
+        vwgt = (vwgt[:,total>0] / total[total>0]).sum(axis=1)
+        return cls._scale_weight(vwgt)
 
 
 class BlockJSONEncoder(json.JSONEncoder):
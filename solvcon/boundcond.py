@@ -439,6 +439,18 @@ class interface(BC):
         assert (self.rclp[:,1]>=0).all()
         assert (self.rclp[:,2]>=0).all()
 
+    def create_copy(self):
+        """
+        :return: An object set up to scatter the received data into the ghost
+            cells and to gather the data of the cells next to the interface
+            for the related block.
+        :rtype: :py:class:`solvcon.mesh.Bound`
+        """
+        ngstcell = self.blk.ngstcell
+        bcd = self.create_bcd()
+        bcd.setup_copy(self.rclp[:,0]+ngstcell, self.rclp[:,2]+ngstcell)
+        return bcd
+
 class periodic(BC):
     """
     BC type for periodic boundary condition.
@@ -450,12 +462,28 @@ class periodic(BC):
         self.rblkn = getattr(self, 'rblkn', -1)
         self.rblkinfo = empty(6, dtype='int32')
         self.rclp = empty((0,3), dtype='int32')
+        #: Matrix rotating vectors from the related cells to the ghost cells
+        #: for rotational periodicity; ``None`` for translational.
+        self.rotation = getattr(self, 'rotation', None)
 
     def cloneTo(self, another):
         super(periodic, self).cloneTo(another)
         another.rblkn = self.rblkn
         another.rblkinfo = self.rblkinfo.copy()
         another.rclp = self.rclp.copy()
+        another.rotation = self.rotation
+
+    def create_copy(self):
+        """
+        :return: An object set up to copy the related cells to the ghost
+            cells, with :py:attr:`rotation`.
+        :rtype: :py:class:`solvcon.mesh.Bound`
+        """
+        ngstcell = self.blk.ngstcell
+        bcd = self.create_bcd()
+        bcd.setup_copy(self.rclp[:,0]+ngstcell, self.rclp[:,1]+ngstcell,
+                       rotation=self.rotation)
+        return bcd
 
     def sort(self, ref):
         if ref is None:
@@ -43,6 +43,8 @@ from .py3kcompat import pickle
 import time
 import gzip
 
+import numpy as np
+
 from . import hook
 from . import anchor
 from . import helper
@@ -231,8 +233,18 @@ class MeshHookList(list):
         runhooks = self
         if method == 'postloop':
             runhooks = reversed(runhooks)
-        for hook in runhooks:
-            getattr(hook, method)()
+        tracer = self.cse.tracer
+        for hok in runhooks:
+            func = getattr(hok, method)
+            # the no-op methods of the base class are not recorded.
+            if tracer is None or getattr(func, '__func__', None) is \
+               hook.MeshHook.__dict__.get(method):
+                func()
+            else:
+                t0 = time.time()
+                func()
+                tracer.add('%s.%s' % (type(hok).__name__, method), 'hook',
+                           t0, time.time())
 
     def drop_anchor(self, svr):
         for hok in self:
@@ -248,6 +260,13 @@ class MeshCase(case_core.CaseInfo):
         # execution related.
         'execution.fpdtype': 'float64',
         'execution.npart': None,    # number of decomposed blocks.
+        'execution.nsplitthread': 1,    # number of threads to split domain.
+        'execution.vwgt': None, # cell weights (or .npy file) for splitting.
+        'execution.adjwgt': None,   # edge weights for splitting.
+        'execution.partmethod': 'kway', # kway, recursive, or auto.
+        'execution.launch_threads': 8,  # concurrent remote worker launches.
+        'execution.launch_retries': 2,  # retries of a launch or connection.
+        'execution.threaded': False,    # run local workers in threads.
         'execution.stop': False,
         'execution.time': 0.0,
         'execution.time_increment': 0.0,
@@ -265,6 +284,7 @@ class MeshCase(case_core.CaseInfo):
         'io.domain.with_whole': True,
         'io.domain.wholefn': None,
         'io.domain.splitfns': None,
+        'io.domain.scratchdir': None,   # ship sub-blocks through files.
         'io.abspath': False,    # flag to use abspath or not.
         'io.rootdir': None,
         'io.basedir': None,
@@ -308,6 +328,10 @@ class MeshCase(case_core.CaseInfo):
             os.makedirs(self.io.basedir)
         # message logger.
         self.info = helper.Information()
+        #: A :py:class:`solvcon.gendata.SpanRecorder` to record the actions
+        #: of the case and the hooks.  ``None`` (default) disables the
+        #: recording.  See :py:class:`solvcon.hook.TraceHook`.
+        self.tracer = None
 
     def _log_start(self, action, msg='', postmsg=' ... '):
         """
@@ -345,6 +369,8 @@ class MeshCase(case_core.CaseInfo):
         tarr = self.log.time.setdefault(action, [0,0,0])
         tarr[1] = time.time()
         tarr[2] = tarr[1] - tarr[0]
+        if self.tracer is not None:
+            self.tracer.add(action, 'case', tarr[0], tarr[1])
         # footer.
         prefix = info.prefix * (info.width-info.level*info.nchar)
         info(prefix + '\nEnd %s%s%sElapsed time (sec) = %g' % (
@@ -468,10 +494,18 @@ class MeshCase(case_core.CaseInfo):
             if level != 1 and not self.solver.domainobj.presplit:
                 self.info('\n')
                 self._log_start('split_domain')
+                vwgt = self.execution.vwgt
+                if isinstance(vwgt, str):
+                    vwgt = np.load(vwgt)
                 self.solver.domainobj.split(
                     nblk=self.execution.npart,
-                    interface_type=boundcond.interface)
+                    interface_type=boundcond.interface,
+                    nthread=self.execution.nsplitthread, vwgt=vwgt,
+                    adjwgt=self.execution.adjwgt,
+                    method=self.execution.partmethod)
                 self._log_end('split_domain')
+                self.info('%s\n' % (
+                    self.solver.domainobj.format_interface_stats()))
             # make dealer and create workers for the dealer.
             self.info('\n')
             self._log_start('build_dealer')
@@ -621,6 +655,72 @@ class MeshCase(case_core.CaseInfo):
         self.runhooks.drop_anchor(svr)
         svr.init()
         self.solver.solverobj = svr
+    def _save_scratch_blocks(self):
+        """
+        Write the sub-blocks into a new directory under
+        ``io.domain.scratchdir`` with ``execution.nsplitthread`` threads, for
+        the workers to load them instead of receiving pickled solvers.  The
+        directory must be visible to the workers, e.g., a shared file system,
+        or ``/dev/shm`` when the workers run on the same node.
+
+        @return: the directory, the file name of each sub-block, and the BC
+            mapper of each sub-block.  The file name and the BC mapper are
+            None for a sub-block whose BCs cannot be restored by name.
+        @rtype: str, list, list
+        """
+        import tempfile
+        dom = self.solver.domainobj
+        prefix = '%s_blocks_' % os.path.basename(self.io.basefn or 'solvcon')
+        dirname = tempfile.mkdtemp(prefix=prefix,
+            dir=self.io.domain.scratchdir)
+        dio = iodomain.DomainIO(dirname=dirname)
+        bcmaps = [self._make_scratch_bcmap(sbk) for sbk in dom]
+        blkfns = [None] * dom.nblk
+        def save(iblk):
+            if bcmaps[iblk] is not None:
+                blkfns[iblk] = dio.save_block(dom[iblk], iblk=iblk)
+        domain.run_threaded(save, dom.nblk, self.execution.nsplitthread)
+        return dirname, blkfns, bcmaps
+    @staticmethod
+    def _make_scratch_bcmap(blk):
+        """
+        Make the BC mapper that restores the types and values of the BCs of
+        the block after it is loaded from a file, which keeps only the names.
+
+        >>> import tempfile, shutil
+        >>> from solvcon.testing import create_trivial_2d_blk
+        >>> blk = create_trivial_2d_blk()
+        >>> bcmap = MeshCase._make_scratch_bcmap(blk)
+        >>> dirname = tempfile.mkdtemp()
+        >>> dio = iodomain.DomainIO(dirname=dirname)
+        >>> blkfn = dio.save_block(blk)
+        >>> loaded = dio.load_block(blkid=0, bcmapper=bcmap, blkfn=blkfn)
+        >>> [type(bc).__name__ for bc in loaded.bclist]
+        ['unspecified']
+        >>> shutil.rmtree(dirname)
+
+        @param blk: the block to be saved.
+        @type blk: solvcon.block.Block
+        @return: the BC mapper, or None if it cannot be made, i.e., for
+            periodic BCs or values varying over faces.
+        @rtype: dict
+        """
+        bcmap = dict()
+        for bc in blk.bclist:
+            if isinstance(bc, boundcond.interface):
+                continue    # interfaces are loaded as they are.
+            if isinstance(bc, boundcond.periodic) or bc.name in bcmap:
+                return None
+            value = bc.value
+            if value.shape[1] != len(bc.vnames):
+                return None
+            vdict = dict()
+            if len(value):
+                if (value != value[0]).any():
+                    return None
+                vdict = dict(zip(bc.vnames, value[0]))
+            bcmap[bc.name] = (type(bc), vdict)
+        return bcmap
     def _remote_init_solver(self):
         """
         @return: nothing
@@ -629,6 +729,12 @@ class MeshCase(case_core.CaseInfo):
         solvertype = self.solver.solvertype
         dom = self.solver.domainobj
         nblk = dom.nblk
+        scratch = None
+        if (not dom.presplit and not self.execution.threaded and
+            self.io.domain.scratchdir is not None):
+            self._log_start('save_scratch_blocks')
+            scratch, blkfns, bcmaps = self._save_scratch_blocks()
+            self._log_end('save_scratch_blocks')
         for iblk in range(nblk):
             svrkw = self.make_solver_keywords()
             self.info('solver #%d/(%d-1): ' % (iblk, nblk))
@@ -637,6 +743,11 @@ class MeshCase(case_core.CaseInfo):
                     self.io.meshfn, self.io.domain.splitfn[iblk],
                     iblk, nblk, solvertype, svrkw)
                 self.runhooks.drop_anchor(dealer[iblk])
+            elif scratch is not None and blkfns[iblk] is not None:
+                self.info('loading ... ')
+                dealer[iblk].create_solver(bcmaps[iblk], scratch,
+                    blkfns[iblk], iblk, nblk, solvertype, svrkw)
+                self.runhooks.drop_anchor(dealer[iblk])
             else:
                 sbk = dom[iblk]
                 svr = solvertype(sbk, **svrkw)
@@ -649,6 +760,9 @@ class MeshCase(case_core.CaseInfo):
         self.info('Bind/Init ... ')
         for sdw in dealer: sdw.cmd.init()
         dealer.barrier()
+        if scratch is not None:
+            import shutil
+            shutil.rmtree(scratch)
         self.info('done.\n')
     def _remote_load_solver(self):
         """
@@ -673,7 +787,10 @@ class MeshCase(case_core.CaseInfo):
         flag_parallel = self.is_parallel
         if flag_parallel == 1:
             family = None
-            create_workers = self._create_workers_local
+            if self.execution.threaded:
+                create_workers = self._create_workers_thread
+            else:
+                create_workers = self._create_workers_local
         elif flag_parallel == 2:
             family = 'AF_INET'
             create_workers = self._create_workers_remote
@@ -700,7 +817,12 @@ class MeshCase(case_core.CaseInfo):
                 None,
                 profiler_data=self._get_profiler_data(iblk),
                 debug=debug))
+    def _create_workers_thread(self, dealer, nblk):
+        for iblk in range(nblk):
+            dealer.hire_thread(rpc.Worker(
+                None, profiler_data=self._get_profiler_data(iblk)))
     def _create_workers_remote(self, dealer, nblk):
+        from threading import Lock
         info = self.info
         authkey = rpc.DEFAULT_AUTHKEY
         paths = dict([
@@ -719,16 +841,29 @@ class MeshCase(case_core.CaseInfo):
         if conf.env.mpi:
             info(' (head excluded for MPI)')
         info(':\n')
-        iworker = 0 
-        for node in nodelist:
-            info('  %s' % node.name)
-            port = bat.create_worker(node, authkey,
-                envar=self.solver.envar, paths=paths,
-                profiler_data=self._get_profiler_data(iworker))
-            info(' worker #%d created' % iworker)
-            dealer.appoint(node.address, port, authkey)
-            info(' and appointed.\n')
-            iworker += 1
+        # workers are created and appointed concurrently, but are kept in the
+        # order of the nodes.
+        create_lock = Lock()
+        def launch(iworker):
+            node = nodelist[iworker]
+            kw = dict(envar=self.solver.envar, paths=paths,
+                      profiler_data=self._get_profiler_data(iworker))
+            if bat.create_concurrently:
+                port = bat.create_worker(node, authkey, **kw)
+            else:
+                with create_lock:
+                    port = bat.create_worker(node, authkey, **kw)
+            return node.address, port
+        arrived = list()
+        def notify(iworker, address, nattempt):
+            arrived.append(iworker)
+            info('  %s worker #%d appointed (%d/%d)%s.\n' % (
+                nodelist[iworker].name, iworker, len(arrived), len(nodelist),
+                '' if nattempt == 1 else ' after %d attempts' % nattempt))
+        dealer.appoint_all(launch, len(nodelist), authkey,
+                           nthread=self.execution.launch_threads,
+                           retries=self.execution.launch_retries,
+                           notify=notify)
         if len(dealer) != nblk:
             raise IndexError('%d != %d' % (len(dealer), nblk))
         # create remote killer script.
@@ -787,7 +922,7 @@ for node in $nodes; do rsh $node killall %s; done
             # print.
             self.info(('%%0%dd ->' % dwidth) % iblk)
             for pair in ifacelist:
-                if pair < 0:
+                if isinstance(pair, float) and pair < 0:
                     stab = '-' * (2*dwidth+1)
                 else:
                     stab = '-'.join([('%%0%dd'%dwidth)%item for item in pair])
@@ -836,6 +971,10 @@ for node in $nodes; do rsh $node killall %s; done
         """
         self._log_start('run')
         self.execution.step_current = self.execution.step_init
+        # a restart without a restored time resumes from the initial step.
+        if self.execution.step_init and not self.execution.time:
+            self.execution.time = (self.execution.step_init
+                                   * self.execution.time_increment)
         if level < 1:
             self._run_provide()
             self._run_preloop()
@@ -891,7 +1030,7 @@ for node in $nodes; do rsh $node killall %s; done
             solver_march_marker = time.time()
             steps_stride = self.execution.steps_stride
             time_increment = self.execution.time_increment
-            time_current = self.execution.step_current*time_increment
+            time_current = self.execution.time
             if flag_parallel:
                 for sdw in dealer: sdw.cmd.march(
                     time_current, time_increment, steps_stride,
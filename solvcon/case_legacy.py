@@ -768,7 +768,7 @@ for node in $nodes; do rsh $node killall %s; done
             # print.
             self.info(('%%0%dd ->' % dwidth) % iblk)
             for pair in ifacelist:
-                if pair < 0:
+                if isinstance(pair, float) and pair < 0:
                     stab = '-' * (2*dwidth+1)
                 else:
                     stab = '-'.join([('%%0%dd'%dwidth)%item for item in pair])
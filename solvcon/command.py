@@ -43,9 +43,6 @@ import optparse
 import socket
 import errno
 
-import boto.ec2
-
-from . import cloud
 from . import helper
 
 from .cmdutil import Command
@@ -90,6 +87,7 @@ class Aws(Command):
         """
         Retrieve settings from :py:class:`AwsHostSetting`.
         """
+        from . import cloud
         def update_kws(dct, src):
             for key in dct:
                 value = getattr(src, key, "")
@@ -115,6 +113,7 @@ class Aws(Command):
 
     @staticmethod
     def run_script(host, name):
+        from . import cloud
         if os.path.isfile(name):
             with open(name) as stream:
                 exec(stream.read())
@@ -160,6 +159,7 @@ class alaunch(Aws):
 
     @staticmethod
     def launch_instance(ops, operator):
+        import boto.ec2
         region = operator.region
         ami = operator.ami
         instkws = dict((key, getattr(operator, key)) for key in 
@@ -188,6 +188,7 @@ class alaunch(Aws):
         return instance
 
     def __call__(self):
+        from . import cloud
         ops, args = self.opargs
 
         operator = self.determine_operator(ops)
@@ -237,6 +238,8 @@ class arun(Aws):
         self.opg_aws_run = opg
 
     def __call__(self):
+        import boto.ec2
+        from . import cloud
         ops, args = self.opargs
         operator = self.determine_operator(ops)
 
@@ -269,6 +272,7 @@ class alist(Aws):
         self.opg_aws_list = opg
 
     def __call__(self):
+        import boto.ec2
         ops, args = self.opargs
         if not ops.region:
             raise ValueError("region is empty")
@@ -320,6 +324,7 @@ class astop(Aws):
         self.opg_aws_stop = opg
 
     def __call__(self):
+        import boto.ec2
         ops, args = self.opargs
 
         conn = boto.ec2.connect_to_region(
@@ -358,6 +363,7 @@ class aterminate(Aws):
         self.opg_aws_stop = opg
 
     def __call__(self):
+        import boto.ec2
         ops, args = self.opargs
 
         conn = boto.ec2.connect_to_region(
@@ -473,6 +479,35 @@ class mesh(Command):
             dest='split', default=None,
             help='Split the loaded block into given number of parts.',
         )
+        opg.add_option('--split-streaming', action='store_true',
+            dest='split_streaming', default=False,
+            help='Write split blocks one by one without holding all of them '
+                 'in memory.',
+        )
+        opg.add_option('--weight', action='store', type='string',
+            dest='weight', default='',
+            help='A .npy file of cell weights for balancing the split, e.g., '
+                 'the one written by LoadBalanceHook.',
+        )
+        opg.add_option('--adjwgt', action='store', type='string',
+            dest='adjwgt', default=None,
+            help='Weigh the graph edges for the split; "area" uses the face '
+                 'areas.',
+        )
+        opg.add_option('--partition-method', action='store', type='string',
+            dest='partition_method', default='kway',
+            help='kway (default), recursive, or auto.',
+        )
+        opg.add_option('--budget', action='store', type='string',
+            dest='budget', default='',
+            help='Estimate the memory of a worker for the comma-separated '
+                 'numbers of parts, e.g., 4,8,16.',
+        )
+        opg.add_option('--budget-parcel', action='store', type='string',
+            dest='budget_parcel', default='',
+            help='Include the solver arrays of the parcel (gas, bulk, '
+                 'linear, or vewave) in the budget.',
+        )
         opg.add_option('--bc-reject', action='store', type='string',
             dest='bc_reject', default='',
             help='The BC (name) to be rejected in conversion.',
@@ -502,6 +537,7 @@ class mesh(Command):
     def _save_domain(ops, blk, dirname):
         import os
         from time import time
+        from numpy import load
         from .domain import Collective
         from .io.domain import DomainIO
         from .helper import info
@@ -509,10 +545,22 @@ class mesh(Command):
         timer = time()
         dom = Collective(blk)
         info('done. (%gs)\n' % (time()-timer))
+        vwgt = load(ops.weight) if ops.weight else None
         info('Partition graph into %d parts ... ' % ops.split)
         timer = time()
-        dom.partition(ops.split)
+        dom.partition(ops.split, vwgt=vwgt, adjwgt=ops.adjwgt,
+                      method=ops.partition_method)
         info('done. (%gs)\n' % (time()-timer))
+        info('%s\n' % dom.format_interface_stats())
+        if ops.split_streaming:
+            dio = DomainIO(dom=dom, compressor=ops.compressor)
+            if not os.path.exists(dirname):
+                os.makedirs(dirname)
+            info('Split and save to directory %s/ ... ' % dirname)
+            timer = time()
+            dio.save_split(dirname=dirname)
+            info('done. (%gs)\n' % (time()-timer))
+            return
         info('Split step 1/5: distribute into sub-domains ... ')
         timer = time()
         dom.distribute()
@@ -579,6 +627,24 @@ class mesh(Command):
         writer.save(htmlfn)
         info('done. (%gs)\n' % (time.time()-timer))
     @staticmethod
+    def _show_budget(ops, blk):
+        from .memory import MIB, estimate, solver_row_bytes
+        from .helper import info
+        solver_row = (0.0, 0.0)
+        if ops.budget_parcel:
+            from .bench import BENCHES
+            shape = 'quad' if blk.ndim == 2 else 'hex'
+            bench = BENCHES[ops.budget_parcel](shape, 2)
+            solver_row = solver_row_bytes(bench.create_solver, blk.ndim)
+        info('Memory budget per worker (MiB):\n')
+        info('  %6s %10s %10s %10s %10s %10s\n' % (
+            'npart', 'ncell', 'ngstcell', 'block', 'solver', 'total'))
+        for npart in [int(tok) for tok in ops.budget.split(',')]:
+            est = estimate(blk, npart, solver_row=solver_row)
+            info('  %6d %10d %10d %10.4g %10.4g %10.4g\n' % (
+                npart, est['ncell'], est['ngstcell'], est['block']/MIB,
+                est['solver']/MIB, (est['block']+est['solver'])/MIB))
+    @staticmethod
     def _determine_formats(ops, args):
         """
         Determine I/O formats based on arguments.
@@ -651,6 +717,9 @@ class mesh(Command):
                 blk.clvol.min(), blk.clvol.max(), blk.clvol.sum()))
             info('  Dx for CFL is ~0.5(min(cvol)^(1/ndim)): %e.\n' % (
                 0.5*blk.clvol.min()**(1.0/blk.ndim), ))
+        # estimate memory.
+        if ops.budget:
+            self._show_budget(ops, blk)
         # save.
         if oio is not None:
             path = args[1]
@@ -669,6 +738,153 @@ class mesh(Command):
             elif oio == 'HtmlIO':
                 self._save_html(ops, blk, path)
 
+class bench(Command):
+    """
+    Benchmark the marching kernels of the parcels on synthetic meshes.
+    """
+
+    min_args = 0
+
+    def __init__(self, env):
+        from optparse import OptionGroup
+        super(bench, self).__init__(env)
+        op = self.op
+
+        opg = OptionGroup(op, 'Bench')
+        opg.add_option('--parcels', action='store', type='string',
+            dest='parcels', default='gas,bulk,linear,vewave',
+            help='Parcels to benchmark; comma separated.',
+        )
+        opg.add_option('--shapes', action='store', type='string',
+            dest='shapes', default='tri,quad,tet,hex',
+            help='Cell shapes of the meshes; comma separated.',
+        )
+        opg.add_option('--sizes', action='store', type='string',
+            dest='sizes', default='32',
+            help='Numbers of cells along each axis; comma separated.',
+        )
+        opg.add_option('--threads', action='store', type='string',
+            dest='threads', default='1',
+            help='Numbers of OpenMP threads; comma separated.',
+        )
+        opg.add_option('--repeat', action='store', type='int',
+            dest='repeat', default=10,
+            help='Number of timed invocations of each kernel.',
+        )
+        opg.add_option('-o', '--output', action='store', type='string',
+            dest='output', default=None,
+            help='Write records to the file; CSV if the name ends with .csv '
+                 'and JSON otherwise.',
+        )
+        op.add_option_group(opg)
+        self.opg_arrangement = opg
+
+    def __call__(self):
+        import os, sys, json, subprocess
+        from .bench import FIELDS
+        ops, args = self.opargs
+        kw = dict(
+            parcels=ops.parcels.split(','),
+            shapes=ops.shapes.split(','),
+            sizes=[int(val) for val in ops.sizes.split(',')],
+            repeat=ops.repeat,
+        )
+        # OpenMP reads the number of threads at start-up.
+        records = []
+        for nthread in ops.threads.split(','):
+            env = os.environ.copy()
+            env['OMP_NUM_THREADS'] = nthread
+            out = subprocess.check_output(
+                [sys.executable, '-m', 'solvcon.bench', json.dumps(kw)],
+                env=env)
+            records.extend(json.loads(out.decode()))
+        # output.
+        if ops.output is None:
+            tmpl = '%-6s %-4s %4s %8s %3s %-10s %12.6e %8.3f\n'
+            for rec in records:
+                sys.stdout.write(tmpl % (
+                    rec['parcel'], rec['shape'], rec['size'], rec['ncell'],
+                    rec['nthread'], rec['kernel'], rec['best'],
+                    rec['mcps'] or 0.0))
+        elif ops.output.endswith('.csv'):
+            import csv
+            with open(ops.output, 'w') as fobj:
+                writer = csv.DictWriter(fobj, FIELDS)
+                writer.writeheader()
+                writer.writerows(records)
+        else:
+            with open(ops.output, 'w') as fobj:
+                json.dump(records, fobj, indent=1)
+
+class scaling(Command):
+    """
+    Run a parallel case with growing numbers of workers and report the time
+    and parallel efficiency of each phase.
+    """
+
+    min_args = 0
+
+    def __init__(self, env):
+        from optparse import OptionGroup
+        super(scaling, self).__init__(env)
+        op = self.op
+
+        opg = OptionGroup(op, 'Scaling')
+        opg.add_option('--mode', action='store', type='string',
+            dest='mode', default='strong',
+            help='strong (default) or weak.',
+        )
+        opg.add_option('--workers', action='store', type='string',
+            dest='workers', default='1,2,4',
+            help='Numbers of local workers; comma separated.',
+        )
+        opg.add_option('--shape', action='store', type='string',
+            dest='shape', default='quad',
+            help='Cell shape of the mesh (tri, quad, tet, or hex).',
+        )
+        opg.add_option('--size', action='store', type='int',
+            dest='size', default=64,
+            help='Number of cells along each axis for the fewest workers.',
+        )
+        opg.add_option('--steps', action='store', type='int',
+            dest='steps', default=20,
+            help='Number of time steps to run.',
+        )
+        opg.add_option('--basedir', action='store', type='string',
+            dest='basedir', default=None,
+            help='Directory for the output of the cases.',
+        )
+        opg.add_option('--tag', action='store', type='string',
+            dest='tag', default='',
+            help='Label of the records, e.g., the revision under test.',
+        )
+        opg.add_option('--history', action='store', type='string',
+            dest='history', default=None,
+            help='Append records to the file; CSV if the name ends with .csv '
+                 'and JSON otherwise.',
+        )
+        op.add_option_group(opg)
+        self.opg_arrangement = opg
+
+    def __call__(self):
+        import sys
+        from .scaling import ScalingHarness, append_history
+        ops, args = self.opargs
+        harness = ScalingHarness(mode=ops.mode,
+            nworkers=[int(val) for val in ops.workers.split(',')],
+            shape=ops.shape, size=ops.size, steps=ops.steps,
+            basedir=ops.basedir, tag=ops.tag)
+        records = harness()
+        sys.stdout.write('%8s %10s %-12s %12s %10s\n' % (
+            'nworker', 'ncell', 'phase', 'time', 'efficiency'))
+        for rec in records:
+            eff = rec['efficiency']
+            sys.stdout.write('%8d %10d %-12s %12.4g %10s\n' % (
+                rec['nworker'], rec['ncell'], rec['phase'], rec['time'],
+                '-' if eff is None else '%.3f' % eff))
+        if ops.history:
+            append_history(records, ops.history)
+
 class SolverLog(Command):
     """
     Actions related Solver log.
@@ -175,6 +175,65 @@ class MPIConnection(object):
         from .conf import env
         env.mpi.recvarr(arr, self.dst, self.TAG)
 
+class ThreadConnection(object):
+    """
+    One end of a connection between two threads of the same process, made by
+    :py:func:`ThreadPipe`.  Objects are handed over without serialization, so
+    that, e.g., a solver object can be set to a threaded worker.  Arrays sent
+    by :py:meth:`send` are copied as a pipe would do, while the array sent by
+    :py:meth:`sendarr` is directly copied into the receiving array and must
+    not be modified by the sender afterward.
+
+    >>> conn0, conn1 = ThreadPipe()
+    >>> conn0.send({'a': 1})
+    >>> conn1.recv()
+    {'a': 1}
+    >>> import numpy as np
+    >>> arr = np.arange(3.0)
+    >>> conn1.sendarr(arr * 2)
+    >>> conn0.recvarr(arr)
+    >>> arr.tolist()
+    [0.0, 2.0, 4.0]
+    >>> conn1.close()
+    >>> conn0.recv()
+    Traceback (most recent call last):
+        ...
+    EOFError
+    """
+    #: Sent by :py:meth:`close` to signal the end of the connection.
+    CLOSED = object()
+    def __init__(self, inbox, outbox):
+        self.inbox = inbox
+        self.outbox = outbox
+    def send(self, dat):
+        import numpy as np
+        if isinstance(dat, np.ndarray):
+            dat = dat.copy()
+        self.outbox.put(dat)
+    def recv(self):
+        dat = self.inbox.get()
+        if dat is self.CLOSED:
+            # let other readers of the inbox see it too.
+            self.inbox.put(dat)
+            raise EOFError
+        return dat
+    def sendarr(self, arr):
+        self.outbox.put(arr)
+    def recvarr(self, arr):
+        arr[...] = self.recv()
+    def close(self):
+        self.outbox.put(self.CLOSED)
+
+def ThreadPipe():
+    """
+    Make a pair of connected :py:class:`ThreadConnection` objects.
+    """
+    from six.moves.queue import Queue
+    queue0 = Queue()
+    queue1 = Queue()
+    return (ThreadConnection(inbox=queue0, outbox=queue1),
+            ThreadConnection(inbox=queue1, outbox=queue0))
+
 CLIENT_TIMEOUT = 20.
 def Client(address, family=None, authkey=None):
     """
@@ -39,6 +39,52 @@ from __future__ import absolute_import, division, print_function
 __all__ = ['Domain', 'Collective', 'Distributed']
 
 
+#: Default bound of the number of threads that L{run_threaded} starts.
+MAX_THREADS = 8
+
+def run_threaded(func, nitem, nthread=MAX_THREADS):
+    """
+    Call func(iitem) for iitem in range(nitem) with at most nthread threads.
+    The items are dealt to the threads in a round-robin way.  The first
+    exception raised in any thread is re-raised after all threads finish.
+
+    >>> items = [None] * 5
+    >>> def work(iitem):
+    ...     items[iitem] = iitem * 2
+    >>> run_threaded(work, len(items), nthread=2)
+    >>> items
+    [0, 2, 4, 6, 8]
+
+    @param func: callable taking the index of the item.
+    @type func: callable
+    @param nitem: number of items.
+    @type nitem: int
+    @keyword nthread: maximum number of threads.
+    @type nthread: int
+    @return: nothing
+    """
+    from threading import Thread
+    nthread = min(nthread, nitem)
+    if nthread <= 1:
+        for iitem in range(nitem):
+            func(iitem)
+        return
+    errors = list()
+    def run(ithread):
+        try:
+            for iitem in range(ithread, nitem, nthread):
+                func(iitem)
+        except Exception as e:
+            errors.append(e)
+    threads = [Thread(target=run, args=(it,)) for it in range(nthread)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
 class Domain(object):
     """
     Abstraction of computation domain.  It is the most basic domain that holds
@@ -166,39 +212,50 @@ class Collective(Domain, list):
         """
         return (len(self) == 0) and (len(self.idxinfo) != 0)
 
-    def partition(self, nblk):
+    def partition(self, nblk, vwgt=None, adjwgt=None, method='kway'):
         """
         Partition the whole block into sub-blocks and put information into
         self.edgecut, self.part, self.idxinfo and self.mappers.
 
         @param nblk: number of sub-blocks to be partitioned.
         @type nblk: int
+        @keyword vwgt: integer weight of each cell for balancing the
+            sub-blocks; None balances the number of cells.  See
+            solvcon.block.Block.partition for the other choices.
+        @type vwgt: numpy.ndarray
+        @keyword adjwgt: weight of the graph edges, or "area"; see
+            solvcon.block.Block.partition.
+        @type adjwgt: numpy.ndarray or str
+        @keyword method: "kway", "recursive", or "auto".
+        @type method: str
         """
-        from numpy import empty, arange, unique, zeros
+        from numpy import empty, arange, bincount
         blk = self.blk
         # call partitioner.
         #edgecut, part = Partitioner(blk)(nblk)
-        edgecut, part = blk.partition(nblk)
+        edgecut, part = blk.partition(nblk, vwgt=vwgt, adjwgt=adjwgt,
+                                      method=method)
         self.edgecut = edgecut
         self.part = part
-        # numbering.
-        clidx = arange(blk.ncell, dtype='int32')
+        # numbering.  Sort cells, and then (block, face) and (block, node)
+        # pairs, by block, so that all sub-blocks are sliced out of the same
+        # sorted arrays.
+        mycls_all = part.argsort(kind='mergesort').astype('int32')
+        clbnd = part[mycls_all].searchsorted(arange(nblk+1))
+        fcblk, myfcs_all = self._sort_by_block(part, blk.clfcs[:,1:])
+        fcbnd = fcblk.searchsorted(arange(nblk+1))
+        ndblk, mynds_all = self._sort_by_block(part, blk.clnds[:,1:])
+        ndbnd = ndblk.searchsorted(arange(nblk+1))
         idxinfo = list()
         for iblk in range(nblk):
-            mycls = clidx[part==iblk]
-            myfcs = unique(blk.clfcs[mycls,1:].flatten())
-            myfcs = myfcs[myfcs>-1]
-            myfcs.sort()
-            mynds = unique(blk.clnds[mycls,1:].flatten())
-            mynds = mynds[mynds>-1]
-            mynds.sort()
-            idxinfo.append((mynds, myfcs, mycls))
+            idxinfo.append((
+                mynds_all[ndbnd[iblk]:ndbnd[iblk+1]],
+                myfcs_all[fcbnd[iblk]:fcbnd[iblk+1]],
+                mycls_all[clbnd[iblk]:clbnd[iblk+1]],
+            ))
         self.idxinfo = tuple(idxinfo)
         # prepare mappers.
-        ndcnts = zeros(blk.nnode, dtype='int32')
-        for mynds, myfcs, mycls in self.idxinfo:
-            ndcnts[mynds] += 1
-        ndmblk = ndcnts.max()
+        ndmblk = bincount(mynds_all, minlength=blk.nnode).max()
         ndmaps = empty((blk.nnode, 1+2*ndmblk), dtype='int32')
         fcmaps = empty((blk.nface, 5), dtype='int32')
         clmaps = empty((blk.ncell, 2), dtype='int32')
@@ -209,87 +266,166 @@ class Collective(Domain, list):
         clmaps.fill(-1)
         self.mappers = (ndmaps, fcmaps, clmaps)
 
-    def distribute(self):
+    def interface_stats(self):
+        """
+        Count the interface faces and the neighboring sub-blocks of each
+        sub-block from the partition, i.e., what has to be exchanged.
+
+        @return: the number of interface faces and the number of neighboring
+            sub-blocks, for each sub-block.
+        @rtype: tuple of numpy.ndarray
+        """
+        from numpy import bincount, unique, minimum, maximum
+        nblk = self.nblk
+        fccls = self.blk.fccls
+        fccls = fccls[fccls[:,1]>=0]
+        part0 = self.part[fccls[:,0]]
+        part1 = self.part[fccls[:,1]]
+        cut = part0 != part1
+        part0 = part0[cut]
+        part1 = part1[cut]
+        nifc = bincount(part0, minlength=nblk) + bincount(part1, minlength=nblk)
+        pairs = unique(minimum(part0, part1).astype('int64') * nblk
+                       + maximum(part0, part1))
+        nnbr = bincount(pairs // nblk, minlength=nblk) \
+             + bincount(pairs % nblk, minlength=nblk)
+        return nifc, nnbr
+
+    def format_interface_stats(self):
+        """
+        @return: a one-line summary of the edgecut and
+            :py:meth:`interface_stats`.
+        @rtype: str
+        """
+        nifc, nnbr = self.interface_stats()
+        return ('edgecut %d, interface faces per block %d-%d (total %d), '
+                'max neighbors %d' % (self.edgecut, nifc.min(), nifc.max(),
+                                      nifc.sum()//2, nnbr.max()))
+
+    @staticmethod
+    def _sort_by_block(part, conn):
+        """
+        Collect the unique (block, entity) pairs from the connectivity array
+        *conn* (padded with -1) of the cells distributed by *part*.
+
+        @return: the block indices and the entity indices of the pairs, sorted
+            by block and then by entity.
+        @rtype: tuple of numpy.ndarray
+        """
+        from numpy import unique
+        nent = conn.max() + 1
+        key = part.astype('int64')[:,None] * nent + conn
+        key = unique(key[conn>-1])
+        return (key // nent).astype('int32'), (key % nent).astype('int32')
+
+    def distribute(self, nthread=1):
         """
         Split step 1: Distribute all data from the whole-block to each
         sub-block.
+
+        @keyword nthread: number of threads to create the sub-blocks.
+        @type nthread: int
         """
-        from .block import Block
         del self[:]
-        iblk = 0
-        for mynds, myfcs, mycls in self.idxinfo:
-            blk = Block(ndim=self.blk.ndim,
-                nnode=mynds.shape[0],
-                nface=myfcs.shape[0],
-                ncell=mycls.shape[0],
-                fpdtype=self.blk.fpdtype,
-            )
-            blk.blkn = iblk
-            # names of cell groups.
-            blk.grpnames = self.blk.grpnames    # OK to use a single object.
-            # basic metrics.
-            blk.ndcrd[:,:] = self.blk.ndcrd[mynds,:]
-            # type.
-            blk.fctpn[:] = self.blk.fctpn[myfcs]
-            blk.cltpn[:] = self.blk.cltpn[mycls]
-            blk.clgrp[:] = self.blk.clgrp[mycls]
-            # connectivity.
-            blk.fcnds[:,:] = self.blk.fcnds[myfcs,:]
-            blk.fccls[:,:] = self.blk.fccls[myfcs,:]
-            blk.clnds[:,:] = self.blk.clnds[mycls,:]
-            blk.clfcs[:,:] = self.blk.clfcs[mycls,:]
-            # append.
-            self.append(blk)
-            iblk += 1
+        blks = [None] * len(self.idxinfo)
+        def work(iblk):
+            blks[iblk] = self._distribute_block(iblk)
+        run_threaded(work, len(blks), nthread)
+        # append.
+        self.extend(blks)
+
+    def _distribute_block(self, iblk):
+        """
+        Create the iblk-th sub-block from the whole-block.
+        """
+        from .block import Block
+        mynds, myfcs, mycls = self.idxinfo[iblk]
+        blk = Block(ndim=self.blk.ndim,
+            nnode=mynds.shape[0],
+            nface=myfcs.shape[0],
+            ncell=mycls.shape[0],
+            fpdtype=self.blk.fpdtype,
+        )
+        blk.blkn = iblk
+        # names of cell groups.
+        blk.grpnames = self.blk.grpnames    # OK to use a single object.
+        # basic metrics.
+        blk.ndcrd[:,:] = self.blk.ndcrd[mynds,:]
+        # type.
+        blk.fctpn[:] = self.blk.fctpn[myfcs]
+        blk.cltpn[:] = self.blk.cltpn[mycls]
+        blk.clgrp[:] = self.blk.clgrp[mycls]
+        # connectivity.
+        blk.fcnds[:,:] = self.blk.fcnds[myfcs,:]
+        blk.fccls[:,:] = self.blk.fccls[myfcs,:]
+        blk.clnds[:,:] = self.blk.clnds[mycls,:]
+        blk.clfcs[:,:] = self.blk.clfcs[mycls,:]
+        return blk
 
     def compute_neighbor_block(self):
         """
         Split step 2: Compute neighboring block information.
         """
-        from numpy import empty, arange
-        part = self.part
-        clmap = empty(self.blk.ncell+1, dtype='int32')
-        clmap.fill(-1)
         iblk = 0
         for blk in self:
-            belong = blk.fccls[:,0]
-            neibor = blk.fccls[:,1]
-            neiblk = blk.fccls[:,2]
-            neibcl = blk.fccls[:,3]
-            mynode, myface, mycell = self.idxinfo[iblk]
-            myfcidx = arange(blk.nface, dtype='int32')
-            # Set cell map for whole-indices -> sub-indeces for each sub-block.
-            clmap[mycell] = arange(blk.ncell, dtype='int32')
-            # Swap belong and neibor for whose neighboring cell is not in the
-            # current block.  This action ensures that if the face is connected
-            # with a cell in the current block within either belong or neibor
-            # array in the original whole block, the cell will appear in the
-            # belong array in the sub-block.
-            notmine = myfcidx[part[belong]!=iblk]
-            buf = empty(len(notmine), dtype='int32')
-            buf   [:]       = neibor[notmine]
-            neibor[notmine] = belong[notmine]
-            belong[notmine] = buf   [:]
-            # Find out the faces with the non-ghost neibor which are not in the
-            # current block.  Save neighboring block information (index) into
-            # neiblk.  
-            neiblk.fill(-1) # reset neiblk.
-            notmine = myfcidx[(neibor>=0) & (part[neibor]!=iblk)]
-            neiblk[notmine] = (part[neibor])[notmine]
-            # Move the global indices of the neighboring cells in the
-            # neighboring blocks to neibcl, and then set the corresponding
-            # neibor to be negative.
-            neibcl[notmine] = neibor[notmine]
-            nbnd = (neibor<0).sum()
-            neibor[notmine] = -nbnd-1   # it doesn't matter to be how negative.
+            self._neighbor_block(iblk, blk)
             # next.
             iblk += 1
         # Record maps for cells.
+        return self._make_clmap()
+
+    def _make_clmap(self):
+        """
+        Set cell map for whole-indices -> sub-indeces for all sub-blocks, and
+        record it to the cell mapper.
+
+        @return: the cell map with an additional -1 at the end.
+        @rtype: numpy.ndarray
+        """
+        from numpy import empty, arange
+        clmap = empty(self.blk.ncell+1, dtype='int32')
+        clmap.fill(-1)
+        for mynode, myface, mycell in self.idxinfo:
+            clmap[mycell] = arange(len(mycell), dtype='int32')
         ndmaps, fcmaps, clmaps = self.mappers
         clmaps[:,0] = clmap[:-1]
-        clmaps[:,1] = part[:]
+        clmaps[:,1] = self.part[:]
         return clmap
 
+    def _neighbor_block(self, iblk, blk):
+        """
+        Compute neighboring block information for the iblk-th sub-block.
+        """
+        from numpy import empty, arange
+        part = self.part
+        belong = blk.fccls[:,0]
+        neibor = blk.fccls[:,1]
+        neiblk = blk.fccls[:,2]
+        neibcl = blk.fccls[:,3]
+        myfcidx = arange(blk.nface, dtype='int32')
+        # Swap belong and neibor for whose neighboring cell is not in the
+        # current block.  This action ensures that if the face is connected
+        # with a cell in the current block within either belong or neibor
+        # array in the original whole block, the cell will appear in the
+        # belong array in the sub-block.
+        notmine = myfcidx[part[belong]!=iblk]
+        buf = empty(len(notmine), dtype='int32')
+        buf   [:]       = neibor[notmine]
+        neibor[notmine] = belong[notmine]
+        belong[notmine] = buf   [:]
+        # Find out the faces with the non-ghost neibor which are not in the
+        # current block.  Save neighboring block information (index) into
+        # neiblk.  
+        neiblk.fill(-1) # reset neiblk.
+        notmine = myfcidx[(neibor>=0) & (part[neibor]!=iblk)]
+        neiblk[notmine] = (part[neibor])[notmine]
+        # Move the global indices of the neighboring cells in the
+        # neighboring blocks to neibcl, and then set the corresponding
+        # neibor to be negative.
+        neibcl[notmine] = neibor[notmine]
+        nbnd = (neibor<0).sum()
+        neibor[notmine] = -nbnd-1   # it doesn't matter to be how negative.
+
     @staticmethod
     def _reindex(bemap, idxmap, cond=lambda arr: arr>=0):
         """
@@ -309,65 +445,102 @@ class Collective(Domain, list):
         cls._reindex(bemap, idxmap)
         conn[:,1:] = bemap.reshape((conn.shape[0], conn.shape[1]-1))[:,:]
 
-    def reindex(self, clmap):
+    def reindex(self, clmap, nthread=1):
         """
         Split step 3: Reindex nodes, faces, and cells, and distribute BCs.
+
+        @keyword nthread: number of threads to reindex the sub-blocks.
+        @type nthread: int
         """
-        from numpy import empty, arange
-        ndmaps, fcmaps, clmaps = self.mappers
+        from threading import local
+        # ndmap and fcmap are scratch arrays owned by each thread.
+        scratch = local()
+        def work(iblk):
+            if not hasattr(scratch, 'ndmap'):
+                scratch.ndmap, scratch.fcmap = self._make_scratch_maps()
+            self._reindex_block(iblk, self[iblk], clmap,
+                                scratch.ndmap, scratch.fcmap)
+        run_threaded(work, len(self), nthread)
+        self._record_maps()
+
+    def _make_scratch_maps(self):
+        """
+        @return: node and face maps for :py:meth:`_reindex_block`.
+        @rtype: tuple of numpy.ndarray
+        """
+        from numpy import empty
         ndmap = empty(self.blk.nnode+1, dtype='int32')
         fcmap = empty(self.blk.nface+1, dtype='int32')
+        ndmap.fill(-1)
+        fcmap.fill(-1)
+        return ndmap, fcmap
+
+    def _reindex_block(self, iblk, blk, clmap, ndmap, fcmap):
+        """
+        Reindex nodes, faces, and cells, and distribute BCs for the iblk-th
+        sub-block.  The scratch maps ndmap and fcmap must be filled with -1,
+        and are reset for only the touched entries before returning.
+        """
+        from numpy import empty, arange
+        mynode, myface, mycell = self.idxinfo[iblk]
+        # Build mapping. clmap is reused and needs not to be built here,
+        # because there will be no coincident cells.
+        ndmap[mynode] = arange(blk.nnode, dtype='int32')
+        fcmap[myface] = arange(blk.nface, dtype='int32')
+        # Reindex nodes and faces.
+        self._reindex_conn(blk.fcnds, ndmap)
+        self._reindex_conn(blk.clnds, ndmap)
+        self._reindex_conn(blk.clfcs, fcmap)
+        # Distribute BCs.
+        bcs = list()
+        for oldbc in self.blk.bclist:    # loop over all old BCs.
+            # reindex face indices.
+            fcs = fcmap[oldbc.facn[:,0]]
+            fcs = fcs[fcs>=0]
+            if len(fcs) == 0:   # judge if there are any faces to me?
+                continue    # null BC, skip to process next oldbc.
+            fcs.sort()
+            facn = empty((len(fcs),3), dtype='int32')
+            facn.fill(-1)
+            facn[:,0] = fcs[:]
+            # create new BC object of the same type.
+            bctype = type(oldbc)
+            bc = bctype(fpdtype=oldbc.fpdtype)
+            oldbc.cloneTo(bc)
+            bc.sern = len(bcs)
+            bc.blk  = blk
+            bc.facn = facn
+            bcs.append(bc)
+        blk.bclist = bcs    # set newly created BC list to the block.
+        # Reindex cells.
+        blk.fccls[:,0] = clmap[blk.fccls[:,0]]
+        neibor = blk.fccls[:,1].copy()
+        neibor[neibor<0] = -1
+        want = (blk.fccls[:,2]==-1)
+        blk.fccls[want,1] = clmap[neibor][want]
+        neibcl = blk.fccls[:,3]
+        blk.fccls[:,3] = clmap[neibcl]
+        # reset mapping.
+        ndmap[mynode] = -1
+        fcmap[myface] = -1
+
+    def _record_maps(self):
+        """
+        Record maps for nodes and faces in the order of blocks.  The local
+        index of an entity is its position in the index information.
+        """
+        from numpy import arange
+        ndmaps, fcmaps, clmaps = self.mappers
         iblk = 0
-        for blk in self:
-            mynode, myface, mycell = self.idxinfo[iblk]
-            # Build mapping. clmap is reused and needs not to be built here,
-            # because there will be no coincident cells.
-            ndmap.fill(-1)
-            fcmap.fill(-1)
-            ndmap[mynode] = arange(blk.nnode, dtype='int32')
-            fcmap[myface] = arange(blk.nface, dtype='int32')
-            # Reindex nodes and faces.
-            self._reindex_conn(blk.fcnds, ndmap)
-            self._reindex_conn(blk.clnds, ndmap)
-            self._reindex_conn(blk.clfcs, fcmap)
-            # Record maps for nodes and faces.
+        for mynode, myface, mycell in self.idxinfo:
             locs = ndmaps[mynode,0]
-            ndmaps[mynode,1+locs*2] = ndmap[mynode]
+            ndmaps[mynode,1+locs*2] = arange(len(mynode), dtype='int32')
             ndmaps[mynode,1+locs*2+1] = iblk
             ndmaps[mynode,0] += 1
             locs = fcmaps[myface,0]
-            fcmaps[myface,1+locs*2] = fcmap[myface]
+            fcmaps[myface,1+locs*2] = arange(len(myface), dtype='int32')
             fcmaps[myface,1+locs*2+1] = iblk
             fcmaps[myface,0] += 1
-            # Distribute BCs.
-            bcs = list()
-            for oldbc in self.blk.bclist:    # loop over all old BCs.
-                # reindex face indices.
-                fcs = fcmap[oldbc.facn[:,0]]
-                fcs = fcs[fcs>=0]
-                if len(fcs) == 0:   # judge if there are any faces to me?
-                    continue    # null BC, skip to process next oldbc.
-                fcs.sort()
-                facn = empty((len(fcs),3), dtype='int32')
-                facn.fill(-1)
-                facn[:,0] = fcs[:]
-                # create new BC object of the same type.
-                bctype = type(oldbc)
-                bc = bctype(fpdtype=oldbc.fpdtype)
-                oldbc.cloneTo(bc)
-                bc.sern = len(bcs)
-                bc.blk  = blk
-                bc.facn = facn
-                bcs.append(bc)
-            blk.bclist = bcs    # set newly created BC list to the block.
-            # Reindex cells.
-            blk.fccls[:,0] = clmap[blk.fccls[:,0]]
-            neibor = blk.fccls[:,1].copy()
-            neibor[neibor<0] = -1
-            want = (blk.fccls[:,2]==-1)
-            blk.fccls[want,1] = clmap[neibor][want]
-            neibcl = blk.fccls[:,3]
-            blk.fccls[:,3] = clmap[neibcl]
             # next.
             iblk += 1
 
@@ -375,80 +548,118 @@ class Collective(Domain, list):
         """
         Split step 4: Build interface BC objects.
         """
-        from numpy import empty, arange, array
-        from .boundcond import bctregy
-        if interface_type is None:
-            interface_type = bctregy.interface
-        assert issubclass(interface_type, bctregy.interface)
-        ndmaps, fcmaps, clmaps = self.mappers
+        from numpy import array
+        dupfcs = self._sort_shared_faces()
         ifplist = list()
         iblk = 0
         for blk in self:
-            # setup markers.
-            slct = blk.fccls[:,1] < 0
-            nbound = slct.sum()
-            allfacn = arange(blk.nface, dtype='int32')[slct]
-            specified = empty(nbound, dtype='bool')
-            specified.fill(False)
-            # mark boundary faces associated with a certain BC object.
-            bcs = list()
-            for bc in blk.bclist:
-                slct = allfacn.searchsorted(bc.facn[:,0])
-                specified[slct] = True
-            # get unspecified faces.  If there are no faces left, continue to
-            # the next block since there is nothing to do.
-            leftfcs = allfacn[specified==False]
-            neiblk = blk.fccls[leftfcs,2]
-            if len(leftfcs) == 0:
-                continue
-            # create BC objects for interfaces.
-            for jblk in range(len(self)):
-                # take left faces connecting the current block (indexed with 
-                # jblk).
-                slct = (neiblk==jblk)
-                leftj = leftfcs[slct]
-                if jblk == iblk:
-                    assert len(leftj) == 0
-                if len(leftj) == 0: # nothing to do.
-                    continue
-                # find out faces in the related block.
-                idx1 = min(iblk, jblk)
-                idx2 = max(iblk, jblk)
-                slct = ((fcmaps[:,2] == idx1) & (fcmaps[:,4] == idx2))
-                dupfcs = fcmaps[slct]
-                if jblk > iblk:
-                    rfcs = dupfcs[:,3]
-                else:
-                    rfcs = dupfcs[:,1]
-                # create interface BC object.
-                bc = interface_type()
-                bc.name = "interface_%d_%d" % (iblk, jblk)
-                bc.sern = len(blk.bclist)
-                bc.blk = self[iblk]
-                bc.blkn = iblk
-                bc.rblkn = jblk
-                bc.facn = empty((len(leftj),3), dtype='int32')
-                bc.facn[:,0] = leftj[:] # facn[:,1] set in the next step.
-                bc.facn[:,2] = rfcs[:]
-                blk.bclist.append(bc)
-                # assign to interface list.
-                if iblk < jblk:
-                    ifplist.append((iblk, jblk))
+            ifplist.extend(
+                self._interface_block(iblk, blk, interface_type, dupfcs))
             # next.
             iblk += 1
         self.ifparr = array(ifplist, dtype='int32')
 
-    def supplement(self):
+    def _sort_shared_faces(self):
+        """
+        Sort the faces shared by two blocks with the block pair, so that the
+        faces between a pair are a slice.  The stable sort keeps the faces in
+        the order of the global index.
+
+        @return: the sorted rows of fcmaps and the sorting keys.
+        @rtype: tuple of numpy.ndarray
+        """
+        ndmaps, fcmaps, clmaps = self.mappers
+        nblk = self.nblk
+        dupfcs = fcmaps[fcmaps[:,0] == 2]
+        dupkey = dupfcs[:,2].astype('int64') * nblk + dupfcs[:,4]
+        order = dupkey.argsort(kind='mergesort')
+        return dupfcs[order], dupkey[order]
+
+    def _interface_block(self, iblk, blk, interface_type, dupfcs):
+        """
+        Create the interface BC objects for the iblk-th sub-block.
+
+        @return: the interface pairs (iblk, jblk) with iblk < jblk.
+        @rtype: list
+        """
+        from numpy import empty, arange, unique
+        from .boundcond import bctregy
+        if interface_type is None:
+            interface_type = bctregy.interface
+        assert issubclass(interface_type, bctregy.interface)
+        dupfcs_all, dupkey = dupfcs
+        nblk = self.nblk
+        ifplist = list()
+        # setup markers.
+        slct = blk.fccls[:,1] < 0
+        nbound = slct.sum()
+        allfacn = arange(blk.nface, dtype='int32')[slct]
+        specified = empty(nbound, dtype='bool')
+        specified.fill(False)
+        # mark boundary faces associated with a certain BC object.
+        for bc in blk.bclist:
+            slct = allfacn.searchsorted(bc.facn[:,0])
+            specified[slct] = True
+        # get unspecified faces.  If there are no faces left, return since
+        # there is nothing to do.
+        leftfcs = allfacn[specified==False]
+        neiblk = blk.fccls[leftfcs,2]
+        if len(leftfcs) == 0:
+            return ifplist
+        # create BC objects for interfaces.
+        for jblk in unique(neiblk[neiblk>=0]):
+            jblk = int(jblk)
+            # take left faces connecting the current block (indexed with 
+            # jblk).
+            slct = (neiblk==jblk)
+            leftj = leftfcs[slct]
+            if jblk == iblk:
+                assert len(leftj) == 0
+            if len(leftj) == 0: # nothing to do.
+                continue
+            # find out faces in the related block.
+            idx1 = min(iblk, jblk)
+            idx2 = max(iblk, jblk)
+            key = idx1 * nblk + idx2
+            dupfcs = dupfcs_all[dupkey.searchsorted(key):
+                                dupkey.searchsorted(key, side='right')]
+            if jblk > iblk:
+                rfcs = dupfcs[:,3]
+            else:
+                rfcs = dupfcs[:,1]
+            # create interface BC object.
+            bc = interface_type()
+            bc.name = "interface_%d_%d" % (iblk, jblk)
+            bc.sern = len(blk.bclist)
+            bc.blk = blk
+            bc.blkn = iblk
+            bc.rblkn = jblk
+            bc.facn = empty((len(leftj),3), dtype='int32')
+            bc.facn[:,0] = leftj[:] # facn[:,1] set in the next step.
+            bc.facn[:,2] = rfcs[:]
+            blk.bclist.append(bc)
+            # assign to interface list.
+            if iblk < jblk:
+                ifplist.append((iblk, jblk))
+        return ifplist
+
+    def supplement(self, nthread=1):
         """
         Split step 5: Supplement the rest of the blocks.
+
+        @keyword nthread: number of threads to build the sub-blocks.
+        @type nthread: int
         """
         from numpy import array
         from .boundcond import bctregy
-        for blk in self:
+        def work(iblk):
+            blk = self[iblk]
             blk.calc_metric()
             blk.build_boundary()
             blk.build_ghost()
-        # copy ghost information between interface.
+        run_threaded(work, len(self), nthread)
+        # copy ghost information between interface; all blocks have to be
+        # built.
         for blk in self:
             for bc in blk.bclist:
                 if not isinstance(bc, bctregy.interface):
@@ -471,7 +682,8 @@ class Collective(Domain, list):
             shapes.append(tuple(shape))
         self.shapes = array(shapes, dtype='int32')
 
-    def split(self, nblk=None, interface_type=None):
+    def split(self, nblk=None, interface_type=None, nthread=1, vwgt=None,
+              adjwgt=None, method='kway'):
         """
         Split the whole block according to the partitioning information
         (self.idxinfo) and write to self list ad self.ifplist.
@@ -503,6 +715,15 @@ class Collective(Domain, list):
             of solvcon.boundcond.interface.  Setting it to None will use the
             default solvcon.boundcond.interface.
         @type interface_type: solvcon.boundcond.interface
+        @keyword nthread: number of threads for steps 1, 3, and 5, which are
+            independent for each sub-block.
+        @type nthread: int
+        @keyword vwgt: cell weights passed to :py:meth:`partition`.
+        @type vwgt: numpy.ndarray
+        @keyword adjwgt: edge weights passed to :py:meth:`partition`.
+        @type adjwgt: numpy.ndarray or str
+        @keyword method: partition method passed to :py:meth:`partition`.
+        @type method: str
         @keyword do_all: flag to do all steps.
         @type do_all: bool
 
@@ -510,17 +731,111 @@ class Collective(Domain, list):
         """
         # Step 0: partition the graph built from mesh.
         if isinstance(nblk, int) and self.part is None:
-            self.partition(nblk)
+            self.partition(nblk, vwgt=vwgt, adjwgt=adjwgt, method=method)
         # Step 1: Distribute all data from the whole-block to each sub-block.
-        self.distribute()
+        self.distribute(nthread=nthread)
         # Step 2: Compute neighboring block information.
         clmap = self.compute_neighbor_block()
         # Step 3: Reindex nodes, faces, and cells, and distribute BCs.
-        self.reindex(clmap)
+        self.reindex(clmap, nthread=nthread)
         # Step 4: Build interface BC objects.
         self.build_interface(interface_type)
         # Step 5: Supplement the rest of the blocks.
-        self.supplement()
+        self.supplement(nthread=nthread)
+
+    def iter_split(self, interface_type=None):
+        """
+        Split the whole block like :py:meth:`split` does, but build and yield
+        the sub-blocks one by one without keeping them, so that the sub-blocks
+        don't need to fit in memory at once.  Only the index information and
+        the mappers stay resident.  The partition must be done in advance.
+
+        Each sub-block is built twice.  The first pass collects the shapes,
+        the interface pairs, and the metric of the cells next to interfaces.
+        :py:attr:`shapes` and :py:attr:`ifparr` are set before the first
+        sub-block is yielded.  The second pass builds the ghost information
+        and fills the interfaces with the collected data.
+
+        @keyword interface_type: BC type for the interface.
+        @type interface_type: solvcon.boundcond.interface
+        @return: generator of the sub-blocks in the order of their indices.
+        """
+        from numpy import empty, array, concatenate, where
+        from .boundcond import bctregy
+        assert self.part is not None
+        del self[:]
+        clmap = self._make_clmap()
+        self._record_maps()
+        dupfcs = self._sort_shared_faces()
+        ndmap, fcmap = self._make_scratch_maps()
+        def build(iblk):
+            blk = self._distribute_block(iblk)
+            self._neighbor_block(iblk, blk)
+            self._reindex_block(iblk, blk, clmap, ndmap, fcmap)
+            ifps = self._interface_block(iblk, blk, interface_type, dupfcs)
+            blk.calc_metric()
+            blk.build_boundary()
+            return blk, ifps
+        # Pass 1: shapes, interface pairs, and metric of interface cells.
+        shapes = list()
+        ifplist = list()
+        ifcls = [empty(0, dtype='int32')]
+        ifcnd = [empty((0, self.blk.ndim), dtype=self.blk.fpdtype)]
+        ifvol = [empty(0, dtype=self.blk.fpdtype)]
+        for iblk in range(self.nblk):
+            blk, ifps = build(iblk)
+            ifplist.extend(ifps)
+            ngstnode, ngstface, ngstcell = blk._count_ghost()
+            shapes.append((blk.nnode, blk.nface, blk.ncell, blk.nbound,
+                           ngstnode, ngstface, ngstcell))
+            for bc in blk.bclist:
+                if not isinstance(bc, bctregy.interface):
+                    continue
+                cls = blk.fccls[bc.facn[:,0],0]
+                ifcls.append(self.idxinfo[iblk][2][cls])
+                ifcnd.append(blk.clcnd[cls,:])
+                ifvol.append(blk.clvol[cls])
+        self.shapes = array(shapes, dtype='int32')
+        self.ifparr = array(ifplist, dtype='int32')
+        ifcls = concatenate(ifcls)
+        order = ifcls.argsort()
+        ifcls = ifcls[order]
+        ifcnd = concatenate(ifcnd)[order]
+        ifvol = concatenate(ifvol)[order]
+        # Pass 2: build and yield the complete blocks.
+        for iblk in range(self.nblk):
+            blk, ifps = build(iblk)
+            blk.build_ghost()
+            myface = self.idxinfo[iblk][1]
+            for bc in blk.bclist:
+                if not isinstance(bc, bctregy.interface):
+                    continue
+                facn = bc.facn
+                # fill informations from related block.
+                nnode, nface, ncell, nbound, ngstnode, ngstface, ngstcell = \
+                    self.shapes[bc.rblkn]
+                bc.rblkinfo[:] = (nnode, ngstnode, nface, ngstface,
+                                  ncell, ngstcell)
+                # the related cells in whole-indices.
+                fccls = self.blk.fccls[myface[facn[:,0]],:2]
+                rcls = where(self.part[fccls[:,0]] == bc.rblkn,
+                             fccls[:,0], fccls[:,1])
+                # calculate indices of related cells.
+                bc.rclp = empty((len(bc),3), dtype='int32')
+                bc.rclp[:,0] = blk.fccls[facn[:,0],1]
+                bc.rclp[:,1] = clmap[rcls]
+                bc.rclp[:,2] = blk.fccls[facn[:,0],0]
+                assert (bc.rclp[:,0]<0).all()
+                assert (bc.rclp[:,1]>=0).all()
+                assert (bc.rclp[:,2]>=0).all()
+                # copy ghost information.
+                slctm = bc.rclp[:,0] + blk.ngstcell
+                slctr = ifcls.searchsorted(rcls)
+                blk.shcltpn[slctm] = self.blk.cltpn[rcls]
+                blk.shclgrp[slctm] = self.blk.clgrp[rcls]
+                blk.shclcnd[slctm,:] = ifcnd[slctr,:]
+                blk.shclvol[slctm] = ifvol[slctr]
+            yield blk
 
     def make_iflist_per_block(self):
         """
@@ -123,6 +123,62 @@ class Timer(dict):
     def increase(self, key, delta):
         self[key] = self.get(key, self.vtype(0)) + self.vtype(delta)
 
+class SpanRecorder(list):
+    """
+    Timestamped spans of execution.  A span is kept as a tuple of name,
+    category, start time, end time, and arguments, and is exported as a
+    complete event of the Chrome trace event format, which can be viewed by
+    chrome://tracing or Perfetto.  The time is from :py:func:`time.time`, so
+    that spans recorded in different processes on the same host line up.
+
+    >>> rec = SpanRecorder(pid=1, label='solver #0')
+    >>> rec.add('calcsoln', 'march', 10.0, 10.5)
+    >>> events = SpanRecorder.merge([rec])
+    >>> events[0]['ph'], events[0]['args']['name']
+    ('M', 'solver #0')
+    >>> evt = events[1]
+    >>> evt['name'], evt['cat'], evt['ph'], evt['ts'], evt['dur'], evt['pid']
+    ('calcsoln', 'march', 'X', 0.0, 500000.0, 1)
+    """
+    def __init__(self, *args, **kw):
+        #: Process ID of the spans in the trace.
+        self.pid = kw.pop('pid', 0)
+        #: Process name of the spans in the trace.
+        self.label = kw.pop('label', None)
+        super(SpanRecorder, self).__init__(*args, **kw)
+    def add(self, name, cat, start, end, args=None):
+        self.append((name, cat, start, end, args))
+    @staticmethod
+    def merge(recorders):
+        """
+        :param recorders: The recorders to merge.
+        :type recorders: list of SpanRecorder
+        :return: Trace events in microseconds from the earliest span.
+        :rtype: list of dict
+        """
+        starts = [span[2] for rec in recorders for span in rec]
+        origin = min(starts) if starts else 0.0
+        events = list()
+        for rec in recorders:
+            if rec.label is not None:
+                events.append(dict(name='process_name', ph='M', pid=rec.pid,
+                                   tid=0, args={'name': rec.label}))
+            for name, cat, start, end, args in rec:
+                evt = dict(name=name, cat=cat, ph='X', pid=rec.pid, tid=0,
+                           ts=(start-origin)*1.e6, dur=(end-start)*1.e6)
+                if args:
+                    evt['args'] = args
+                events.append(evt)
+        return events
+    @classmethod
+    def dump(cls, recorders, stream):
+        """
+        Write the merged trace of *recorders* to *stream* in JSON.
+        """
+        import json
+        json.dump({'traceEvents': cls.merge(recorders),
+                   'displayTimeUnit': 'ms'}, stream)
+
 # Define the base metaclass for classes want binders.
 def bind(self):
     """
@@ -36,11 +36,14 @@ Hooks for :py:class:`solvcon.case.MeshCase`.
 from __future__ import absolute_import, division, print_function
 
 
+import os
+
 import numpy as np
 
 from . import rpc
 from . import domain
 from . import anchor
+from .block import elemtype
 
 # import legacy.
 from .hook_legacy import (
@@ -138,6 +141,31 @@ class MeshHook(object):
     def blk(self):
         return self.cse.solver.domainobj.blk
 
+    def _collect_solver_attr(self, name):
+        """
+        :param name: Name of the attribute of the solvers.
+        :type name: str
+        :return: The attribute of all the solvers.
+        :rtype: :py:class:`list`
+        """
+        cse = self.cse
+        if cse.is_parallel:
+            dealer = cse.solver.dealer
+            vals = list()
+            for sdw in dealer:
+                sdw.cmd.remote_getattr(name, with_worker=True)
+                vals.append(sdw.recv())
+        else:
+            vals = [getattr(cse.solver.solverobj, name)]
+        return vals
+
+    def _collect_timers(self):
+        """
+        :return: The timers of all the solvers.
+        :rtype: :py:class:`list`
+        """
+        return self._collect_solver_attr('timer')
+
     def _collect_interior(self, key, tovar=False, inder=False,
         consider_ghost=True):
         """
@@ -158,25 +186,26 @@ class MeshHook(object):
         ngstcell = self.blk.ngstcell
         if cse.is_parallel:
             dom = self.cse.solver.domainobj
-            # collect arrays from solvers.
             dealer = self.cse.solver.dealer
-            arrs = list()
-            for iblk in range(dom.nblk):
-                dealer[iblk].cmd.pull(key, inder=inder, with_worker=True)
-                arr = dealer[iblk].recv()
-                arrs.append(arr)
-            # create global array.
-            shape = [it for it in arrs[0].shape]
+            nblk = dom.nblk
+            # ask all solvers at once, for only the interior part.
+            for iblk in range(nblk):
+                start = dom.shapes[iblk,6] if consider_ghost else 0
+                dealer[iblk].cmd.pull(key, inder=inder, start=start,
+                                      with_worker=True)
+            # the first array tells the shape of the global array.
+            arr = dealer[0].recv()
+            shape = [it for it in arr.shape]
             shape[0] = ncell
-            arrg = np.empty(shape, dtype=arrs[0].dtype)
-            # set global array.
-            clmaps = dom.mappers[2]
-            for iblk in range(dom.nblk):
-                slctg = (clmaps[:,1] == iblk)
-                slctl = clmaps[slctg,0]
-                if consider_ghost:
-                    slctl += dom.shapes[iblk,6]
-                arrg[slctg] = arrs[iblk][slctl]
+            arrg = np.empty(shape, dtype=arr.dtype)
+            # the local-to-global cell map is the index information.
+            arrg[dom.idxinfo[0][2]] = arr[:len(dom.idxinfo[0][2])]
+            def recv(it):
+                iblk = it + 1
+                mycls = dom.idxinfo[iblk][2]
+                arrg[mycls] = dealer[iblk].recv()[:len(mycls)]
+            # at most domain.MAX_THREADS threads wait for the arrays.
+            domain.run_threaded(recv, nblk-1)
         else:
             if consider_ghost:
                 start = ngstcell
@@ -203,32 +232,573 @@ class MeshHook(object):
         @rtype: numpy.ndarray
         """
         cse = self.cse
-        ncell = self.blk.ncell
         ngstcell = self.blk.ngstcell
         if cse.is_parallel:
             dom = self.cse.solver.domainobj
             dealer = self.cse.solver.dealer
-            clmaps = dom.mappers[2]
-            for iblk in range(len(dom)):
-                blk = dom[iblk]
-                # create subarray.
-                shape = [it for it in arrg.shape]
-                if consider_ghost:
-                    shape[0] = blk.ngstcell+blk.ncell
-                else:
-                    shape[0] = blk.ncell
-                arr = np.empty(shape, dtype=arrg.dtype)
-                # calculate selectors.
-                slctg = (clmaps[:,1] == iblk)
-                slctl = clmaps[slctg,0]
-                if consider_ghost:
-                    slctl += blk.ngstcell
-                # push data to remote solver.
-                arr[slctl] = arrg[slctg]
-                dealer[iblk].cmd.push(arr, key, start=blk.ngstcell)
+            for iblk in range(dom.nblk):
+                start = dom.shapes[iblk,6] if consider_ghost else 0
+                # push only the interior part to remote solver.
+                arr = arrg[dom.idxinfo[iblk][2]]
+                dealer[iblk].cmd.push(arr, key, start=start)
         else:
             if consider_ghost:
                 start = ngstcell
             else:
                 start = 0
             getattr(cse.solver.solverobj, key)[start:] = arrg[:]
+
+
+class LoadBalanceHook(MeshHook):
+    """
+    Measure the marching cost of each sub-block from the timers of the
+    solvers, derive cell weights for METIS from it, and report the load
+    imbalance of the current partition and of the rebalanced one.
+
+    The cost of a cell is estimated by its type (:py:attr:`CLTPN_COST`) and
+    its boundary faces (:py:attr:`BNDFC_COST`), and then scaled sub-block by
+    sub-block to match the measured time.  After the loop the integer weights
+    are saved to :py:attr:`vwgtfn`, which can be given to the keyword
+    ``vwgt`` of :py:class:`MeshCase <solvcon.case.MeshCase>` or the
+    ``--weight`` option of the ``mesh`` command to repartition when restarting.
+    If :py:attr:`splitdir` is set, the rebalanced domain is also split and
+    saved there, and can be used as the mesh of the restarted case.
+    """
+
+    #: Estimated relative cost of a cell of each type (indexed by ``cltpn``).
+    #: The default is the number of faces of the cell, over which the CESE
+    #: kernels loop.
+    CLTPN_COST = elemtype[np.arange(len(elemtype)), elemtype[:,1]+1].astype(
+        'float64')
+    #: Estimated relative cost of a boundary face, for its ghost cell.
+    BNDFC_COST = 1.0
+    #: Prefixes of the marching methods not counted in the cost, because
+    #: their time is dominated by waiting for the other sub-blocks.  The
+    #: interface exchanges are the ``ibc*`` methods, e.g., ``ibcsoln``.
+    EXCLUDED_METHODS = ('ibc',)
+
+    def __init__(self, cse, npart=None, resolution=100, vwgtfn=None,
+                 splitdir=None, **kw):
+        """
+        If keyword psteps is None, postmarch method will not report.
+        """
+        #: Number of parts of the rebalanced partition.  Default is the
+        #: current number of sub-blocks.
+        self.npart = npart
+        #: Mean of the integer cell weights.
+        self.resolution = resolution
+        #: File name of the saved weights.  Default is
+        #: ``<basefn>_vwgt.npy``.
+        self.vwgtfn = vwgtfn
+        #: Directory to save the rebalanced split domain.  ``None`` skips it.
+        self.splitdir = splitdir
+        super(LoadBalanceHook, self).__init__(cse, **kw)
+        #: Result of the last balancing, as a :py:class:`dict`.
+        self.result = None
+
+    @classmethod
+    def measure(cls, timers):
+        """
+        :param timers: The timers of all the solvers.
+        :type timers: :py:class:`list`
+        :return: Names of the counted marching methods, and the time of each
+            of them (column) for each sub-block (row).
+        :rtype: :py:class:`tuple`
+
+        Tabulate the time of the marching methods.  A method is recognized by
+        the ``<name>_a`` entry timed with its anchors.
+        """
+        mmnames = sorted(set(
+            key for timer in timers for key in timer
+            if key+'_a' in timer and not key.startswith(cls.EXCLUDED_METHODS)
+        ))
+        mmtime = np.array([[timer.get(name, 0.0) for name in mmnames]
+                           for timer in timers], dtype='float64')
+        return mmnames, mmtime.reshape((len(timers), len(mmnames)))
+
+    @classmethod
+    def estimate_cost(cls, blk):
+        """
+        :param blk: The whole block.
+        :type blk: :py:class:`solvcon.block.Block`
+        :return: The estimated relative cost of each cell.
+        :rtype: :py:class:`numpy.ndarray`
+        """
+        cost = cls.CLTPN_COST[blk.cltpn]
+        cost += cls.BNDFC_COST * blk.count_bound_faces()
+        return cost
+
+    @staticmethod
+    def derive_weight(cost, part, blktime, resolution=100):
+        """
+        :param cost: The estimated relative cost of each cell.
+        :type cost: :py:class:`numpy.ndarray`
+        :param part: The sub-block index of each cell.
+        :type part: :py:class:`numpy.ndarray`
+        :param blktime: The measured time of each sub-block.
+        :type blktime: :py:class:`numpy.ndarray`
+        :keyword resolution: The mean of the resulting weights.
+        :type resolution: :py:class:`int`
+        :return: The integer weight of each cell, at least 1.
+        :rtype: :py:class:`numpy.ndarray`
+
+        Scale the estimated cost of the cells in each sub-block so that the
+        total is the measured time of the sub-block.  Without measured time
+        the estimate is used as is.
+
+        >>> cost = np.array([4., 4., 3., 5.])
+        >>> LoadBalanceHook.derive_weight(cost, np.array([0, 0, 1, 1]),
+        ...                               np.array([1., 2.]), resolution=10)
+        array([ 7,  7, 10, 17], dtype=int32)
+        """
+        est = np.bincount(part, weights=cost, minlength=len(blktime))
+        scale = np.zeros(len(est), dtype='float64')
+        np.divide(blktime, est, out=scale, where=est>0)
+        wgt = cost * scale[part]
+        if not wgt.sum() > 0:
+            wgt = cost
+        wgt = np.rint(wgt * (resolution / wgt.mean()))
+        return np.maximum(wgt, 1).astype('int32')
+
+    @staticmethod
+    def imbalance(load):
+        """
+        :param load: The load of each part.
+        :type load: :py:class:`numpy.ndarray`
+        :return: The ratio of the maximal load to the mean.
+        :rtype: :py:class:`float`
+
+        >>> LoadBalanceHook.imbalance(np.array([1., 2., 3.]))
+        1.5
+        """
+        mean = load.mean()
+        return float(load.max() / mean) if mean > 0 else 1.0
+
+    def balance(self):
+        """
+        :return: The result, also set to :py:attr:`result`.
+        :rtype: :py:class:`dict`
+
+        Measure the current load and partition the whole block with the
+        derived weights.
+        """
+        blk = self.blk
+        dom = self.cse.solver.domainobj
+        mmnames, mmtime = self.measure(self._collect_timers())
+        blktime = mmtime.sum(axis=1)
+        part = getattr(dom, 'part', None)
+        if part is None:
+            part = np.zeros(blk.ncell, dtype='int32')
+        vwgt = self.derive_weight(self.estimate_cost(blk), part, blktime,
+                                  resolution=self.resolution)
+        npart = self.npart if self.npart is not None else len(blktime)
+        newdom = domain.Collective(blk)
+        if npart > 1:
+            newdom.partition(npart, vwgt=vwgt)
+            newload = np.bincount(newdom.part, weights=vwgt, minlength=npart)
+        else:
+            newload = np.array([vwgt.sum()], dtype='float64')
+        self.result = dict(
+            mmnames=mmnames, mmtime=mmtime, vwgt=vwgt, npart=npart,
+            domain=newdom, before=self.imbalance(blktime),
+            after=self.imbalance(newload),
+        )
+        return self.result
+
+    def _report(self):
+        """
+        Print the measured time and the imbalance.
+        """
+        res = self.result
+        info = self.info
+        info('Load balance (%d steps):\n' % (
+            self.cse.execution.step_current - self.cse.execution.step_init))
+        info('  %5s' % 'block' + ''.join(
+            ' %12s' % name[:12] for name in res['mmnames'] + ['total']) + '\n')
+        for iblk, row in enumerate(res['mmtime']):
+            info('  %5d' % iblk + ''.join(
+                ' %12.4g' % val for val in list(row) + [row.sum()]) + '\n')
+        info('  imbalance (max/mean): %.4f -> %.4f with %d weighted parts '
+             '(edgecut %d)\n' % (res['before'], res['after'], res['npart'],
+                                  res['domain'].edgecut))
+
+    def postmarch(self):
+        istep = self.cse.execution.step_current
+        nsteps = self.cse.execution.steps_run
+        psteps = self.psteps
+        if istep > 0 and psteps and istep%psteps == 0 and istep != nsteps:
+            self.balance()
+            self._report()
+
+    def postloop(self):
+        self.balance()
+        self._report()
+        cse = self.cse
+        vwgtfn = '%s_vwgt.npy' % cse.io.basefn
+        vwgtfn = self.vwgtfn if self.vwgtfn is not None else vwgtfn
+        vwgtfn = os.path.join(cse.io.basedir, vwgtfn)
+        np.save(vwgtfn, self.result['vwgt'])
+        self.info('  weights saved to %s\n' % vwgtfn)
+        newdom = self.result['domain']
+        if self.splitdir is not None and newdom.part is not None:
+            from . import boundcond
+            from .io import domain as iodomain
+            self._makedir(self.splitdir)
+            iodomain.DomainIO(dom=newdom).save_split(
+                dirname=self.splitdir, interface_type=boundcond.interface)
+            self.info('  rebalanced domain saved to %s\n' % self.splitdir)
+
+class PhaseTimeHook(MeshHook):
+    """
+    Break the wall time of a case into the phases listed in :py:attr:`PHASES`
+    after the time-marching loop.  The phases do not overlap:
+
+    - ``split``: splitting the domain.
+    - ``interconnect``: creating the workers, connecting them, and setting up
+      the interfaces.
+    - ``init``: the rest of :py:meth:`MeshCase.init
+      <solvcon.case.MeshCase.init>`.
+    - ``exchange``: the interface exchanges in marching, taken as the maximum
+      over the solvers.
+    - ``march``: the rest of the marching time of the solvers.
+    - ``output``: the hooks run between the marching calls.
+
+    The result is kept in :py:attr:`phases`.
+    """
+
+    #: Names of the phases.
+    PHASES = ('init', 'split', 'interconnect', 'march', 'exchange', 'output')
+    #: Prefix of the marching methods of interface exchange.
+    EXCHANGE_METHODS = ('ibc',)
+
+    def __init__(self, cse, **kw):
+        super(PhaseTimeHook, self).__init__(cse, **kw)
+        #: Time of each phase, as a :py:class:`dict`.
+        self.phases = None
+
+    @classmethod
+    def measure(cls, logtime, timers):
+        """
+        :param logtime: The ``log.time`` of the case.
+        :type logtime: :py:class:`dict`
+        :param timers: The timers of all the solvers.
+        :type timers: :py:class:`list`
+        :return: Time of each phase.
+        :rtype: :py:class:`dict`
+
+        >>> logtime = {'init': [0, 0, 10.0], 'split_domain': [0, 0, 2.0],
+        ...            'interconnect': [0, 0, 1.0], 'run_march': [0, 0, 9.0],
+        ...            'solver_march': 8.0}
+        >>> timers = [{'calcsoln': 5.0, 'ibcsoln': 1.0, 'ibcsoln_a': 1.0},
+        ...           {'calcsoln': 4.0, 'ibcsoln': 3.0, 'ibcsoln_a': 3.0}]
+        >>> phases = PhaseTimeHook.measure(logtime, timers)
+        >>> [phases[name] for name in PhaseTimeHook.PHASES]
+        [7.0, 2.0, 1.0, 5.0, 3.0, 1.0]
+        """
+        def span(key):
+            return logtime.get(key, [0.0, 0.0, 0.0])[2]
+        exchange = max([0.0] + [
+            sum(val for key, val in timer.items()
+                if key.startswith(cls.EXCHANGE_METHODS) and key+'_a' in timer)
+            for timer in timers])
+        split = span('split_domain')
+        interconnect = sum(span(key) for key in
+                           ('build_dealer', 'interconnect', 'init_interface'))
+        solver_march = logtime.get('solver_march', 0.0)
+        return dict(
+            init=span('init') - split - interconnect,
+            split=split,
+            interconnect=interconnect,
+            march=solver_march - exchange,
+            exchange=exchange,
+            output=span('run_march') - solver_march,
+        )
+
+    def postloop(self):
+        self.phases = self.measure(self.cse.log.time, self._collect_timers())
+        self.info('Phase time (sec):\n')
+        for name in self.PHASES:
+            self.info('  %-12s %12.4g\n' % (name, self.phases[name]))
+
+class TraceHook(MeshHook):
+    """
+    Record the spans of the case, the hooks, and all the solvers, and write
+    them after the time-marching loop into a JSON file of the Chrome trace
+    event format, which can be viewed by chrome://tracing or Perfetto.  The
+    case and the hooks are in the process named "case", and each solver in the
+    process named "solver #n".  The spans of the solvers include each time
+    step, marching method, anchor method, and interface exchange with a peer,
+    so that load imbalance and communication stalls can be seen step by step.
+
+    The spans are timestamped with the wall clock, so the solvers running on
+    different hosts are aligned only as well as the clocks of the hosts.
+    """
+
+    def __init__(self, cse, tracefn=None, **kw):
+        from .gendata import SpanRecorder
+        kw.setdefault('ankcls', anchor.TraceAnchor)
+        super(TraceHook, self).__init__(cse, **kw)
+        #: File name of the trace.  Default is ``<basefn>_trace.json``.
+        self.tracefn = tracefn
+        cse.tracer = SpanRecorder(pid=0, label='case')
+
+    def postloop(self):
+        from .gendata import SpanRecorder
+        cse = self.cse
+        tracers = [cse.tracer] + [tracer for tracer in
+            self._collect_solver_attr('tracer') if tracer is not None]
+        tracefn = '%s_trace.json' % cse.io.basefn
+        tracefn = self.tracefn if self.tracefn is not None else tracefn
+        tracefn = os.path.join(cse.io.basedir, tracefn)
+        with open(tracefn, 'w') as stream:
+            SpanRecorder.dump(tracers, stream)
+        self.info('Trace of %d spans written to %s\n' % (
+            sum(len(tracer) for tracer in tracers), tracefn))
+
+class IbcStatHook(MeshHook):
+    """
+    Report the interface communication of the solvers every :py:attr:`psteps`
+    steps and after the loop: the hottest interfaces by the time blocked in
+    exchanging, the share of the marching time each solver spends blocked,
+    and the solver on the critical path, i.e., the one computing the longest.
+
+    Pair with :py:class:`solvcon.anchor.IbcStatAnchor`.
+    """
+
+    def __init__(self, cse, nhot=5, **kw):
+        kw.setdefault('ankcls', anchor.IbcStatAnchor)
+        #: Number of the hottest interfaces to show.
+        self.nhot = nhot
+        super(IbcStatHook, self).__init__(cse, **kw)
+
+    @staticmethod
+    def tabulate(marchret, nhot=5):
+        """
+        :param marchret: The ``execution.marchret`` of the case.
+        :type marchret: :py:class:`list` or :py:class:`dict`
+        :keyword nhot: Number of the hottest interfaces to show.
+        :type nhot: int
+        :return: Lines of the report; empty if no statistics is returned.
+        :rtype: :py:class:`list`
+
+        >>> marchret = [
+        ...     {'ibcstat': {'svrn': 0, 'march': 2.0, 'stat': {
+        ...         (1, 'soln'): [10, 800, 10, 800, 0.1, 0.9]}}},
+        ...     {'ibcstat': {'svrn': 1, 'march': 2.0, 'stat': {
+        ...         (0, 'soln'): [10, 800, 10, 800, 0.1, 0.1]}}}]
+        >>> print(''.join(IbcStatHook.tabulate(marchret, nhot=1)), end='')
+        Interface communication (hottest 1):
+            blk  peer array        msgs      sent(B)      recv(B)    wait(s)
+              0     1 soln           20          800          800          1
+            blk   march(s)    wait(s)    share
+              0          2          1    0.500
+              1          2        0.2    0.100
+          critical path: block 1 (1.8 s computing)
+        """
+        if isinstance(marchret, dict):
+            marchret = [marchret]
+        stats = [mr['ibcstat'] for mr in marchret
+                 if isinstance(mr, dict) and 'ibcstat' in mr]
+        stats.sort(key=lambda st: st['svrn'])
+        if not stats:
+            return []
+        lines = list()
+        # the hottest interfaces.
+        rows = sorted(
+            [(st['svrn'], peer, name) + tuple(val)
+             for st in stats for (peer, name), val in st['stat'].items()],
+            key=lambda row: -(row[7]+row[8]))
+        lines.append('Interface communication (hottest %d):\n' % nhot)
+        lines.append('  %5s %5s %-8s %8s %12s %12s %10s\n' % (
+            'blk', 'peer', 'array', 'msgs', 'sent(B)', 'recv(B)', 'wait(s)'))
+        for svrn, peer, name, nsend, bsend, nrecv, brecv, tsend, trecv \
+                in rows[:nhot]:
+            lines.append('  %5d %5d %-8s %8d %12d %12d %10.4g\n' % (
+                svrn, peer, name, nsend+nrecv, bsend, brecv, tsend+trecv))
+        # the share of blocked time of each solver.
+        lines.append('  %5s %10s %10s %8s\n' % (
+            'blk', 'march(s)', 'wait(s)', 'share'))
+        comps = list()
+        for st in stats:
+            wait = sum(val[4]+val[5] for val in st['stat'].values())
+            share = wait/st['march'] if st['march'] > 0 else 0.0
+            comps.append((st['march']-wait, st['svrn']))
+            lines.append('  %5d %10.4g %10.4g %8.3f\n' % (
+                st['svrn'], st['march'], wait, share))
+        comp, svrn = max(comps)
+        lines.append('  critical path: block %d (%.4g s computing)\n' % (
+            svrn, comp))
+        return lines
+
+    def _show(self):
+        for line in self.tabulate(self.cse.execution.marchret, self.nhot):
+            self.info(line)
+
+    def postmarch(self):
+        istep = self.cse.execution.step_current
+        nsteps = self.cse.execution.steps_run
+        psteps = self.psteps
+        if istep > 0 and psteps and istep%psteps == 0 and istep != nsteps:
+            self._show()
+
+    def postloop(self):
+        self._show()
+
+class TelemetryHook(MeshHook):
+    """
+    Serve the live telemetry of the run with a
+    :py:class:`solvcon.telemetry.TelemetryServer` from the process driving
+    the case.  After each call to march, the snapshot is renewed with the
+    current step, the simulation time, the step and cell rates, the CFL
+    range (if a ``cfl`` entry is returned, e.g., by
+    :py:class:`solvcon.parcel.gas.CflAnchor`), and the step time and resident
+    set size of each solver.  The values come from
+    :py:attr:`MeshSolver.marchret <solvcon.solver.MeshSolver.marchret>` that
+    the case collects anyway, so that no communication is added.
+
+    The URL of the endpoint (or the path of the Unix domain socket) is
+    written to ``<basefn>_telemetry.url`` in the output directory.
+
+    Pair with :py:class:`solvcon.anchor.TelemetryAnchor`.
+    """
+
+    def __init__(self, cse, address=None, **kw):
+        """
+        :keyword address: A (host, port) tuple to serve HTTP over TCP, or a
+            path to serve over a Unix domain socket.  Default is
+            ``('127.0.0.1', 0)``, i.e., a free local port.
+        :type address: :py:class:`tuple` or :py:class:`str`
+        """
+        from .telemetry import TelemetryServer
+        kw.setdefault('ankcls', anchor.TelemetryAnchor)
+        super(TelemetryHook, self).__init__(cse, **kw)
+        if address is None:
+            address = ('127.0.0.1', 0)
+        elif isinstance(address, list):
+            address = tuple(address)
+        #: The server of the telemetry.
+        self.server = TelemetryServer(address)
+        self._last = None
+
+    @staticmethod
+    def summarize(marchret):
+        """
+        :param marchret: The ``execution.marchret`` of the case.
+        :type marchret: :py:class:`list` or :py:class:`dict`
+        :return: The CFL range and the per-solver values.
+        :rtype: :py:class:`dict`
+
+        >>> marchret = [
+        ...     {'cfl': [0.2, 0.8, 0, 0], 'telemetry':
+        ...      {'svrn': 0, 'nstep': 2, 'elapsed': 0.5, 'rss': 1024}},
+        ...     {'cfl': [0.3, 0.9, 0, 0], 'telemetry':
+        ...      {'svrn': 1, 'nstep': 2, 'elapsed': 1.0, 'rss': 2048}}]
+        >>> summary = TelemetryHook.summarize(marchret)
+        >>> summary['cfl_min'], summary['cfl_max']
+        (0.2, 0.9)
+        >>> [(wkr['svrn'], wkr['steptime'], wkr['rss'])
+        ...  for wkr in summary['workers']]
+        [(0, 0.25, 1024), (1, 0.5, 2048)]
+        """
+        if isinstance(marchret, dict):
+            marchret = [marchret]
+        marchret = [mr for mr in marchret or [] if isinstance(mr, dict)]
+        cfls = [mr['cfl'] for mr in marchret if 'cfl' in mr]
+        workers = list()
+        for mr in marchret:
+            tlm = mr.get('telemetry')
+            if tlm is None:
+                continue
+            nstep = tlm['nstep']
+            workers.append(dict(
+                svrn=tlm['svrn'],
+                steptime=tlm['elapsed']/nstep if nstep else None,
+                rss=tlm['rss'],
+            ))
+        workers.sort(key=lambda wkr: wkr['svrn'])
+        return dict(
+            cfl_min=min(cfl[0] for cfl in cfls) if cfls else None,
+            cfl_max=max(cfl[1] for cfl in cfls) if cfls else None,
+            workers=workers,
+        )
+
+    def _renew(self, state):
+        import time
+        from .telemetry import get_rss
+        cse = self.cse
+        exe = cse.execution
+        now = time.time()
+        istep = exe.step_current
+        ncell = self.blk.ncell
+        snapshot = dict(
+            state=state, updated=now, pid=os.getpid(), basefn=cse.io.basefn,
+            step=istep, steps_run=exe.steps_run, time=exe.time,
+            ncell=ncell, rss=get_rss(),
+            steps_per_second=None, mcells_per_second=None,
+            cfl_min=None, cfl_max=None, workers=[],
+        )
+        if state != 'preloop':
+            snapshot.update(self.summarize(exe.marchret))
+            # the rate since the last renewal.
+            lstep, ltime = self._last
+            if now > ltime and istep > lstep:
+                rate = (istep-lstep) / (now-ltime)
+                snapshot['steps_per_second'] = rate
+                snapshot['mcells_per_second'] = rate * ncell * 1.e-6
+        self._last = istep, now
+        # replace as a whole; the serving thread may be reading the old one.
+        self.server.snapshot = snapshot
+
+    def preloop(self):
+        self.server.start()
+        self._renew('preloop')
+        urlfn = os.path.join(self.cse.io.basedir,
+                             '%s_telemetry.url' % self.cse.io.basefn)
+        with open(urlfn, 'w') as fobj:
+            fobj.write(self.server.url + '\n')
+        self.info('Telemetry served at %s\n' % self.server.url)
+
+    def postmarch(self):
+        self._renew('running')
+
+    def postloop(self):
+        self._renew('finished')
+        self.server.stop()
+
+class MemoryHook(MeshHook):
+    """
+    Report the memory held by the blocks, the solver tables, the derived
+    arrays, and the anchors of all the solvers, separating ghost from body,
+    before and after the time-marching loop.  The figures are gathered from
+    the workers through the dealer in a parallel run.  The whole block kept
+    by the case in a parallel run is reported as the ``case`` line.
+
+    See :py:mod:`solvcon.memory` for how the arrays are counted, and
+    :py:func:`solvcon.memory.estimate` for the estimate before allocation.
+    """
+
+    def __init__(self, cse, nlarge=5, **kw):
+        #: Number of the largest arrays to show.
+        self.nlarge = nlarge
+        super(MemoryHook, self).__init__(cse, **kw)
+        #: The latest results of :py:func:`solvcon.memory.solver_memory` of
+        #: all the solvers.
+        self.memories = None
+
+    def _show(self):
+        from .memory import MIB, block_memory, tabulate
+        self.memories = self._collect_solver_attr('memory')
+        for line in tabulate(self.memories, self.nlarge):
+            self.info(line)
+        if self.cse.is_parallel:
+            mem = block_memory(self.blk)
+            ghost = sum(val[0] for val in mem.values())
+            body = sum(val[1] for val in mem.values())
+            self.info('  %5s %-16s %10.4g %10.4g %10.4g\n' % (
+                'case', 'block', ghost/MIB, body/MIB, (ghost+body)/MIB))
+
+    def preloop(self):
+        self._show()
+
+    def postloop(self):
+        self._show()
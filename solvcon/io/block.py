@@ -394,8 +394,8 @@ class BlockFormat(with_metaclass(BlockFormatMeta, Format)):
             val = vdict['link']
             ibc0 = nmidx[key]
             ibc1 = nmidx[val]
-            pbc0 = blk.bclist[ibc0] = bct(blk.bclist[ibc0])
-            pbc1 = blk.bclist[ibc1] = bct(blk.bclist[ibc1])
+            pbc0 = blk.bclist[ibc0] = bct(bc=blk.bclist[ibc0])
+            pbc1 = blk.bclist[ibc1] = bct(bc=blk.bclist[ibc1])
             ref = vdict['ref']
             pbc0.sort(ref)
             pbc1.sort(ref)
@@ -412,7 +412,7 @@ class BlockFormat(with_metaclass(BlockFormatMeta, Format)):
                 continue
             bct, vdict = mapper
             if bct is not None:
-                newbc = bct(bc)
+                newbc = bct(bc=bc)
                 newbc.feedValue(vdict)
             # save to block object.
             newbc.sern = bc.sern
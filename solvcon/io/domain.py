@@ -109,8 +109,33 @@ class DomainFormat(with_metaclass(DomainFormatMeta, Format)):
         @param dirname: the directory to save data.
         @type dirname: str
         """
+        self._save_domain(dom, dirname)
+        self._save_blocks(dom.blk, iter(dom), dirname)
+    def save_split(self, dom, dirname, interface_type=None):
+        """
+        Split the dom object and save it into a file, one sub-block at a time.
+        The resulting directory is the same as that written by :py:meth:`save`
+        for a split domain.
+        
+        @param dom: to-be-written domain object; must be partitioned.
+        @type dom: solvcon.domain.Collective
+        @param dirname: the directory to save data.
+        @type dirname: str
+        @keyword interface_type: BC type for the interface.
+        @type interface_type: solvcon.boundcond.interface
+        """
+        blks = dom.iter_split(interface_type=interface_type)
+        # shapes and interface pairs are known after the first sub-block is
+        # generated, and the dom file can then be written.
+        first = next(blks)
+        self._save_domain(dom, dirname)
+        def chain():
+            yield first
+            for blk in blks:
+                yield blk
+        self._save_blocks(dom.blk, chain(), dirname)
+    def _save_domain(self, dom, dirname):
         import os
-        from .block import blfregy
         stream = open(os.path.join(dirname, self.DOM_FILENAME), 'wb')
         # text part.
         self._write_text(self.FILE_HEADER + '\n', stream)
@@ -129,16 +154,40 @@ class DomainFormat(with_metaclass(DomainFormatMeta, Format)):
             self._write_array(self.compressor, myfcs, stream)
             self._write_array(self.compressor, mycls, stream)
         stream.close()
-        # blocks.
+    def _save_blocks(self, whole, blks, dirname):
+        import os
+        from .block import blfregy
         blf = blfregy[self.blk_format_rev](compressor=self.compressor)
         stream = open(os.path.join(dirname, self.WHOLE_FILENAME), 'wb')
-        blf.save(dom.blk, stream)
+        blf.save(whole, stream)
         stream.close()
-        for iblk in range(len(dom)):
-            stream = open(
-                os.path.join(dirname, self.SPLIT_FILENAME%iblk), 'wb')
-            blf.save(dom[iblk], stream)
-            stream.close()
+        iblk = 0
+        for blk in blks:
+            self.save_block(blk, dirname, iblk)
+            iblk += 1
+    def save_block(self, blk, dirname, iblk):
+        """
+        Save a sub-block into its own file in the directory, without writing
+        the dom file.  Sub-blocks can be saved concurrently, and be read back
+        by :py:meth:`load_block` with the returned file name.
+
+        @param blk: to-be-written sub-block.
+        @type blk: solvcon.block.Block
+        @param dirname: the directory to save data.
+        @type dirname: str
+        @param iblk: index of the sub-block.
+        @type iblk: int
+        @return: the file name of the sub-block; relative path.
+        @rtype: str
+        """
+        import os
+        from .block import blfregy
+        blf = blfregy[self.blk_format_rev](compressor=self.compressor)
+        blkfn = self.SPLIT_FILENAME % iblk
+        stream = open(os.path.join(dirname, blkfn), 'wb')
+        blf.save(blk, stream)
+        stream.close()
+        return blkfn
     def load(self, dirname, bcmapper, with_arrs, with_whole, with_split,
             return_filenames, domaintype):
         """
@@ -297,7 +346,7 @@ class DomainFormat(with_metaclass(DomainFormatMeta, Format)):
         self._write_text('%s = %d\n' % ('nnode', dom.blk.nnode), stream)
         self._write_text('%s = %d\n' % ('nface', dom.blk.nface), stream)
         self._write_text('%s = %d\n' % ('ncell', dom.blk.ncell), stream)
-        self._write_text('%s = %d\n' % ('npart', len(dom)), stream)
+        self._write_text('%s = %d\n' % ('npart', dom.nblk), stream)
         self._write_text('%s = %d\n' % ('nifp', dom.ifparr.shape[0]), stream)
         ndmaps, fcmaps, clmaps = dom.mappers
         assert ndmaps.shape[1]%2 == 1
@@ -305,7 +354,7 @@ class DomainFormat(with_metaclass(DomainFormatMeta, Format)):
                          stream)
     @classmethod
     def _save_idxinfo_shape(cls, dom, stream):
-        nblk = len(dom)
+        nblk = dom.nblk
         for iblk in range(nblk):
             key = 'idxinfo%d' % iblk
             spe = ' '.join(['%d'%arr.shape[0] for arr in dom.idxinfo[iblk]])
@@ -314,7 +363,7 @@ class DomainFormat(with_metaclass(DomainFormatMeta, Format)):
     def _save_block_filenames(cls, dirname, dom, stream):
         import os
         cls._write_text('%s = %s\n' % ('whole', 'whole.blk'), stream)
-        for iblk in range(len(dom)):
+        for iblk in range(dom.nblk):
             cls._write_text('%s = %s\n' % ('part%d'%iblk, 'part%d.blk'%iblk),
                              stream)
 
@@ -440,6 +489,36 @@ class DomainIO(FormatIO):
         dom = self.dom if dom == None else dom
         dirname = self.dirname if dirname == None else dirname
         self.dmf.save(dom, dirname)
+    def save_split(self, dom=None, dirname=None, interface_type=None):
+        """
+        Split the partitioned domain object and save it into a file without
+        keeping all the sub-blocks in memory.
+        
+        @keyword dom: to-be-written domain object; must be partitioned.
+        @type dom: solvcon.domain.Collective
+        @keyword dirname: directory name to be written.
+        @type dirname: str
+        @keyword interface_type: BC type for the interface.
+        @type interface_type: solvcon.boundcond.interface
+        """
+        dom = self.dom if dom == None else dom
+        dirname = self.dirname if dirname == None else dirname
+        self.dmf.save_split(dom, dirname, interface_type=interface_type)
+    def save_block(self, blk, dirname=None, iblk=0):
+        """
+        Save a sub-block into its own file in the directory.
+
+        @param blk: to-be-written sub-block.
+        @type blk: solvcon.block.Block
+        @keyword dirname: directory name to be written.
+        @type dirname: str
+        @keyword iblk: index of the sub-block.
+        @type iblk: int
+        @return: the file name of the sub-block; relative path.
+        @rtype: str
+        """
+        dirname = self.dirname if dirname == None else dirname
+        return self.dmf.save_block(blk, dirname, iblk)
     def read_meta(self, dirname=None):
         """
         Read meta-data of dom file from stream.
@@ -345,3 +345,72 @@ class TestReloadIncenter(CheckDomainIO):
         self._check_block_array(don.blk, doo.blk)
         # check split blocks.
         self.assertEqual(len(don), 0)
+
+class TestSaveSplit(CheckDomainIO):
+    def test_whole_domain(self):
+        from tempfile import mkdtemp
+        from shutil import rmtree
+        from ...domain import Collective
+        from ..domain import DomainIO
+        npart = 3
+        # create original domain.
+        doo = Collective(blk=get_sample_neu())
+        doo.split(npart)
+        # split to files without keeping sub-blocks.
+        dos = Collective(blk=get_sample_neu())
+        dos.partition(npart)
+        dio = DomainIO(compressor='gz', fmt='IncenterDomainFormat')
+        dirname = mkdtemp()
+        dio.save_split(dom=dos, dirname=dirname)
+        self.assertEqual(len(dos), 0)
+        don = dio.load(dirname=dirname, with_split=True)
+        rmtree(dirname)
+        # check domain.
+        self._check_domain_shape(don, doo)
+        self._check_domain_array(don, doo)
+        # check split blocks.
+        self.assertEqual(len(don), npart)
+        for iblk in range(npart):
+            try:
+                self._check_block_shape(don[iblk], doo[iblk])
+                self._check_block_group(don[iblk], doo[iblk])
+                self._check_block_bc(don[iblk], doo[iblk])
+                self._check_block_array(don[iblk], doo[iblk])
+            except StandardError as e:
+                msgs = list(e.args)
+                msgs.append('%d-th block' % iblk)
+                e.args = tuple(msgs)
+                raise
+
+class TestSaveBlock(CheckDomainIO):
+    def test_scratch(self):
+        from tempfile import mkdtemp
+        from shutil import rmtree
+        from ...domain import Collective
+        from ...boundcond import interface
+        from ...case import MeshCase
+        from ...parcel.gas import boundcond as gasbc
+        from ..domain import DomainIO
+        npart = 3
+        doo = Collective(blk=get_sample_neu())
+        doo.split(npart, interface_type=interface)
+        for blk in doo:
+            for ibc, bc in enumerate(blk.bclist):
+                if issubclass(gasbc.GasWall, type(bc)):
+                    blk.bclist[ibc] = gasbc.GasWall(bc=bc)
+        # save the sub-blocks alone into a directory without a dom file.
+        dirname = mkdtemp()
+        dio = DomainIO(dirname=dirname)
+        blkfns = [dio.save_block(blk, iblk=iblk)
+                  for iblk, blk in enumerate(doo)]
+        for iblk in range(npart):
+            bcmap = MeshCase._make_scratch_bcmap(doo[iblk])
+            blk = dio.load_block(blkid=iblk, bcmapper=bcmap,
+                blkfn=blkfns[iblk])
+            self._check_block_shape(blk, doo[iblk])
+            self._check_block_group(blk, doo[iblk])
+            self._check_block_bc(blk, doo[iblk])
+            self._check_block_array(blk, doo[iblk])
+            self.assertEqual([type(bc) for bc in blk.bclist],
+                             [type(bc) for bc in doo[iblk].bclist])
+        rmtree(dirname)
@@ -0,0 +1,296 @@
+# -*- coding: UTF-8 -*-
+#
+# Copyright (c) 2014, Yung-Yu Chen <yyc@solvcon.net>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Accounting of the memory held by blocks, solvers, derived arrays, and
+anchors.  The bytes of an array are split into the ghost and the body parts.
+A :py:class:`solvcon.mesh.Table` knows its number of ghost rows; a plain
+:py:class:`numpy.ndarray` of a solver is taken as having the ghost cells in
+front of the body cells if its first dimension is ``ngstcell+ncell``.  Only
+arrays owning their memory are counted, so that views (e.g.,
+:py:attr:`MeshSolver.soln <solvcon.solver.MeshSolver.soln>` on its table) do
+not count twice.
+
+:py:func:`estimate` gives the footprint of a worker from the counts of a
+mesh before anything of the solver is allocated.
+"""
+
+
+from __future__ import absolute_import, division, print_function
+
+import numpy as np
+
+
+#: Categories of the memory of a solver, in the order of reporting.
+CATEGORIES = ('block', 'solver', 'der', 'anchor')
+
+#: Bytes of a mebibyte, the unit in the reports.
+MIB = 1024 * 1024
+
+
+def _is_table(obj):
+    # mesh.Table is an extension type that may not be built.
+    return hasattr(obj, 'nghost') and hasattr(obj, 'nbody')
+
+
+def array_bytes(arr, nghost=0):
+    """
+    :param arr: The array.
+    :type arr: :py:class:`solvcon.mesh.Table` or :py:class:`numpy.ndarray`
+    :keyword nghost: Number of the leading ghost rows of an ndarray.  Ignored
+        for a table.
+    :type nghost: int
+    :return: Bytes of the ghost and the body parts.
+    :rtype: :py:class:`tuple`
+
+    >>> array_bytes(np.empty((5, 2)), nghost=2)
+    (32, 48)
+    """
+    if _is_table(arr):
+        nghost = arr.nghost
+        arr = arr.F
+    if not arr.ndim or not arr.shape[0]:
+        return 0, arr.nbytes
+    rowbytes = arr.nbytes // arr.shape[0]
+    return nghost*rowbytes, arr.nbytes - nghost*rowbytes
+
+
+def block_memory(blk):
+    """
+    :param blk: The block.
+    :type blk: solvcon.block.Block
+    :return: The ghost and body bytes of each table of the block, keyed by
+        the names in :py:attr:`Block.TABLE_NAMES
+        <solvcon.block.Block.TABLE_NAMES>`, and those of ``bndfcs``.
+    :rtype: :py:class:`dict`
+
+    >>> from solvcon.testing import create_trivial_2d_blk
+    >>> mem = block_memory(create_trivial_2d_blk())
+    >>> mem['clvol']
+    (24, 24)
+    """
+    mem = dict((name, array_bytes(getattr(blk, 'tb'+name)))
+               for name in blk.TABLE_NAMES)
+    mem['bndfcs'] = array_bytes(blk.bndfcs)
+    return mem
+
+
+def _collect_owned(mapping, prefix, nelm, nghost, out, seen):
+    """
+    Put the ghost and body bytes of the tables and the owning ndarrays in
+    *mapping* into *out*, skipping the objects in *seen*.
+    """
+    for key, val in sorted(mapping.items()):
+        if _is_table(val):
+            if id(val) in seen:
+                continue
+            seen.add(id(val))
+            out[prefix+key] = array_bytes(val)
+        elif isinstance(val, np.ndarray) and val.base is None:
+            if id(val) in seen:
+                continue
+            seen.add(id(val))
+            ngst = nghost if val.ndim and val.shape[0] == nelm else 0
+            out[prefix+key] = array_bytes(val, nghost=ngst)
+
+
+def solver_memory(svr):
+    """
+    :param svr: The solver.
+    :type svr: solvcon.solver.MeshSolver
+    :return: The ghost and body bytes of the arrays held by the solver, in a
+        :py:class:`dict` for each of :py:data:`CATEGORIES`, and the serial
+        number ``svrn`` of the solver.
+    :rtype: :py:class:`dict`
+
+    >>> from solvcon.testing import create_trivial_2d_blk
+    >>> from solvcon.solver import MeshSolver
+    >>> svr = MeshSolver(create_trivial_2d_blk())
+    >>> svr.der['p'] = np.zeros(svr.ngstcell+svr.ncell)
+    >>> mem = solver_memory(svr)
+    >>> mem['der']
+    {'p': (24, 24)}
+    """
+    nghost = svr.ngstcell
+    nelm = svr.ngstcell + svr.ncell
+    seen = set()
+    mem = dict(svrn=svr.svrn if svr.svrn is not None else 0)
+    mem['block'] = block_memory(svr.blk)
+    mem['solver'] = dict()
+    _collect_owned(vars(svr), '', nelm, nghost, mem['solver'], seen)
+    mem['der'] = dict()
+    _collect_owned(svr.der, '', nelm, nghost, mem['der'], seen)
+    mem['anchor'] = dict()
+    for ank in svr.runanchors:
+        prefix = '%s.' % type(ank).__name__
+        _collect_owned(vars(ank), prefix, nelm, nghost, mem['anchor'], seen)
+    return mem
+
+
+def tabulate(memories, nlarge=5):
+    """
+    :param memories: The results of :py:func:`solver_memory` of all the
+        solvers.
+    :type memories: :py:class:`list`
+    :keyword nlarge: Number of the largest arrays to show.
+    :type nlarge: int
+    :return: Lines of the report, in MiB.
+    :rtype: :py:class:`list`
+
+    >>> memories = [
+    ...     {'svrn': 0, 'block': {'clvol': (0, MIB)},
+    ...      'solver': {'tbsoln': (MIB, 3*MIB)}, 'der': {}, 'anchor': {}},
+    ...     {'svrn': 1, 'block': {'clvol': (0, MIB)},
+    ...      'solver': {'tbsoln': (MIB, 2*MIB)}, 'der': {}, 'anchor': {}}]
+    >>> print(''.join(tabulate(memories, nlarge=1)), end='')
+    Memory (MiB):
+        blk category              ghost       body      total
+          0 block                     0          1          1
+          0 solver                    1          3          4
+          1 block                     0          1          1
+          1 solver                    1          2          3
+        all total                     2          7          9
+      largest arrays:
+          0 solver.tbsoln             1          3          4
+    """
+    memories = sorted(memories, key=lambda mem: mem['svrn'])
+    fmt = '  %5s %-16s %10.4g %10.4g %10.4g\n'
+    lines = ['Memory (MiB):\n']
+    lines.append('  %5s %-16s %10s %10s %10s\n' % (
+        'blk', 'category', 'ghost', 'body', 'total'))
+    sghost = sbody = 0
+    rows = list()
+    for mem in memories:
+        for cat in CATEGORIES:
+            if not mem[cat]:
+                continue
+            ghost = sum(val[0] for val in mem[cat].values())
+            body = sum(val[1] for val in mem[cat].values())
+            sghost += ghost
+            sbody += body
+            lines.append(fmt % (mem['svrn'], cat, ghost/MIB, body/MIB,
+                                (ghost+body)/MIB))
+            rows.extend((val[0]+val[1], mem['svrn'], cat+'.'+key) + val
+                        for key, val in mem[cat].items())
+    lines.append(fmt % ('all', 'total', sghost/MIB, sbody/MIB,
+                        (sghost+sbody)/MIB))
+    rows.sort(key=lambda row: (-row[0], row[1], row[2]))
+    lines.append('  largest arrays:\n')
+    for total, svrn, name, ghost, body in rows[:nlarge]:
+        lines.append(fmt % (svrn, name, ghost/MIB, body/MIB, total/MIB))
+    return lines
+
+
+def solver_row_bytes(create_solver, ndim):
+    """
+    Measure the bytes of the arrays of a solver per ghost and per body cell,
+    by creating it on a tiny structured mesh.  All the solver tables are
+    sized by cells, and the sizes of rows depend on the spatial dimension but
+    not the cell type.
+
+    :param create_solver: Callable taking a block to create the solver, e.g.,
+        :py:meth:`solvcon.bench.KernelBench.create_solver`.
+    :param ndim: Spatial dimension.
+    :type ndim: int
+    :return: Bytes per ghost cell and per body cell.
+    :rtype: :py:class:`tuple`
+
+    >>> from solvcon.solver import MeshSolver
+    >>> solver_row_bytes(MeshSolver, 2)
+    (0.0, 0.0)
+    """
+    from .testing import create_structured_blk
+    blk = create_structured_blk([2]*ndim)
+    mem = solver_memory(create_solver(blk))
+    ghost = sum(val[0] for val in mem['solver'].values())
+    body = sum(val[1] for val in mem['solver'].values())
+    return ghost / blk.ngstcell, body / blk.ncell
+
+
+def estimate(blk, npart, solver_row=(0.0, 0.0)):
+    """
+    Estimate the footprint of a worker when *blk* is split into *npart*
+    parts.  Each part is assumed compact, so that its surface has
+    :math:`2 d m^{(d-1)/d}` faces for :math:`m` cells in :math:`d`
+    dimensions; the faces not on the boundary of *blk* are interface faces.
+    A ghost cell is created for each boundary or interface face.  The
+    derived arrays and the anchor buffers are not included.
+
+    :param blk: The whole mesh.
+    :type blk: solvcon.block.Block
+    :param npart: Number of parts.
+    :type npart: int
+    :keyword solver_row: Bytes of the solver arrays per ghost cell and per
+        body cell, e.g., from :py:func:`solver_row_bytes`.
+    :type solver_row: :py:class:`tuple`
+    :return: The entity counts and the bytes of the block and the solver of
+        a worker.
+    :rtype: :py:class:`dict`
+
+    >>> from solvcon.testing import create_structured_blk
+    >>> blk = create_structured_blk((8, 8))
+    >>> est = estimate(blk, 1)
+    >>> est['ncell'], est['ngstcell'], est['block'] == sum(
+    ...     sum(val) for val in block_memory(blk).values())
+    (64, 32, True)
+    >>> estimate(blk, 4)['ngstcell']
+    16
+    """
+    ndim = blk.ndim
+    ncell = blk.ncell / npart
+    nface = blk.nface / npart
+    nnode = blk.nnode / npart
+    surface = 2 * ndim * ncell**((ndim-1)/ndim)
+    nbound = blk.nbound / npart
+    ngstcell = nbound + max(surface-nbound, 0.0) if npart > 1 else nbound
+    # entities brought in by each ghost cell.
+    clnfc = blk.clfcs[:,0].mean() if blk.ncell else 0.0
+    clnnd = blk.clnds[:,0].mean() if blk.ncell else 0.0
+    fcnnd = blk.fcnds[:,0].mean() if blk.nface else 0.0
+    ngstface = ngstcell * max(clnfc-1, 0.0)
+    ngstnode = ngstcell * max(clnnd-fcnnd, 0.0)
+    # bytes of a row of the tables of the block.
+    counts = dict(nd=(nnode, ngstnode), fc=(nface, ngstface),
+                  cl=(ncell, ngstcell))
+    nbyte = blk.bndfcs.nbytes / npart
+    for name in blk.TABLE_NAMES:
+        arr = getattr(blk, 'tb'+name).F
+        rowbytes = arr.nbytes / arr.shape[0] if arr.shape[0] else 0.0
+        nbody, nghost = counts[name[:2]]
+        nbyte += rowbytes * (nbody + nghost)
+    return dict(
+        npart=npart, ncell=int(round(ncell)), nface=int(round(nface)),
+        nnode=int(round(nnode)), ngstcell=int(round(ngstcell)),
+        ngstface=int(round(ngstface)), ngstnode=int(round(ngstnode)),
+        block=int(round(nbyte)),
+        solver=int(round(solver_row[0]*ngstcell + solver_row[1]*ncell)),
+    )
+
+# vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
@@ -52,6 +52,11 @@ cdef public:
         int nbound, nvalue
         int *facn
         double *value
+        # rows to copy for ghost cells; see sc_bound_copy_rows().
+        int ncopy
+        int *clgst
+        int *clsrc
+        double *rotation
 
     cdef enum sc_mesh_shape_enum:
         FCMND = 4
@@ -60,6 +65,11 @@ cdef public:
         FCREL = 4
         BFREL = 3
 
+    cdef enum sc_bound_copy_enum:
+        SC_BOUND_COPY_GHOST = 0
+        SC_BOUND_COPY_GATHER = 1
+        SC_BOUND_COPY_SCATTER = 2
+
 cdef class Table:
     cdef readonly intptr_t nghost
     cdef readonly intptr_t nbody
@@ -73,5 +83,7 @@ cdef class Mesh:
 
 cdef class Bound:
     cdef sc_bound_t *_bcd
+    cdef object _copyarrs
+    cdef _copy_rows(self, int mode, dsts, srcs, rotate)
 
 # vim: set fenc=utf8 ft=pyrex ff=unix ai et sw=4 ts=4 tw=79:
@@ -28,7 +28,9 @@
 
 from __future__ import absolute_import, division, print_function
 
-from .mesh cimport sc_mesh_t, FCMND, CLMND, CLMFC, FCREL, BFREL
+from .mesh cimport sc_mesh_t, sc_bound_t, FCMND, CLMND, CLMFC, FCREL, BFREL
+from .mesh cimport (SC_BOUND_COPY_GHOST, SC_BOUND_COPY_GATHER,
+                   SC_BOUND_COPY_SCATTER)
 from libc.stdint cimport intptr_t
 from libc.stdlib cimport malloc, free
 import numpy as np
@@ -39,16 +41,21 @@ cnp.import_array()
 
 
 cdef extern:
-    void sc_mesh_build_ghost(sc_mesh_t *msd, int *bndfcs)
-    int sc_mesh_calc_metric(sc_mesh_t *msd, int use_incenter)
+    void sc_mesh_build_ghost(sc_mesh_t *msd, int *bndfcs) nogil
+    int sc_mesh_calc_metric(sc_mesh_t *msd, int use_incenter) nogil
     int sc_mesh_extract_faces_from_cells(sc_mesh_t *msd, int mface,
             int *pnface, int *clfcs, int *fctpn, int *fcnds, int *fccls)
     int sc_mesh_build_rcells(sc_mesh_t *msd, int *rcells, int *rcellno)
     int sc_mesh_build_csr(sc_mesh_t *msd, int *rcells, int *adjncy)
+    int sc_bound_copy_rows(sc_bound_t *bcd, int mode, int ndim, int narr,
+            char **dsts, char **srcs, int *rowsizes, int *rotates) nogil
 
     void METIS_PartGraphKway( int *n, int *xadj, int *adjncy, int *vwgt,
         int *adjwgt, int *wgtflag, int *numflag, int *nparts, int *options,
         int *edgecut, int *part)
+    void METIS_PartGraphRecursive( int *n, int *xadj, int *adjncy, int *vwgt,
+        int *adjwgt, int *wgtflag, int *numflag, int *nparts, int *options,
+        int *edgecut, int *part)
 
 
 cdef class Table:
@@ -239,7 +246,10 @@ cdef class Mesh:
 
         Build data for ghost cells and related information.
         """
-        sc_mesh_build_ghost(self._msd, &bndfcs[0,0])
+        cdef int *_bndfcs = &bndfcs[0,0]
+        # release GIL so that blocks can be built in threads.
+        with nogil:
+            sc_mesh_build_ghost(self._msd, _bndfcs)
 
     def calc_metric(self, use_incenter):
         """
@@ -248,8 +258,10 @@ cdef class Mesh:
         Calculate metrics including normal vector and area of faces, and
         centroid coordinates and volume of cells.
         """
-        cdef use_incenter_val = 1 if use_incenter else 0
-        sc_mesh_calc_metric(self._msd, use_incenter_val)
+        cdef int use_incenter_val = 1 if use_incenter else 0
+        # release GIL so that blocks can be built in threads.
+        with nogil:
+            sc_mesh_calc_metric(self._msd, use_incenter_val)
 
     def extract_faces_from_cells(self, int max_nfc):
         """
@@ -313,25 +325,41 @@ cdef class Mesh:
         sc_mesh_build_csr(self._msd, &rcells[0,0], &adjncy[0])
         return xadj, adjncy
 
-    def partition(self, int npart, vwgtarr=None):
+    def partition(self, int npart, vwgtarr=None, adjwgtarr=None,
+                  recursive=False):
+        """
+        :param npart: Number of parts.
+        :type npart: int
+        :keyword vwgtarr: Weight of each cell, or None.
+        :type vwgtarr: numpy.ndarray
+        :keyword adjwgtarr: Weight of each edge in the CSR graph from
+            :py:meth:`create_csr`, or None.
+        :type adjwgtarr: numpy.ndarray
+        :keyword recursive: Use recursive bisection instead of k-way.
+        :type recursive: bool
+        :return: edgecut, part
+        :rtype: tuple
+
+        Partition the cells with METIS.  A weight array not matching the
+        graph is ignored.
+        """
         # obtain CSR.
         ret = self.create_csr()
         cdef cnp.ndarray[int, ndim=1, mode="c"] xadj = ret[0]
         cdef cnp.ndarray[int, ndim=1, mode="c"] adjncy = ret[1]
-        # weighting.
-        if vwgtarr is None:
-            vwgtarr = np.empty(1, dtype='int32')
-        cdef cnp.ndarray[int, ndim=1, mode="c"] vwgt = vwgtarr
-        cdef int wgtflag
-        if len(vwgtarr) == self._msd.ncell:
-            wgtflag = 2
+        # weighting; wgtflag is 1 for edge weights plus 2 for vertex weights.
+        cdef int wgtflag = 0
+        if vwgtarr is None or len(vwgtarr) != self._msd.ncell:
+            vwgtarr = np.zeros(1, dtype='int32')
+        else:
+            wgtflag += 2
+        if adjwgtarr is None or len(adjwgtarr) != len(adjncy) \
+           or len(adjncy) == 0:
+            adjwgtarr = np.zeros(1, dtype='int32')
         else:
-            vwgt.fill(0)
-            wgtflag = 0
-        # FIXME: not consistent when len(vwgt) == ncell.
-        cdef cnp.ndarray[int, ndim=1, mode="c"] adjwgt = np.empty(
-            1, dtype='int32')
-        adjwgt.fill(0)
+            wgtflag += 1
+        cdef cnp.ndarray[int, ndim=1, mode="c"] vwgt = vwgtarr
+        cdef cnp.ndarray[int, ndim=1, mode="c"] adjwgt = adjwgtarr
         # options.
         cdef cnp.ndarray[int, ndim=1, mode="c"] options = np.empty(
             5, dtype='int32')
@@ -341,20 +369,36 @@ cdef class Mesh:
             self._msd.ncell, dtype='int32')
         cdef int numflag = 0
         cdef int edgecut
-        METIS_PartGraphKway(
-            &self._msd.ncell,
-            &xadj[0],
-            &adjncy[0],
-            &vwgt[0],
-            &adjwgt[0],
-            &wgtflag,
-            &numflag,
-            &npart,
-            &options[0],
-            # output.
-            &edgecut,
-            &part[0],
-        )
+        if recursive:
+            METIS_PartGraphRecursive(
+                &self._msd.ncell,
+                &xadj[0],
+                &adjncy[0],
+                &vwgt[0],
+                &adjwgt[0],
+                &wgtflag,
+                &numflag,
+                &npart,
+                &options[0],
+                # output.
+                &edgecut,
+                &part[0],
+            )
+        else:
+            METIS_PartGraphKway(
+                &self._msd.ncell,
+                &xadj[0],
+                &adjncy[0],
+                &vwgt[0],
+                &adjwgt[0],
+                &wgtflag,
+                &numflag,
+                &npart,
+                &options[0],
+                # output.
+                &edgecut,
+                &part[0],
+            )
         return edgecut, part
 
 
@@ -364,6 +408,13 @@ cdef class Bound:
     """
     def __cinit__(self):
         self._bcd = <sc_bound_t *>malloc(sizeof(sc_bound_t))
+        self._bcd.nbound = self._bcd.nvalue = 0
+        self._bcd.facn = NULL
+        self._bcd.value = NULL
+        self._bcd.ncopy = 0
+        self._bcd.clgst = self._bcd.clsrc = NULL
+        self._bcd.rotation = NULL
+        self._copyarrs = None
 
     def setup_bound(self, bc):
         """
@@ -387,4 +438,166 @@ cdef class Bound:
         else:
             self._bcd.value = &value[0,0]
 
+    def setup_copy(self, clgst, clsrc, rotation=None):
+        """
+        :param clgst: Rows (including the ghost part) of the ghost cells to
+            copy into.
+        :type clgst: numpy.ndarray
+        :param clsrc: Rows (including the ghost part) of the related cells to
+            copy from.
+        :type clsrc: numpy.ndarray
+        :param rotation: Matrix rotating the vectors in the copied rows, or
+            None for plain copy.
+        :type rotation: numpy.ndarray
+        :return: Nothing.
+
+        Set up the cell pairs for :py:meth:`copy_ghost`, :py:meth:`gather`, and
+        :py:meth:`scatter`.  The index arrays are kept so that they aren't
+        rebuilt for every copy.
+
+        >>> import numpy as np
+        >>> bcd = Bound()
+        >>> bcd.setup_copy([0, 1], [3, 2])
+        >>> arr = np.arange(8, dtype='float64').reshape((4, 2))
+        >>> bcd.copy_ghost([arr])
+        >>> arr.tolist()
+        [[6.0, 7.0], [4.0, 5.0], [4.0, 5.0], [6.0, 7.0]]
+        >>> bcd.gather(arr).tolist()
+        [[6.0, 7.0], [4.0, 5.0]]
+        >>> bcd.setup_copy([0], [1], rotation=[[0.0, -1.0], [1.0, 0.0]])
+        >>> bcd.copy_ghost([arr, arr[:,0].copy()], rotate=[True, False])
+        >>> arr[0].tolist()
+        [-5.0, 4.0]
+        >>> bcd.gather(arr[:1])
+        Traceback (most recent call last):
+            ...
+        IndexError: array 0 has too few rows to copy
+        """
+        cdef cnp.ndarray[int, ndim=1, mode="c"] _clgst = np.ascontiguousarray(
+            clgst, dtype='int32')
+        cdef cnp.ndarray[int, ndim=1, mode="c"] _clsrc = np.ascontiguousarray(
+            clsrc, dtype='int32')
+        cdef cnp.ndarray[double, ndim=2, mode="c"] _rotation
+        if _clgst.shape[0] != _clsrc.shape[0]:
+            raise ValueError('%d ghost cells but %d related cells' % (
+                _clgst.shape[0], _clsrc.shape[0]))
+        if (_clgst.shape[0] and _clgst.min() < 0) or \
+           (_clsrc.shape[0] and _clsrc.min() < 0):
+            raise ValueError('rows to copy must not be negative')
+        self._bcd.ncopy = _clgst.shape[0]
+        self._bcd.clgst = &_clgst[0] if _clgst.shape[0] else NULL
+        self._bcd.clsrc = &_clsrc[0] if _clsrc.shape[0] else NULL
+        if rotation is None:
+            self._bcd.rotation = NULL
+        else:
+            _rotation = np.ascontiguousarray(rotation, dtype='float64')
+            if _rotation.shape[0] != _rotation.shape[1]:
+                raise ValueError('rotation must be a square matrix')
+            self._bcd.rotation = &_rotation[0,0]
+            rotation = _rotation
+        # keep the arrays alive, with the rows the copied arrays must have.
+        self._copyarrs = (_clgst, _clsrc, rotation,
+            _clgst.max()+1 if _clgst.shape[0] else 0,
+            _clsrc.max()+1 if _clsrc.shape[0] else 0)
+
+    cdef _copy_rows(self, int mode, dsts, srcs, rotate):
+        cdef int narr = len(dsts)
+        cdef int ndim = 0
+        cdef int iarr
+        cdef cnp.ndarray dst, src
+        cdef char **_dsts
+        cdef char **_srcs
+        cdef int *_rowsizes
+        cdef int *_rotates
+        cdef int ret
+        if self._copyarrs is None:
+            raise ValueError('copy is not set up')
+        if self._copyarrs[2] is not None:
+            ndim = self._copyarrs[2].shape[0]
+        rotate = list(rotate) if rotate is not None else [False]*narr
+        if len(rotate) != narr or len(srcs) != narr:
+            raise ValueError('numbers of arrays mismatch')
+        # validate before allocating.
+        ndst = self._bcd.ncopy if mode == SC_BOUND_COPY_GATHER \
+            else self._copyarrs[3]
+        nsrc = self._bcd.ncopy if mode == SC_BOUND_COPY_SCATTER \
+            else self._copyarrs[4]
+        for iarr in range(narr):
+            dst = dsts[iarr]
+            src = srcs[iarr]
+            if not (dst.flags.c_contiguous and src.flags.c_contiguous):
+                raise ValueError('array %d is not C contiguous' % iarr)
+            if dst.shape[0] < ndst or src.shape[0] < nsrc:
+                raise IndexError('array %d has too few rows to copy' % iarr)
+            if dst.dtype != src.dtype or \
+               dst.strides[0] != src.strides[0]:
+                raise ValueError('array %d mismatches in row' % iarr)
+            if rotate[iarr] and ndim and (
+                dst.dtype != np.float64 or dst.shape[dst.ndim-1] != ndim):
+                raise ValueError('array %d can\'t be rotated' % iarr)
+        _dsts = <char **>malloc(narr * sizeof(char *))
+        _srcs = <char **>malloc(narr * sizeof(char *))
+        _rowsizes = <int *>malloc(narr * sizeof(int))
+        _rotates = <int *>malloc(narr * sizeof(int))
+        try:
+            for iarr in range(narr):
+                dst = dsts[iarr]
+                src = srcs[iarr]
+                _dsts[iarr] = dst.data
+                _srcs[iarr] = src.data
+                _rowsizes[iarr] = dst.strides[0]
+                _rotates[iarr] = 1 if rotate[iarr] else 0
+            with nogil:
+                ret = sc_bound_copy_rows(self._bcd, mode, ndim, narr,
+                    _dsts, _srcs, _rowsizes, _rotates)
+        finally:
+            free(_dsts)
+            free(_srcs)
+            free(_rowsizes)
+            free(_rotates)
+        if ret != 0:
+            raise ValueError('invalid copy mode %d' % mode)
+
+    def copy_ghost(self, arrs, rotate=None):
+        """
+        :param arrs: Arrays (including the ghost part) to copy the related
+            cells to the ghost cells for.
+        :type arrs: sequence of numpy.ndarray
+        :param rotate: Flags to rotate the vectors in the rows of each array,
+            which must end with a dimension as long as the rotation matrix.
+        :type rotate: sequence of bool
+        :return: Nothing.
+
+        Copy all the arrays in a single pass over the cell pairs.
+        """
+        self._copy_rows(SC_BOUND_COPY_GHOST, arrs, arrs, rotate)
+
+    def gather(self, arr, out=None):
+        """
+        :param arr: Array (including the ghost part) to gather the related
+            cells from.
+        :type arr: numpy.ndarray
+        :param out: The contiguous array receiving the rows.  Allocated if
+            None.
+        :type out: numpy.ndarray
+        :return: The gathered rows.
+        :rtype: numpy.ndarray
+        """
+        if out is None:
+            out = np.empty([self._bcd.ncopy]+list(arr.shape[1:]),
+                           dtype=arr.dtype)
+        self._copy_rows(SC_BOUND_COPY_GATHER, [out], [arr], None)
+        return out
+
+    def scatter(self, arr, rows):
+        """
+        :param arr: Array (including the ghost part) to scatter into the ghost
+            cells.
+        :type arr: numpy.ndarray
+        :param rows: The contiguous rows for the ghost cells.
+        :type rows: numpy.ndarray
+        :return: Nothing.
+        """
+        self._copy_rows(SC_BOUND_COPY_SCATTER, [arr], [rows], None)
+
 # vim: set fenc=utf8 ft=pyrex ff=unix nobomb ai et sw=4 ts=4 tw=79:
@@ -34,7 +34,24 @@ Solver parcels.  A solver parcel includes everything about a problem solver.
 
 __all__ = ['fake', 'bulk', 'gas', 'linear']
 
-from . import fake
-from . import bulk
-from . import gas
-from . import linear
+def __getattr__(name):
+    """
+    Import a parcel on the first access (PEP 562).
+    """
+    import importlib
+    if name not in __all__:
+        raise AttributeError("module %r has no attribute %r" % (
+            __name__, name))
+    return importlib.import_module('.'+name, __name__)
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+import sys as _sys
+if _sys.version_info < (3, 7):
+    # no module __getattr__; load everything as before.
+    from . import fake
+    from . import bulk
+    from . import gas
+    from . import linear
+del _sys
@@ -47,15 +47,15 @@ cdef extern:
     void sc_bulk_process_physics_3d(sc_mesh_t *msd, sc_bulk_algorithm_t *alg,
         double gasconst, double *vel, double *vor, double *vorm, double *rho,
         double *pre, double *sos, double *mac)
-    # algorithm calculators.
-    void sc_bulk_calc_cfl_2d(sc_mesh_t *msd, sc_bulk_algorithm_t *alg)
-    void sc_bulk_calc_cfl_3d(sc_mesh_t *msd, sc_bulk_algorithm_t *alg)
-    void sc_bulk_calc_solt_2d(sc_mesh_t *msd, sc_bulk_algorithm_t *alg)
-    void sc_bulk_calc_solt_3d(sc_mesh_t *msd, sc_bulk_algorithm_t *alg)
-    void sc_bulk_calc_soln_2d(sc_mesh_t *msd, sc_bulk_algorithm_t *alg)
-    void sc_bulk_calc_soln_3d(sc_mesh_t *msd, sc_bulk_algorithm_t *alg)
-    void sc_bulk_calc_dsoln_2d(sc_mesh_t *msd, sc_bulk_algorithm_t *alg)
-    void sc_bulk_calc_dsoln_3d(sc_mesh_t *msd, sc_bulk_algorithm_t *alg)
+    # algorithm calculators; they release the GIL for threaded marching.
+    void sc_bulk_calc_cfl_2d(sc_mesh_t *msd, sc_bulk_algorithm_t *alg) nogil
+    void sc_bulk_calc_cfl_3d(sc_mesh_t *msd, sc_bulk_algorithm_t *alg) nogil
+    void sc_bulk_calc_solt_2d(sc_mesh_t *msd, sc_bulk_algorithm_t *alg) nogil
+    void sc_bulk_calc_solt_3d(sc_mesh_t *msd, sc_bulk_algorithm_t *alg) nogil
+    void sc_bulk_calc_soln_2d(sc_mesh_t *msd, sc_bulk_algorithm_t *alg) nogil
+    void sc_bulk_calc_soln_3d(sc_mesh_t *msd, sc_bulk_algorithm_t *alg) nogil
+    void sc_bulk_calc_dsoln_2d(sc_mesh_t *msd, sc_bulk_algorithm_t *alg) nogil
+    void sc_bulk_calc_dsoln_3d(sc_mesh_t *msd, sc_bulk_algorithm_t *alg) nogil
     # ghost information calculators.
     void sc_bulk_ghostgeom_mirror_2d(
         sc_mesh_t *msd, sc_bound_t *bcd, sc_bulk_algorithm_t *alg)
@@ -63,13 +63,13 @@ cdef extern:
         sc_mesh_t *msd, sc_bound_t *bcd, sc_bulk_algorithm_t *alg)
     # boundary-condition treaters.
     void sc_bulk_bound_nonrefl_soln_2d(
-        sc_mesh_t *msd, sc_bound_t *bcd, sc_bulk_algorithm_t *alg)
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_bulk_algorithm_t *alg) nogil
     void sc_bulk_bound_nonrefl_soln_3d(
-        sc_mesh_t *msd, sc_bound_t *bcd, sc_bulk_algorithm_t *alg)
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_bulk_algorithm_t *alg) nogil
     void sc_bulk_bound_nonrefl_dsoln_2d(
-        sc_mesh_t *msd, sc_bound_t *bcd, sc_bulk_algorithm_t *alg)
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_bulk_algorithm_t *alg) nogil
     void sc_bulk_bound_nonrefl_dsoln_3d(
-        sc_mesh_t *msd, sc_bound_t *bcd, sc_bulk_algorithm_t *alg)
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_bulk_algorithm_t *alg) nogil
 
 cdef extern from "stdlib.h":
     void* malloc(size_t size)
@@ -81,6 +81,8 @@ cdef class BulkAlgorithm(Mesh):
     """
     def __cinit__(self):
         self._alg = <sc_bulk_algorithm_t *>malloc(sizeof(sc_bulk_algorithm_t))
+        self._alg.mincfl = self._alg.maxcfl = 0.0
+        self._alg.nadjcfl = 0
 
     def __dealloc__(self):
         if NULL != self._alg:
@@ -173,29 +175,42 @@ cdef class BulkAlgorithm(Mesh):
         self._alg.time = time
         self._alg.time_increment = time_increment
 
+    @property
+    def cflstat(self):
+        """
+        Minimum and maximum CFL number and the number of adjusted CFL number
+        over the non-ghost cells, from the latest :py:meth:`calc_cfl`.
+        """
+        return (self._alg.mincfl, self._alg.maxcfl, self._alg.nadjcfl)
+
     def calc_cfl(self):
-        if self._msd.ndim == 3:
-            sc_bulk_calc_cfl_3d(self._msd, self._alg)
-        else:
-            sc_bulk_calc_cfl_2d(self._msd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_bulk_calc_cfl_3d(self._msd, self._alg)
+            else:
+                sc_bulk_calc_cfl_2d(self._msd, self._alg)
+        return self.cflstat
 
     def calc_solt(self):
-        if self._msd.ndim == 3:
-            sc_bulk_calc_solt_3d(self._msd, self._alg)
-        else:
-            sc_bulk_calc_solt_2d(self._msd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_bulk_calc_solt_3d(self._msd, self._alg)
+            else:
+                sc_bulk_calc_solt_2d(self._msd, self._alg)
 
     def calc_soln(self):
-        if self._msd.ndim == 3:
-            sc_bulk_calc_soln_3d(self._msd, self._alg)
-        else:
-            sc_bulk_calc_soln_2d(self._msd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_bulk_calc_soln_3d(self._msd, self._alg)
+            else:
+                sc_bulk_calc_soln_2d(self._msd, self._alg)
 
     def calc_dsoln(self):
-        if self._msd.ndim == 3:
-            sc_bulk_calc_dsoln_3d(self._msd, self._alg)
-        else:
-            sc_bulk_calc_dsoln_2d(self._msd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_bulk_calc_dsoln_3d(self._msd, self._alg)
+            else:
+                sc_bulk_calc_dsoln_2d(self._msd, self._alg)
 
     def ghostgeom_mirror(self, Bound bcd):
         if self._msd.ndim == 3:
@@ -204,15 +219,17 @@ cdef class BulkAlgorithm(Mesh):
             sc_bulk_ghostgeom_mirror_2d(self._msd, bcd._bcd, self._alg)
 
     def bound_nonrefl_soln(self, Bound bcd):
-        if self._msd.ndim == 3:
-            sc_bulk_bound_nonrefl_soln_3d(self._msd, bcd._bcd, self._alg)
-        else:
-            sc_bulk_bound_nonrefl_soln_2d(self._msd, bcd._bcd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_bulk_bound_nonrefl_soln_3d(self._msd, bcd._bcd, self._alg)
+            else:
+                sc_bulk_bound_nonrefl_soln_2d(self._msd, bcd._bcd, self._alg)
 
     def bound_nonrefl_dsoln(self, Bound bcd):
-        if self._msd.ndim == 3:
-            sc_bulk_bound_nonrefl_dsoln_3d(self._msd, bcd._bcd, self._alg)
-        else:
-            sc_bulk_bound_nonrefl_dsoln_2d(self._msd, bcd._bcd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_bulk_bound_nonrefl_dsoln_3d(self._msd, bcd._bcd, self._alg)
+            else:
+                sc_bulk_bound_nonrefl_dsoln_2d(self._msd, bcd._bcd, self._alg)
 
 # vim: set fenc=utf8 ft=pyrex ff=unix ai et sw=4 ts=4 tw=79:
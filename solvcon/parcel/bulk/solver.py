@@ -51,7 +51,7 @@ class BulkSolver(solver.MeshSolver):
     <._algorithm.BulkAlgorithm>`.
     """
 
-    _interface_init_ = ['cecnd', 'cevol', 'sfmrc']
+    _interface_init_ = ['cecnd', 'cevol']
     _solution_array_ = ['solt', 'sol', 'soln', 'dsol', 'dsoln']
 
     def __init__(self, blk, **kw):
@@ -224,6 +224,25 @@ class BulkSolver(solver.MeshSolver):
 
     @_MMNAMES.register
     def calccfl(self, worker=None):
+        """
+        >>> # create a valid solver as the test fixture.
+        >>> from solvcon import testing
+        >>> from . import material
+        >>> blk = testing.create_trivial_2d_blk()
+        >>> blk.shclgrp.fill(0)
+        >>> blk.grpnames.append('blank')
+        >>> svrkw = dict(p0=1.0, rho0=1.0, fluids=[material.fluids.air])
+        >>> svr = BulkSolver(blk, **svrkw)
+        >>> svr.init()
+        >>> svr.provide()
+        >>> svr.alg.update(0.0, 1.e-3)
+        >>> # the statistics are reduced over the non-ghost cells.
+        >>> svr.calccfl()
+        >>> ocfl = svr.ocfl[svr.ngstcell:]
+        >>> nadjcfl = (svr.cfl[svr.ngstcell:] == 1).sum()
+        >>> svr.alg.cflstat == (ocfl.min(), ocfl.max(), nadjcfl)
+        True
+        """
         self._debug_check_array('sol', 'dsol')
         self.alg.calc_cfl()
         self._debug_check_array('cfl', 'ocfl', 'soln', 'dsoln')
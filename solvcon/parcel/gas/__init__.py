@@ -35,7 +35,7 @@ The following example shows the content of this module:
 
 >>> from solvcon.parcel import gas
 >>> len(gas.__all__)
-16
+18
 >>> [getattr(gas, nm) for nm in gas.__all__] # doctest: +NORMALIZE_WHITESPACE +ELLIPSIS
 [<class 'solvcon.parcel.gas.case.GasCase'>,
  <bound method ....register_arrangement of
@@ -52,7 +52,9 @@ The following example shows the content of this module:
  <class 'solvcon.parcel.gas.inout.ProgressHook'>,
  <class 'solvcon.parcel.gas.inout.FillAnchor'>,
  <class 'solvcon.parcel.gas.inout.CflHook'>,
+ <class 'solvcon.parcel.gas.inout.TimeStepHook'>,
  <class 'solvcon.parcel.gas.inout.PMarchSave'>,
+ <class 'solvcon.parcel.gas.inout.MultiRateHook'>,
  <class 'solvcon.parcel.gas.oblique_shock.ObliqueShockRelation'>]
 """
 
@@ -97,7 +99,8 @@ _include(names=['GasBC', 'GasNonrefl', 'GasWall', 'GasInlet'],
 _include(names=['ProbeHook'], frommod='.probe')
 _include(names=['DensityInitAnchor', 'PhysicsAnchor'], frommod='.physics')
 _include(names=['MeshInfoHook', 'ProgressHook', 'FillAnchor', 'CflHook',
-                'PMarchSave'], frommod='.inout')
+                'TimeStepHook', 'PMarchSave', 'MultiRateHook'],
+         frommod='.inout')
 _include(names=['ObliqueShockRelation'], frommod='.oblique_shock')
 
 # vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
@@ -35,6 +35,9 @@ cdef public:
         # c-tau scheme.
         int alpha
         double sigma0, taylor, cnbfac, sftfac, taumin, tauscale
+        # subset of cells to be calculated; NULL for all cells.
+        int nclsub
+        int *clsub
         # metric array.
         double *cecnd
         double *cevol
@@ -58,9 +61,14 @@ cdef public:
         double *stm
         double *cfl
         double *ocfl
+        # CFL statistics of the non-ghost cells from the latest calculation.
+        double mincfl, maxcfl
+        int nadjcfl
 
 from solvcon.mesh cimport Mesh
 cdef class GasAlgorithm(Mesh):
     cdef sc_gas_algorithm_t *_alg
+    cdef object _clsub
+    cdef int _cltpn
 
 # vim: set fenc=utf8 ft=pyrex ff=unix ai et sw=4 ts=4 tw=79:
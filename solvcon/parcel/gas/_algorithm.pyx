@@ -55,6 +55,16 @@ cdef extern:
         double gasconst,
         double *vel, double *vor, double *vorm, double *rho, double *pre,
         double *tem, double *ken, double *sos, double *mac)
+    void sc_gas_process_derived_2d(sc_mesh_t *msd, sc_gas_algorithm_t *alg,
+        double gasconst,
+        double *vel, double *vor, double *vorm, double *rho, double *pre,
+        double *tem, double *ken, double *sos, double *mac,
+        double *rhog, double *prhogmax)
+    void sc_gas_process_derived_3d(sc_mesh_t *msd, sc_gas_algorithm_t *alg,
+        double gasconst,
+        double *vel, double *vor, double *vorm, double *rho, double *pre,
+        double *tem, double *ken, double *sos, double *mac,
+        double *rhog, double *prhogmax)
     ## Schlieren data processing.
     void sc_gas_process_schlieren_rhog_2d(
         sc_mesh_t *msd, sc_gas_algorithm_t *alg, double *rhog)
@@ -66,15 +76,28 @@ cdef extern:
     void sc_gas_process_schlieren_sch_3d(
         sc_mesh_t *msd, sc_gas_algorithm_t *alg,
         double k, double k0, double k1, double rhogmax, double *sch)
-    # algorithm calculators.
-    void sc_gas_calc_cfl_2d(sc_mesh_t *msd, sc_gas_algorithm_t *alg)
-    void sc_gas_calc_cfl_3d(sc_mesh_t *msd, sc_gas_algorithm_t *alg)
-    void sc_gas_calc_solt_2d(sc_mesh_t *msd, sc_gas_algorithm_t *alg)
-    void sc_gas_calc_solt_3d(sc_mesh_t *msd, sc_gas_algorithm_t *alg)
-    void sc_gas_calc_soln_2d(sc_mesh_t *msd, sc_gas_algorithm_t *alg)
-    void sc_gas_calc_soln_3d(sc_mesh_t *msd, sc_gas_algorithm_t *alg)
-    void sc_gas_calc_dsoln_2d(sc_mesh_t *msd, sc_gas_algorithm_t *alg)
-    void sc_gas_calc_dsoln_3d(sc_mesh_t *msd, sc_gas_algorithm_t *alg)
+    # algorithm calculators; they release the GIL for threaded marching.
+    void sc_gas_calc_cfl_2d(sc_mesh_t *msd, sc_gas_algorithm_t *alg) nogil
+    void sc_gas_calc_cfl_3d(sc_mesh_t *msd, sc_gas_algorithm_t *alg) nogil
+    void sc_gas_calc_solt_2d(sc_mesh_t *msd, sc_gas_algorithm_t *alg) nogil
+    void sc_gas_calc_solt_3d(sc_mesh_t *msd, sc_gas_algorithm_t *alg) nogil
+    void sc_gas_calc_soln_2d(sc_mesh_t *msd, sc_gas_algorithm_t *alg) nogil
+    void sc_gas_calc_soln_3d(sc_mesh_t *msd, sc_gas_algorithm_t *alg) nogil
+    void sc_gas_calc_soln_2d_quad(
+        sc_mesh_t *msd, sc_gas_algorithm_t *alg) nogil
+    void sc_gas_calc_soln_2d_tri(sc_mesh_t *msd, sc_gas_algorithm_t *alg) nogil
+    void sc_gas_calc_soln_3d_hex(sc_mesh_t *msd, sc_gas_algorithm_t *alg) nogil
+    void sc_gas_calc_soln_3d_tet(sc_mesh_t *msd, sc_gas_algorithm_t *alg) nogil
+    void sc_gas_calc_dsoln_2d(sc_mesh_t *msd, sc_gas_algorithm_t *alg) nogil
+    void sc_gas_calc_dsoln_3d(sc_mesh_t *msd, sc_gas_algorithm_t *alg) nogil
+    void sc_gas_calc_dsoln_2d_quad(
+        sc_mesh_t *msd, sc_gas_algorithm_t *alg) nogil
+    void sc_gas_calc_dsoln_2d_tri(
+        sc_mesh_t *msd, sc_gas_algorithm_t *alg) nogil
+    void sc_gas_calc_dsoln_3d_hex(
+        sc_mesh_t *msd, sc_gas_algorithm_t *alg) nogil
+    void sc_gas_calc_dsoln_3d_tet(
+        sc_mesh_t *msd, sc_gas_algorithm_t *alg) nogil
     # ghost information calculators.
     void sc_gas_ghostgeom_mirror_2d(
         sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg)
@@ -83,31 +106,50 @@ cdef extern:
     # boundary-condition treaters.
     ## non-reflective.
     void sc_gas_bound_nonrefl_soln_2d(
-        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg)
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg) nogil
     void sc_gas_bound_nonrefl_soln_3d(
-        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg)
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg) nogil
     void sc_gas_bound_nonrefl_dsoln_2d(
-        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg)
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg) nogil
     void sc_gas_bound_nonrefl_dsoln_3d(
-        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg)
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg) nogil
     ## wall.
     void sc_gas_bound_wall_soln_2d(
-        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg)
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg) nogil
     void sc_gas_bound_wall_soln_3d(
-        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg)
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg) nogil
     void sc_gas_bound_wall_dsoln_2d(
-        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg)
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg) nogil
     void sc_gas_bound_wall_dsoln_3d(
-        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg)
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg) nogil
     ## inlet.
     void sc_gas_bound_inlet_soln_2d(
-        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg)
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg) nogil
     void sc_gas_bound_inlet_soln_3d(
-        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg)
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg) nogil
     void sc_gas_bound_inlet_dsoln_2d(
-        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg)
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg) nogil
     void sc_gas_bound_inlet_dsoln_3d(
-        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg)
+        sc_mesh_t *msd, sc_bound_t *bcd, sc_gas_algorithm_t *alg) nogil
+
+
+cdef double *_derived_ptr(sc_mesh_t *msd, arr, int width) except? NULL:
+    """
+    Check and return the data pointer of an output array for
+    :py:meth:`GasAlgorithm.process_derived`.  NULL is returned for None.
+    """
+    cdef cnp.ndarray _arr
+    if arr is None:
+        return NULL
+    _arr = arr
+    assert _arr.dtype == np.float64
+    assert _arr.flags.c_contiguous
+    assert msd.ncell + msd.ngstcell == _arr.shape[0]
+    if width:
+        assert 2 == _arr.ndim and width == _arr.shape[1]
+    else:
+        assert 1 == _arr.ndim
+    return <double *>_arr.data
 
 
 cdef class GasAlgorithm(Mesh):
@@ -116,6 +158,12 @@ cdef class GasAlgorithm(Mesh):
     """
     def __cinit__(self):
         self._alg = <sc_gas_algorithm_t *>malloc(sizeof(sc_gas_algorithm_t))
+        self._alg.mincfl = self._alg.maxcfl = 0.0
+        self._alg.nadjcfl = 0
+        self._alg.nclsub = 0
+        self._alg.clsub = NULL
+        self._clsub = None
+        self._cltpn = 0
 
     def __dealloc__(self):
         if NULL != self._alg:
@@ -136,11 +184,33 @@ cdef class GasAlgorithm(Mesh):
         self._alg.sftfac = svr.sftfac
         self._alg.taumin = svr.taumin
         self._alg.tauscale = svr.tauscale
+        # element shape for specialized kernels.
+        self._setup_shape(svr)
         # arrays.
         self._setup_cese_metrics(svr)
         self._setup_parameters(svr)
         self._setup_solutions(svr)
 
+    def _setup_shape(self, svr):
+        # quadrilateral, triangle, hexahedron, and tetrahedron have
+        # specialized kernels.
+        cltpn = svr.blk.cltpn
+        self._cltpn = 0
+        if not svr.specialize_shape:
+            return
+        if len(cltpn) and (cltpn == cltpn[0]).all() and \
+           cltpn[0] in (2, 3, 4, 5):
+            self._cltpn = cltpn[0]
+
+    @property
+    def cltpn(self):
+        """
+        The cell type the specialized kernels are selected for, or 0 when the
+        generic kernels are used, i.e., the mesh mixes shapes or the solver
+        turns off :py:attr:`~.solver.GasSolver.specialize_shape`.
+        """
+        return self._cltpn
+
     def _setup_cese_metrics(self, svr):
         self._alg.cecnd = <double*>self._get_table_bodyaddr(svr.tbcecnd)
         self._alg.cevol = <double*>self._get_table_bodyaddr(svr.tbcevol)
@@ -169,6 +239,31 @@ cdef class GasAlgorithm(Mesh):
         self._alg.cfl = <double*>self._get_table_bodyaddr(svr.tbcfl)
         self._alg.ocfl = <double*>self._get_table_bodyaddr(svr.tbocfl)
 
+    def set_cell_subset(self, clsub):
+        """
+        Restrict :py:meth:`calc_solt`, :py:meth:`calc_soln`,
+        :py:meth:`calc_cfl`, and :py:meth:`calc_dsoln` to the cells listed in
+        *clsub*.  Ghost cells are negative indices.  ``None`` restores the
+        calculation for all cells.
+        """
+        cdef cnp.ndarray[int, ndim=1, mode="c"] _clsub
+        if clsub is None:
+            self._alg.nclsub = 0
+            self._alg.clsub = NULL
+            self._clsub = None
+        else:
+            nclsub = len(clsub)
+            # pad one element so that an empty subset doesn't become NULL.
+            _clsub = np.zeros(max(nclsub, 1), dtype='int32')
+            _clsub[:nclsub] = clsub
+            if nclsub:
+                assert _clsub[:nclsub].min() >= -self._msd.ngstcell
+                assert _clsub[:nclsub].max() < self._msd.ncell
+            # keep the array alive while the pointer is in use.
+            self._clsub = _clsub
+            self._alg.nclsub = nclsub
+            self._alg.clsub = &_clsub[0]
+
     def locate_point(self, crd):
         # FIXME: Blindly taking an ndarray object is dangerous.  Use a local C
         # array instead.
@@ -219,6 +314,37 @@ cdef class GasAlgorithm(Mesh):
                 self._msd, self._alg, _gasconst, &_v[0,0], &_w[0,0], &_wm[0],
                 &_rho[0], &_p[0], &_T[0], &_ke[0], &_a[0], &_M[0])
 
+    def process_derived(self, gasconst, v=None, w=None, wm=None, rho=None,
+                        p=None, T=None, ke=None, a=None, M=None, rhog=None):
+        """
+        Calculate the requested derived quantities in a single pass over the
+        cells.  Arrays left None are not calculated.
+
+        :return: Maximum magnitude of density gradient over non-ghost cells,
+            or 0 if *rhog* isn't requested.
+        :rtype: float
+        """
+        cdef double _gasconst = gasconst
+        cdef double rhogmax = 0.0
+        cdef int ndim = self._msd.ndim
+        cdef double *_v = _derived_ptr(self._msd, v, ndim)
+        cdef double *_w = _derived_ptr(self._msd, w, ndim)
+        cdef double *_wm = _derived_ptr(self._msd, wm, 0)
+        cdef double *_rho = _derived_ptr(self._msd, rho, 0)
+        cdef double *_p = _derived_ptr(self._msd, p, 0)
+        cdef double *_T = _derived_ptr(self._msd, T, 0)
+        cdef double *_ke = _derived_ptr(self._msd, ke, 0)
+        cdef double *_a = _derived_ptr(self._msd, a, 0)
+        cdef double *_M = _derived_ptr(self._msd, M, 0)
+        cdef double *_rhog = _derived_ptr(self._msd, rhog, 0)
+        if ndim == 3:
+            sc_gas_process_derived_3d(self._msd, self._alg, _gasconst,
+                _v, _w, _wm, _rho, _p, _T, _ke, _a, _M, _rhog, &rhogmax)
+        else:
+            sc_gas_process_derived_2d(self._msd, self._alg, _gasconst,
+                _v, _w, _wm, _rho, _p, _T, _ke, _a, _M, _rhog, &rhogmax)
+        return rhogmax
+
     def process_schlieren_rhog(self, sch):
         # FIXME: Refactor this error-prone array address manipulation.
         cdef cnp.ndarray[double, ndim=1, mode="c"] _sch = sch
@@ -228,20 +354,23 @@ cdef class GasAlgorithm(Mesh):
         else:
             sc_gas_process_schlieren_rhog_2d(self._msd, self._alg, &_sch[0])
 
-    def process_schlieren_sch(self, schk, schk0, schk1, sch):
+    def process_schlieren_sch(self, schk, schk0, schk1, sch, rhogmax=None):
         # FIXME: Refactor this error-prone array address manipulation.
         cdef cnp.ndarray[double, ndim=1, mode="c"] _sch = sch
         assert self._msd.ncell + self._msd.ngstcell == _sch.shape[0]
         cdef double _schk = schk
         cdef double _schk0 = schk0
         cdef double _schk1 = schk1
-        cdef double rhogmax = _sch[self._msd.ngstcell:].max()
+        cdef double _rhogmax
+        if rhogmax is None:
+            rhogmax = _sch[self._msd.ngstcell:].max()
+        _rhogmax = rhogmax
         if self._msd.ndim == 3:
             sc_gas_process_schlieren_sch_3d(self._msd, self._alg,
-                _schk, _schk0, _schk1, rhogmax, &_sch[0])
+                _schk, _schk0, _schk1, _rhogmax, &_sch[0])
         else:
             sc_gas_process_schlieren_sch_2d(self._msd, self._alg,
-                _schk, _schk0, _schk1, rhogmax, &_sch[0])
+                _schk, _schk0, _schk1, _rhogmax, &_sch[0])
 
     def prepare_ce(self):
         if self._msd.ndim == 3:
@@ -259,29 +388,58 @@ cdef class GasAlgorithm(Mesh):
         self._alg.time = time
         self._alg.time_increment = time_increment
 
+    @property
+    def cflstat(self):
+        """
+        Minimum and maximum CFL number and the number of adjusted CFL number
+        over the non-ghost cells, from the latest :py:meth:`calc_cfl`.
+        """
+        return (self._alg.mincfl, self._alg.maxcfl, self._alg.nadjcfl)
+
     def calc_cfl(self):
-        if self._msd.ndim == 3:
-            sc_gas_calc_cfl_3d(self._msd, self._alg)
-        else:
-            sc_gas_calc_cfl_2d(self._msd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_gas_calc_cfl_3d(self._msd, self._alg)
+            else:
+                sc_gas_calc_cfl_2d(self._msd, self._alg)
+        return self.cflstat
 
     def calc_solt(self):
-        if self._msd.ndim == 3:
-            sc_gas_calc_solt_3d(self._msd, self._alg)
-        else:
-            sc_gas_calc_solt_2d(self._msd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_gas_calc_solt_3d(self._msd, self._alg)
+            else:
+                sc_gas_calc_solt_2d(self._msd, self._alg)
 
     def calc_soln(self):
-        if self._msd.ndim == 3:
-            sc_gas_calc_soln_3d(self._msd, self._alg)
-        else:
-            sc_gas_calc_soln_2d(self._msd, self._alg)
+        with nogil:
+            if self._cltpn == 2:
+                sc_gas_calc_soln_2d_quad(self._msd, self._alg)
+            elif self._cltpn == 3:
+                sc_gas_calc_soln_2d_tri(self._msd, self._alg)
+            elif self._cltpn == 4:
+                sc_gas_calc_soln_3d_hex(self._msd, self._alg)
+            elif self._cltpn == 5:
+                sc_gas_calc_soln_3d_tet(self._msd, self._alg)
+            elif self._msd.ndim == 3:
+                sc_gas_calc_soln_3d(self._msd, self._alg)
+            else:
+                sc_gas_calc_soln_2d(self._msd, self._alg)
 
     def calc_dsoln(self):
-        if self._msd.ndim == 3:
-            sc_gas_calc_dsoln_3d(self._msd, self._alg)
-        else:
-            sc_gas_calc_dsoln_2d(self._msd, self._alg)
+        with nogil:
+            if self._cltpn == 2:
+                sc_gas_calc_dsoln_2d_quad(self._msd, self._alg)
+            elif self._cltpn == 3:
+                sc_gas_calc_dsoln_2d_tri(self._msd, self._alg)
+            elif self._cltpn == 4:
+                sc_gas_calc_dsoln_3d_hex(self._msd, self._alg)
+            elif self._cltpn == 5:
+                sc_gas_calc_dsoln_3d_tet(self._msd, self._alg)
+            elif self._msd.ndim == 3:
+                sc_gas_calc_dsoln_3d(self._msd, self._alg)
+            else:
+                sc_gas_calc_dsoln_2d(self._msd, self._alg)
 
     def ghostgeom_mirror(self, Bound bcd):
         if self._msd.ndim == 3:
@@ -290,39 +448,45 @@ cdef class GasAlgorithm(Mesh):
             sc_gas_ghostgeom_mirror_2d(self._msd, bcd._bcd, self._alg)
 
     def bound_nonrefl_soln(self, Bound bcd):
-        if self._msd.ndim == 3:
-            sc_gas_bound_nonrefl_soln_3d(self._msd, bcd._bcd, self._alg)
-        else:
-            sc_gas_bound_nonrefl_soln_2d(self._msd, bcd._bcd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_gas_bound_nonrefl_soln_3d(self._msd, bcd._bcd, self._alg)
+            else:
+                sc_gas_bound_nonrefl_soln_2d(self._msd, bcd._bcd, self._alg)
 
     def bound_nonrefl_dsoln(self, Bound bcd):
-        if self._msd.ndim == 3:
-            sc_gas_bound_nonrefl_dsoln_3d(self._msd, bcd._bcd, self._alg)
-        else:
-            sc_gas_bound_nonrefl_dsoln_2d(self._msd, bcd._bcd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_gas_bound_nonrefl_dsoln_3d(self._msd, bcd._bcd, self._alg)
+            else:
+                sc_gas_bound_nonrefl_dsoln_2d(self._msd, bcd._bcd, self._alg)
 
     def bound_wall_soln(self, Bound bcd):
-        if self._msd.ndim == 3:
-            sc_gas_bound_wall_soln_3d(self._msd, bcd._bcd, self._alg)
-        else:
-            sc_gas_bound_wall_soln_2d(self._msd, bcd._bcd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_gas_bound_wall_soln_3d(self._msd, bcd._bcd, self._alg)
+            else:
+                sc_gas_bound_wall_soln_2d(self._msd, bcd._bcd, self._alg)
 
     def bound_wall_dsoln(self, Bound bcd):
-        if self._msd.ndim == 3:
-            sc_gas_bound_wall_dsoln_3d(self._msd, bcd._bcd, self._alg)
-        else:
-            sc_gas_bound_wall_dsoln_2d(self._msd, bcd._bcd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_gas_bound_wall_dsoln_3d(self._msd, bcd._bcd, self._alg)
+            else:
+                sc_gas_bound_wall_dsoln_2d(self._msd, bcd._bcd, self._alg)
 
     def bound_inlet_soln(self, Bound bcd):
-        if self._msd.ndim == 3:
-            sc_gas_bound_inlet_soln_3d(self._msd, bcd._bcd, self._alg)
-        else:
-            sc_gas_bound_inlet_soln_2d(self._msd, bcd._bcd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_gas_bound_inlet_soln_3d(self._msd, bcd._bcd, self._alg)
+            else:
+                sc_gas_bound_inlet_soln_2d(self._msd, bcd._bcd, self._alg)
 
     def bound_inlet_dsoln(self, Bound bcd):
-        if self._msd.ndim == 3:
-            sc_gas_bound_inlet_dsoln_3d(self._msd, bcd._bcd, self._alg)
-        else:
-            sc_gas_bound_inlet_dsoln_2d(self._msd, bcd._bcd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_gas_bound_inlet_dsoln_3d(self._msd, bcd._bcd, self._alg)
+            else:
+                sc_gas_bound_inlet_dsoln_2d(self._msd, bcd._bcd, self._alg)
 
 # vim: set fenc=utf8 ft=pyrex ff=unix ai et sw=4 ts=4 tw=79:
@@ -0,0 +1,79 @@
+/*
+ * Copyright (C) 2014 Yung-Yu Chen <yyc@solvcon.net>
+ *
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ *
+ * - Redistributions of source code must retain the above copyright notice,
+ *   this list of conditions and the following disclaimer.
+ * - Redistributions in binary form must reproduce the above copyright notice,
+ *   this list of conditions and the following disclaimer in the documentation
+ *   and/or other materials provided with the distribution.
+ * - Neither the name of the SOLVCON nor the names of its contributors may be
+ *   used to endorse or promote products derived from this software without
+ *   specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ * ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+ * LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+ * CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+ * SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+ * INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+ * CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ * ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ * POSSIBILITY OF SUCH DAMAGE.
+ */
+
+/*
+ * Constants for kernels specialized to a single element shape.  Define
+ * SC_CLTPN to the cell type (see solvcon.block.elemtype) before including
+ * this file and a kernel body; leave it undefined for the generic kernel.
+ * The file has no include guard on purpose.
+ *
+ * SC_CLNFC: number of faces of a cell.
+ * SC_FCNND: number of nodes of a face.
+ * SC_GGE0, SC_GGE1: range of the GGE definition in ggefcs.
+ * SC_GAS_SHAPED(name): name of the specialized function.
+ */
+
+#undef SC_CLNFC
+#undef SC_FCNND
+#undef SC_GGE0
+#undef SC_GGE1
+#undef SC_GAS_SHAPED
+
+#ifdef SC_CLTPN
+#if SC_CLTPN == 2 // quadrilateral.
+#define SC_CLNFC 4
+#define SC_FCNND 2
+#define SC_GGE0 0
+#define SC_GGE1 4
+#define SC_GAS_SHAPED(name) name ## _2d_quad
+#elif SC_CLTPN == 3 // triangle.
+#define SC_CLNFC 3
+#define SC_FCNND 2
+#define SC_GGE0 4
+#define SC_GGE1 7
+#define SC_GAS_SHAPED(name) name ## _2d_tri
+#elif SC_CLTPN == 4 // hexahedron.
+#define SC_CLNFC 6
+#define SC_FCNND 4
+#define SC_GGE0 7
+#define SC_GGE1 15
+#define SC_GAS_SHAPED(name) name ## _3d_hex
+#elif SC_CLTPN == 5 // tetrahedron.
+#define SC_CLNFC 4
+#define SC_FCNND 3
+#define SC_GGE0 15
+#define SC_GGE1 19
+#define SC_GAS_SHAPED(name) name ## _3d_tet
+#else
+#error "no specialized kernel for the cell type"
+#endif
+#endif // SC_CLTPN
+
+// vim: set ft=c ts=4 et:
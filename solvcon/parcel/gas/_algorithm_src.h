@@ -44,12 +44,16 @@ void sc_gas_calc_jaco_2d(sc_mesh_t *msd, sc_gas_algorithm_t *alg,
     int icl, double fcn[NEQ][NDIM], double jacos[NEQ][NEQ][NDIM]);
 void sc_gas_calc_dif_2d(sc_mesh_t *msd, sc_gas_algorithm_t *alg,
     int icl, double difs[NEQ][NDIM]);
+void sc_gas_calc_sfmrc_2d(sc_mesh_t *msd,
+    int icl, int ifl, double sfmrc[FCMND][2][NDIM]);
 #undef NDIM
 #define NDIM 3
 void sc_gas_calc_jaco_3d(sc_mesh_t *msd, sc_gas_algorithm_t *alg,
     int icl, double fcn[NEQ][NDIM], double jacos[NEQ][NEQ][NDIM]);
 void sc_gas_calc_dif_3d(sc_mesh_t *msd, sc_gas_algorithm_t *alg,
     int icl, double difs[NEQ][NDIM]);
+void sc_gas_calc_sfmrc_3d(sc_mesh_t *msd,
+    int icl, int ifl, double sfmrc[FCMND][2][NDIM]);
 
 // vim: set ft=c ts=4 et:
 #endif // __SC_GAS__ALGORITHM_SRC_H__
@@ -36,6 +36,8 @@ Boundary-condition treatments for :py:class:`~.solver.GasSolver`.
 from __future__ import absolute_import, division, print_function
 
 
+import numpy as np
+
 import solvcon as sc
 
 # for readthedocs to work.
@@ -62,6 +64,21 @@ class GasBC(sc.BC):
         self.bcd = self.create_bcd()
         getattr(self.alg, 'ghostgeom_'+self._ghostgeom_)(self.bcd)
 
+    def subset(self, faces):
+        """
+        :param faces: The rows of :py:attr:`~solvcon.boundcond.BC.facn` to
+            keep.
+        :type faces: numpy.ndarray
+        :return: A copy of the BC treating only the selected faces.  The ghost
+            geometry is left to this object.
+        :rtype: GasBC
+        """
+        sub = type(self)(bc=self)
+        sub.facn = np.ascontiguousarray(self.facn[faces])
+        sub.value = np.ascontiguousarray(self.value[faces])
+        sub.bcd = sub.create_bcd()
+        return sub
+
 
 class GasNonrefl(GasBC):
     _ghostgeom_ = 'mirror'
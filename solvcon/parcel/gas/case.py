@@ -58,6 +58,7 @@ class GasCase(sc.MeshCase):
         'solver.taumin': None,
         'solver.tauscale': None,
         # End of c-taw parameters.
+        'solver.recompute_sfmrc': False,
         'io.rootdir': sc.env.projdir, # Different default to MeshCase.
     }
 
@@ -74,6 +75,8 @@ class GasCase(sc.MeshCase):
                     'taumin', 'tauscale',):
             val = self.solver.get(key)
             if val != None: kw[key] = float(val)
+        # memory saving.
+        kw['recompute_sfmrc'] = bool(self.solver.recompute_sfmrc)
         return kw
 
 # vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
@@ -100,6 +100,8 @@ class MeshInfoHook(sc.MeshHook):
         if isinstance(self.cse.execution.npart, int):
             out('  %g Mcells/seconds/computer.\n' % (perf/npart))
             out('  %g Mvariables/seconds/computer.\n' % (perf*neq/npart))
+        # interface communication, if IbcStatHook is used.
+        pf.writelines(sc.IbcStatHook.tabulate(self.cse.execution.marchret))
         pf.close()
 
     def postmarch(self):
@@ -202,13 +204,16 @@ class CflAnchor(sc.MeshAnchor):
         istep = svr.step_global
         rsteps = self.rsteps
         if istep > 0 and istep%rsteps == 0:
-            # download data.
-            ocfl = svr.ocfl[svr.ngstcell:]
-            cfl = svr.cfl[svr.ngstcell:]
-            # determine extremum.
-            mincfl = ocfl.min()
-            maxcfl = ocfl.max()
-            nadj = (cfl==1).sum()
+            if svr.mrclasses is None:
+                # reduced by the kernel.
+                mincfl, maxcfl, nadj = svr.alg.cflstat
+            else:
+                # the kernel only covers the class marched last.
+                ocfl = svr.ocfl[svr.ngstcell:]
+                cfl = svr.cfl[svr.ngstcell:]
+                mincfl = ocfl.min()
+                maxcfl = ocfl.max()
+                nadj = (cfl==1).sum()
             # store.
             lst = svr.marchret.setdefault('cfl', [0.0, 0.0, 0, 0])
             lst[0] = mincfl
@@ -268,6 +273,14 @@ class CflHook(sc.MeshHook):
         else:
             warnings.warn(msg)
 
+    def _check(self, istep, nCFL, xCFL):
+        if self.cflmin != None and nCFL < self.cflmin:
+            self._notify("CFL = %g < %g after step: %d" % (
+                nCFL, self.cflmin, istep))
+        if self.cflmax != None and xCFL >= self.cflmax:
+            self._notify("CFL = %g >= %g after step: %d" % (
+                xCFL, self.cflmax, istep))
+
     def postmarch(self):
         info = self.info
         istep = self.cse.execution.step_current
@@ -289,13 +302,7 @@ class CflHook(sc.MeshHook):
             self.mCFL = self.aCFL/istep
             self.aadj += aadj
             self.haadj += aadj
-            # check.
-            if self.cflmin != None and nCFL < self.cflmin:
-                self._notify("CFL = %g < %g after step: %d" % (
-                    nCFL, self.cflmin, istep))
-            if self.cflmax != None and xCFL >= self.cflmax:
-                self._notify("CFL = %g >= %g after step: %d" % (
-                    xCFL, self.cflmax, istep))
+            self._check(istep, nCFL, xCFL)
             # output information.
             if istep > 0 and istep%psteps == 0:
                 info("CFL = %.2f/%.2f - %.2f/%.2f adjusted: %d/%d/%d\n" % (
@@ -305,10 +312,254 @@ class CflHook(sc.MeshHook):
 
     def postloop(self):
         self.info("Averaged maximum CFL = %g.\n" % self.mCFL)
+
+
+class TimeStepHook(CflHook):
+    """
+    Adjusts :py:attr:`MeshCase.execution.time_increment
+    <solvcon.case.MeshCase>` between strides to drive the maximum CFL number
+    towards :py:attr:`cfltarget`.  The maximum CFL number reduced by
+    :py:class:`CflAnchor` is proportional to the time increment used for
+    computing it, so the new time increment is obtained by scaling the old one.
+    A maximum CFL number over :py:attr:`cflmax` stops the run only when the
+    time increment cannot be reduced, e.g., at :py:attr:`dtmin`.  Overrides
+    (i) :py:meth:`~solvcon.hook.MeshHook.postmarch` and (ii)
+    :py:meth:`~solvcon.hook.MeshHook.postloop` methods.
+
+    Pair with :py:class:`CflAnchor`.
+    """
+
+    def __init__(self, cse, cfltarget=0.9, relax=0.5, growmax=1.2,
+                 shrinkmin=0.1, dtmin=0.0, dtmax=None, **kw):
+        """
+        >>> from solvcon.case import MeshCase
+        >>> hok = TimeStepHook(MeshCase(), psteps=1)
+        >>> hok.rsteps
+        1
+        >>> TimeStepHook(MeshCase(), psteps=1, cfltarget=1.0)
+        Traceback (most recent call last):
+            ...
+        ValueError: cfltarget = 1 must be in (0, cflmax = 1)
+        >>> TimeStepHook(MeshCase(), psteps=1, relax=0.0)
+        Traceback (most recent call last):
+            ...
+        ValueError: relax = 0 must be in (0, 1]
+        """
+        #: Target of the maximum CFL number.
+        self.cfltarget = float(cfltarget)
+        #: Relaxation factor for increasing the time increment.  ``1.0`` jumps
+        #: directly to the target while smaller values smooth the growth.
+        self.relax = float(relax)
+        #: Maximum ratio of growth of the time increment per adjustment.
+        self.growmax = float(growmax)
+        #: Minimum ratio of reduction of the time increment per adjustment.
+        self.shrinkmin = float(shrinkmin)
+        #: Lower bound of the time increment.
+        self.dtmin = float(dtmin)
+        #: Upper bound of the time increment.  ``None`` means no bound.
+        self.dtmax = dtmax
+        #: History of adjustment.  Each entry is a :py:class:`list` of the
+        #: step, the time, the time increment used, and the maximum CFL.
+        self.history = list()
+        super(TimeStepHook, self).__init__(cse, **kw)
+        if self.cflmax is not None and not \
+           0.0 < self.cfltarget < self.cflmax:
+            raise ValueError('cfltarget = %g must be in (0, cflmax = %g)' % (
+                self.cfltarget, self.cflmax))
+        if not 0.0 < self.relax <= 1.0:
+            raise ValueError('relax = %g must be in (0, 1]' % self.relax)
+
+    def calc_time_increment(self, dt, xCFL):
+        """
+        :param dt: The time increment that results in *xCFL*.
+        :type dt: float
+        :param xCFL: The maximum CFL number over the whole domain.
+        :type xCFL: float
+        :return: The new time increment.
+        :rtype: float
+
+        Reduction is applied at once for safety, while growth is relaxed:
+
+        >>> from solvcon.case import MeshCase
+        >>> hok = TimeStepHook(MeshCase(), psteps=1, cfltarget=0.8)
+        >>> round(hok.calc_time_increment(1.0, 1.6), 8)
+        0.5
+        >>> round(hok.calc_time_increment(1.0, 0.7), 8)
+        1.07142857
+        >>> round(hok.calc_time_increment(1.0, 0.1), 8)
+        1.1
+        >>> round(hok.calc_time_increment(1.0, 100.0), 8)
+        0.1
+
+        The time increment is kept when the CFL number is invalid:
+
+        >>> hok.calc_time_increment(1.0, float('nan'))
+        1.0
+        >>> hok.calc_time_increment(1.0, 0.0)
+        1.0
+        """
+        if np.isnan(xCFL) or xCFL <= 0.0:
+            return dt
+        ratio = self.cfltarget / xCFL
+        ratio = max(min(ratio, self.growmax), self.shrinkmin)
+        if ratio > 1.0:
+            ratio = 1.0 + self.relax*(ratio-1.0)
+        dt *= ratio
+        dt = max(dt, self.dtmin)
+        if self.dtmax is not None:
+            dt = min(dt, self.dtmax)
+        return dt
+
+    def _check(self, istep, nCFL, xCFL):
+        # postmarch has just reduced the time increment if the CFL number is
+        # too large.
+        reduced = (bool(self.history) and
+                   self.cse.execution.time_increment < self.history[-1][2])
+        if self.cflmin != None and nCFL < self.cflmin:
+            self._notify("CFL = %g < %g after step: %d" % (
+                nCFL, self.cflmin, istep))
+        if self.cflmax != None and xCFL >= self.cflmax and not reduced:
+            self._notify("CFL = %g >= %g after step: %d" % (
+                xCFL, self.cflmax, istep))
+
+    def postmarch(self):
+        mr = self.cse.execution.marchret
+        isp = self.cse.is_parallel
+        # CflAnchor only reports when it evaluates CFL.
+        fresh = 'cfl' in mr[0] if isp else 'cfl' in mr
+        # adjust before the bounds are checked.
+        if fresh:
+            xCFL = max([m['cfl'][1] for m in mr]) if isp else mr['cfl'][1]
+            dt = self.cse.execution.time_increment
+            self.history.append([self.cse.execution.step_current,
+                                 self.cse.execution.time, dt, xCFL])
+            self.cse.execution.time_increment = self.calc_time_increment(
+                dt, xCFL)
+        super(TimeStepHook, self).postmarch()
+
+    def postloop(self):
+        super(TimeStepHook, self).postloop()
+        if not self.history:
+            return
+        dts = np.array(self.history, dtype='float64')[:,2]
+        self.info("Time increment = %g/%g/%g (min/mean/max) in %d "
+                  "adjustments.\n" % (dts.min(), dts.mean(), dts.max(),
+                                      len(dts)))
+        dtfn = '%s_%s_dt.npy' % (self.cse.io.basefn, self.name)
+        dtfn = os.path.join(self.cse.io.basedir, dtfn)
+        np.save(dtfn, np.array(self.history, dtype='float64'))
 # End CFL evaluation.
 ################################################################################
 
 
+################################################################################
+# Begin multi-rate marching.
+class MultiRateAnchor(sc.MeshAnchor):
+    """
+    Groups cells into power-of-two time-step classes by their CFL numbers and
+    turns on multi-rate marching of :py:class:`~.solver.GasSolver`.  The cells
+    are classified before the time-marching loop and reclassified every
+    :py:attr:`rsteps` steps.  Uses :py:attr:`MeshSolver.marchret
+    <solvcon.solver.MeshSolver.marchret>` to return the population of each
+    class.  Overrides (i) :py:meth:`~solvcon.anchor.MeshAnchor.preloop` and
+    (ii) :py:meth:`~solvcon.anchor.MeshAnchor.postmarch` methods.
+
+    Pair with :py:class:`MultiRateHook`.
+    """
+
+    def __init__(self, svr, nclass=None, cflmax=1.0, rsteps=None, **kw):
+        """
+        >>> from solvcon.testing import create_trivial_2d_blk
+        >>> from solvcon.solver import MeshSolver
+        >>> svr = MeshSolver(create_trivial_2d_blk())
+        >>> ank = MultiRateAnchor(svr, nclass=0, rsteps=1)
+        Traceback (most recent call last):
+            ...
+        ValueError: nclass = 0 < 1
+        >>> ank = MultiRateAnchor(svr, nclass=3, rsteps=1)
+        >>> ank.nclass, ank.rsteps
+        (3, 1)
+        """
+        #: Number of time-step classes.
+        self.nclass = int(nclass)
+        if self.nclass < 1:
+            raise ValueError('nclass = %d < 1' % self.nclass)
+        #: CFL number allowed in each class.
+        self.cflmax = float(cflmax)
+        #: Steps to reclassify (:py:class:`int`).
+        self.rsteps = int(rsteps)
+        super(MultiRateAnchor, self).__init__(svr, **kw)
+
+    def _classify(self, cfl):
+        svr = self.svr
+        levels = svr.make_multirate_levels(cfl, self.nclass, self.cflmax)
+        svr.set_multirate(levels, self.nclass)
+
+    def preloop(self):
+        svr = self.svr
+        svr.alg.update(svr.time, svr.time_increment)
+        svr.alg.calc_cfl()
+        self._classify(svr.ocfl[svr.ngstcell:].copy())
+
+    def postmarch(self):
+        svr = self.svr
+        istep = svr.step_global
+        rsteps = self.rsteps
+        if istep > 0 and istep%rsteps == 0:
+            # CFL of a class is evaluated with its own time increment.
+            cfl = svr.ocfl[svr.ngstcell:] * (1 << svr.mrlevels)
+            self._classify(cfl)
+            svr.marchret['multirate'] = np.bincount(
+                svr.mrlevels, minlength=self.nclass).tolist()
+
+
+class MultiRateHook(sc.MeshHook):
+    """
+    Turns on multi-rate marching and reports the population of each
+    time-step class.  :py:attr:`MeshCase.execution.time_increment
+    <solvcon.case.MeshCase>` is the time increment of the coarsest class, and
+    class ``k`` marches with 1/2**k of it.  Overrides
+    :py:meth:`~solvcon.hook.MeshHook.postmarch` method.
+
+    Pair with :py:class:`MultiRateAnchor`.
+    """
+
+    def __init__(self, cse, name='multirate', nclass=2, cflmax=1.0,
+                 rsteps=None, **kw):
+        #: Name of the multi-rate tool.
+        self.name = name
+        #: Number of time-step classes.
+        self.nclass = nclass
+        #: CFL number allowed in each class.
+        self.cflmax = cflmax
+        super(MultiRateHook, self).__init__(cse, **kw)
+        #: Steps to reclassify.
+        self.rsteps = rsteps if rsteps else self.psteps
+        self.ankkw = kw
+
+    def drop_anchor(self, svr):
+        ankkw = self.ankkw.copy()
+        ankkw['name'] = self.name
+        ankkw['nclass'] = self.nclass
+        ankkw['cflmax'] = self.cflmax
+        ankkw['rsteps'] = self.rsteps
+        self._deliver_anchor(svr, MultiRateAnchor, ankkw)
+
+    def postmarch(self):
+        istep = self.cse.execution.step_current
+        mr = self.cse.execution.marchret
+        isp = self.cse.is_parallel
+        if istep > 0 and istep%self.psteps == 0:
+            mr = mr if isp else [mr]
+            counts = [m['multirate'] for m in mr if 'multirate' in m]
+            if counts:
+                counts = np.array(counts).sum(axis=0)
+                self.info("Cells in time-step classes: %s\n" % ' '.join(
+                    ['%d' % cnt for cnt in counts]))
+# End multi-rate marching.
+################################################################################
+
+
 ################################################################################
 # Begin solution output.
 class MarchSaveAnchor(sc.MeshAnchor):
@@ -335,11 +586,17 @@ class MarchSaveAnchor(sc.MeshAnchor):
         #: The template string for the VTK file.
         self.vtkfn_tmpl = vtkfn_tmpl
         super(MarchSaveAnchor, self).__init__(svr, **kw)
+        svr.request_derived(self._dernames, steps=psteps)
+
+    @property
+    def _dernames(self):
+        return [key for key in self.anames if self.anames[key]]
 
     def _write(self, istep):
         ngstcell = self.svr.ngstcell
         sarrs = dict()
         varrs = dict()
+        self.svr.update_derived(self._dernames)
         # collect data.
         for key in self.anames:
             # get the array.
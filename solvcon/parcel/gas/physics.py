@@ -58,13 +58,20 @@ class PhysicsAnchor(sc.MeshAnchor):
     Calculates physical quantities for output.  Implements (i) provide() and
     (ii) postfull() methods.
 
+    Only the quantities requested through
+    :py:meth:`GasSolver.request_derived <.solver.GasSolver.request_derived>`
+    are allocated and calculated, at the steps they are requested for, with a
+    single fused kernel.  When nothing is requested and no *varlist* is given,
+    all the quantities in :py:attr:`_varlist_` are calculated every *rsteps*.
+
     FIXME: I should be more integrated with :py:class:`~.solver.GasSolver`.
 
     :ivar gasconst: gas constant.
     :type gasconst: float
     """
 
-    _varlist_ = ['v', 'rho', 'p', 'T', 'ke', 'a', 'M', 'sch']
+    _varlist_ = ['v', 'w', 'wm', 'rho', 'p', 'T', 'ke', 'a', 'M', 'sch']
+    _vector_ = ('v', 'w')
 
     def __init__(self, svr, **kw):
         self.rsteps = kw.pop('rsteps', 1)
@@ -72,45 +79,78 @@ class PhysicsAnchor(sc.MeshAnchor):
         self.schk = kw.pop('schk', 1.0)
         self.schk0 = kw.pop('schk0', 0.0)
         self.schk1 = kw.pop('schk1', 1.0)
+        #: Quantities always calculated every *rsteps*.  ``None`` means all
+        #: of :py:attr:`_varlist_` if nothing is requested from the solver.
+        self.varlist = kw.pop('varlist', None)
         super(PhysicsAnchor, self).__init__(svr, **kw)
-
-    def _calculate_physics(self):
+        #: The step each quantity was last calculated at.
+        self.fresh = dict()
+
+    def _schedule(self):
+        """
+        :return: Pairs of the name and the step intervals to calculate it.
+        :rtype: list
+        """
+        requests = self.svr.derived_requests
+        varlist = self.varlist
+        if varlist is None:
+            varlist = [] if requests else self._varlist_
+        schedule = dict((name, set(requests[name])) for name in requests
+                        if name in self._varlist_)
+        for name in varlist:
+            schedule.setdefault(name, set()).add(self.rsteps)
+        return sorted(schedule.items())
+
+    def _allocate(self, names):
         svr = self.svr
         der = svr.der
-        svr.alg.process_physics(
-            self.gasconst, der['v'], der['w'], der['wm'],
-            der['rho'], der['p'], der['T'], der['ke'], der['a'], der['M'])
-
-    def _calculate_schlieren(self):
-        from ctypes import byref, c_double
+        nelm = svr.ngstcell + svr.ncell
+        for name in names:
+            if name in der:
+                continue
+            if name in self._vector_:
+                der[name] = np.zeros((nelm, svr.ndim), dtype='float64')
+            else:
+                der[name] = np.zeros(nelm, dtype='float64')
+
+    def _calculate(self, names):
         svr = self.svr
-        sch = svr.der['sch']
-        svr.alg.process_schlieren_rhog(sch)
-        svr.alg.process_schlieren_sch(self.schk, self.schk0, self.schk1, sch)
+        der = svr.der
+        self._allocate(names)
+        arrs = dict((name, der[name]) for name in names)
+        sch = arrs.pop('sch', None)
+        rhogmax = svr.alg.process_derived(self.gasconst, rhog=sch, **arrs)
+        if sch is not None:
+            svr.alg.process_schlieren_sch(
+                self.schk, self.schk0, self.schk1, sch, rhogmax=rhogmax)
+        for name in names:
+            self.fresh[name] = svr.step_global
+
+    def update(self, names):
+        """
+        Calculate the specified quantities that are not yet calculated at the
+        current step.
+
+        :param names: Names of the quantities.
+        :type names: sequence of str
+        :return: Nothing.
+        """
+        istep = self.svr.step_global
+        names = [name for name in names if name in self._varlist_
+                 and self.fresh.get(name) != istep]
+        if names:
+            self._calculate(names)
 
     def provide(self):
-        svr = self.svr
-        der = svr.der
-        nelm = svr.ngstcell + svr.ncell
-        der['v'] = np.zeros((nelm, svr.ndim), dtype='float64')
-        der['w'] = np.zeros((nelm, svr.ndim), dtype='float64')
-        der['wm'] = np.zeros(nelm, dtype='float64')
-        der['rho'] = np.zeros(nelm, dtype='float64')
-        der['p'] = np.zeros(nelm, dtype='float64')
-        der['T'] = np.zeros(nelm, dtype='float64')
-        der['ke'] = np.zeros(nelm, dtype='float64')
-        der['a'] = np.zeros(nelm, dtype='float64')
-        der['M'] = np.zeros(nelm, dtype='float64')
-        der['sch'] = np.zeros(nelm, dtype='float64')
-        self._calculate_physics()
-        self._calculate_schlieren()
+        self.svr.derived_updater = self.update
+        #: Pairs of the name and the step intervals to calculate it.
+        self.schedule = self._schedule()
+        self.update([name for name, intvs in self.schedule])
 
     def postfull(self):
-        svr = self.svr
         istep = self.svr.step_global
-        rsteps = self.rsteps
-        if istep > 0 and istep%rsteps == 0:
-            self._calculate_physics()
-            self._calculate_schlieren()
+        if istep > 0:
+            self.update([name for name, intvs in self.schedule
+                         if any(istep%intv == 0 for intv in intvs)])
 
 # vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
@@ -41,19 +41,115 @@ import solvcon as sc
 
 class Probe(object):
     """
-    Represent a point in the mesh.
+    Represent a point in the mesh.  The samples are rows of ``[time, v1, v2,
+    ...]`` kept in a preallocated array.  Rows taken by :py:meth:`take` make
+    room for new ones; when the array is full of rows not taken, they are
+    spilled to a ``.npy`` chunk if :py:attr:`spillfn` is set, otherwise the
+    array grows.
     """
 
+    #: Default number of samples held in memory.
+    CAPACITY = 4096
+
     def __init__(self, *args, **kw):
         self.speclst = kw.pop('speclst')
         self.name = kw.pop('name', None)
+        #: Number of rows of the sample array.
+        self.capacity = kw.pop('capacity', self.CAPACITY)
+        #: Template (with an integer format) for the names of the spilled
+        #: chunks.  ``None`` keeps all samples in memory.
+        self.spillfn = kw.pop('spillfn', None)
         self.crd = np.array(args, dtype='float64')
         self.pcl = -1
-        self.vals = list()
+        #: The sample array; only the first :py:attr:`nbuf` rows are valid.
+        self.buf = np.empty((0, 1+len(self.speclst)), dtype='float64')
+        #: Number of samples in :py:attr:`buf`.
+        self.nbuf = 0
+        #: Number of samples in :py:attr:`buf` taken by :py:meth:`take`.
+        self.ntaken = 0
+        #: File names of the spilled chunks.
+        self.spills = list()
+        #: Number of samples in the spilled chunks.
+        self.nspilled = 0
 
     def __str__(self):
         crds = ','.join(['%g'%val for val in self.crd])
-        return 'Pt/%s#%d(%s)%d' % (self.name, self.pcl, crds, len(self.vals))
+        return 'Pt/%s#%d(%s)%d' % (self.name, self.pcl, crds, self.nsample)
+
+    @property
+    def nsample(self):
+        return self.nspilled + self.nbuf
+
+    @property
+    def vals(self):
+        """
+        All the samples kept, including the spilled ones, as an array.
+        """
+        chunks = [np.load(fn) for fn in self.spills]
+        chunks.append(self.buf[:self.nbuf])
+        return np.concatenate(chunks)
+
+    def _reserve(self):
+        """
+        Make sure there is room for at least one more row.
+        """
+        if self.nbuf < len(self.buf):
+            return
+        if len(self.buf) == 0:
+            self.buf = np.empty((self.capacity, self.buf.shape[1]),
+                                dtype='float64')
+        elif self.ntaken:
+            # drop the taken rows.
+            nleft = self.nbuf - self.ntaken
+            self.buf[:nleft] = self.buf[self.ntaken:self.nbuf]
+            self.nbuf = nleft
+            self.ntaken = 0
+        elif self.spillfn is not None:
+            fn = self.spillfn % len(self.spills)
+            np.save(fn, self.buf[:self.nbuf])
+            self.spills.append(fn)
+            self.nspilled += self.nbuf
+            self.nbuf = 0
+        else:
+            buf = np.empty((2*len(self.buf), self.buf.shape[1]),
+                           dtype='float64')
+            buf[:self.nbuf] = self.buf[:self.nbuf]
+            self.buf = buf
+
+    def extend(self, rows):
+        """
+        Append sample rows.
+        """
+        irow = 0
+        while irow < len(rows):
+            self._reserve()
+            nrow = min(len(self.buf)-self.nbuf, len(rows)-irow)
+            self.buf[self.nbuf:self.nbuf+nrow] = rows[irow:irow+nrow]
+            self.nbuf += nrow
+            irow += nrow
+
+    def take(self):
+        """
+        :return: The samples not taken before.
+        :rtype: numpy.ndarray
+        """
+        rows = self.buf[self.ntaken:self.nbuf].copy()
+        self.ntaken = self.nbuf
+        return rows
+
+    def save(self, fn):
+        """
+        Save all the samples to a ``.npy`` file, which then replaces the
+        spilled chunks.
+        """
+        vals = self.vals
+        np.save(fn, vals)
+        for spill in self.spills:
+            if spill != fn and os.path.exists(spill):
+                os.unlink(spill)
+        self.spills = [fn]
+        self.nspilled = len(vals)
+        self.nbuf = self.ntaken = 0
 
     def locate_cell(self, svr):
         icl, ifl, jcl, jfl = svr.alg.locate_point(self.crd)
@@ -61,7 +157,10 @@ class Probe(object):
 
     def __call__(self, svr, time):
         ngstcell = svr.ngstcell
-        vlist = [time]
+        self._reserve()
+        row = self.buf[self.nbuf]
+        row[0] = time
+        it = 1
         for spec in self.speclst:
             arr = None
             if isinstance(spec, str):
@@ -74,13 +173,14 @@ class Probe(object):
                     arr = svr.sol[:,spec]
             if arr is None:
                 raise IndexError('spec %s incorrect'%str(spec))
-            vlist.append(arr[ngstcell+self.pcl])
-        self.vals.append(vlist)
+            row[it] = arr[ngstcell+self.pcl]
+            it += 1
+        self.nbuf += 1
 
 
 class ProbeAnchor(sc.MeshAnchor):
     """
-    Anchor for probe.
+    Anchor for probe.  Only the points located in the block are sampled.
     """
 
     def __init__(self, svr, **kw):
@@ -90,53 +190,133 @@ class ProbeAnchor(sc.MeshAnchor):
             pkw = {'speclst': speclst, 'name': data[0]}
             self.points.append(Probe(*data[1:], **pkw))
         super(ProbeAnchor, self).__init__(svr, **kw)
+        #: Names of the derived quantities to sample.
+        self.dernames = [spec for spec in speclst if isinstance(spec, str)]
+        svr.request_derived(self.dernames, steps=1)
+
+    @property
+    def pcls(self):
+        """
+        The located cell of each point; negative if not in the block.
+        """
+        return [point.pcl for point in self.points]
+
+    def take(self, ipts):
+        """
+        :return: The new samples of the specified points.
+        :rtype: list
+        """
+        return [self.points[ipt].take() for ipt in ipts]
+
+    def release(self, ipts):
+        """
+        Stop sampling the specified points, which are owned by another block.
+        """
+        for ipt in ipts:
+            self.points[ipt].pcl = -1
+
+    def _sample(self):
+        self.svr.update_derived(self.dernames)
+        for point in self.points:
+            if point.pcl >= 0:
+                point(self.svr, self.svr.time)
 
     def preloop(self):
         for point in self.points: point.locate_cell(self.svr)
-        for point in self.points: point(self.svr, self.svr.time)
+        self._sample()
 
     def postfull(self):
-        for point in self.points: point(self.svr, self.svr.time)
+        self._sample()
 
 
 class ProbeHook(sc.MeshHook):
     """
-    Point probe.
+    Point probe.  The new samples of a point are pulled from the solver owning
+    it every *psteps*, and kept in :py:attr:`points`, which spill to ``.npy``
+    chunks beyond *capacity* samples.
     """
 
     def __init__(self, cse, **kw):
         self.name = kw.pop('name', 'ppank')
+        self.capacity = kw.pop('capacity', Probe.CAPACITY)
         super(ProbeHook, self).__init__(cse, **kw)
         self.ankkw = kw
+        #: Collected points located in the mesh.
         self.points = None
+        #: Pairs of the owning solver index and the point indices it owns.
+        self.owners = None
+        self._ptmap = None
 
     def drop_anchor(self, svr):
         ankkw = self.ankkw.copy()
         ankkw['name'] = self.name
         self._deliver_anchor(svr, ProbeAnchor, ankkw)
 
+    def _ptfn(self, point):
+        ptfn = '%s_pt_%s_%s.npy' % (
+            self.cse.io.basefn, self.name, point.name)
+        return os.path.join(self.cse.io.basedir, ptfn)
+
+    def _setup(self, allpcls):
+        """
+        Decide the owner of each point from the located cells in all solvers,
+        and create the points to collect into.
+
+        :return: The point indices not owned, for each solver.
+        :rtype: list
+        """
+        speclst = self.ankkw['speclst']
+        owned = [list() for pcls in allpcls]
+        released = [list() for pcls in allpcls]
+        self.points = list()
+        self._ptmap = dict()
+        for ipt, data in enumerate(self.ankkw['coords']):
+            owner = None
+            for isvr, pcls in enumerate(allpcls):
+                if pcls[ipt] < 0:
+                    continue
+                if owner is None:
+                    owner = isvr
+                    owned[isvr].append(ipt)
+                else:
+                    released[isvr].append(ipt)
+            if owner is None:
+                continue
+            point = Probe(*data[1:], speclst=speclst, name=data[0],
+                          capacity=self.capacity)
+            point.pcl = allpcls[owner][ipt]
+            point.spillfn = self._ptfn(point)[:-4] + '_%04d.npy'
+            self.points.append(point)
+            self._ptmap[ipt] = point
+        self.owners = [(isvr, ipts) for isvr, ipts in enumerate(owned) if ipts]
+        return released
+
     def _collect(self):
         cse = self.cse
         if cse.is_parallel:
-            dom = cse.solver.domainobj
             dealer = cse.solver.dealer
-            allpoints = list()
-            for iblk in range(dom.nblk):
-                dealer[iblk].cmd.pullank(self.name, 'points', with_worker=True)
-                allpoints.append(dealer[iblk].recv())
-            npt = len(allpoints[0])
-            points = [None]*npt
-            for rpoints in allpoints:
-                ipt = 0
-                while ipt < npt:
-                    if points[ipt] == None and rpoints[ipt].pcl >=0:
-                        points[ipt] = rpoints[ipt]
-                    ipt += 1
+            if self.owners is None:
+                for sdw in dealer:
+                    sdw.cmd.pullank(self.name, 'pcls', with_worker=True)
+                released = self._setup([sdw.recv() for sdw in dealer])
+                for sdw, ipts in zip(dealer, released):
+                    if ipts:
+                        sdw.cmd.pullank(self.name, 'release', callargs=(ipts,),
+                                        with_worker=True)
+                        sdw.recv()
+            # ask all the owners at once.
+            for isvr, ipts in self.owners:
+                dealer[isvr].cmd.pullank(self.name, 'take', callargs=(ipts,),
+                                         with_worker=True)
+            allrows = [dealer[isvr].recv() for isvr, ipts in self.owners]
         else:
-            svr = self.cse.solver.solverobj
-            points = [pt for pt in svr.runanchors[self.name].points
-                if pt.pcl >= 0]
-        self.points = points
+            ank = self.cse.solver.solverobj.runanchors[self.name]
+            if self.owners is None:
+                self._setup([ank.pcls])
+            allrows = [ank.take(ipts) for isvr, ipts in self.owners]
+        for (isvr, ipts), rows in zip(self.owners, allrows):
+            for ipt, arr in zip(ipts, rows):
+                self._ptmap[ipt].extend(arr)
 
     def postmarch(self):
         psteps = self.psteps
@@ -146,10 +326,8 @@ class ProbeHook(sc.MeshHook):
         return True
 
     def postloop(self):
+        self._collect()
         for point in self.points:
-            ptfn = '%s_pt_%s_%s.npy' % (
-                self.cse.io.basefn, self.name, point.name)
-            ptfn = os.path.join(self.cse.io.basedir, ptfn)
-            np.save(ptfn, np.array(point.vals, dtype='float64'))
+            point.save(self._ptfn(point))
 
 # vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
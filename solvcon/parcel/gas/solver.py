@@ -49,7 +49,7 @@ class GasSolver(sc.MeshSolver):
     Spatial loops for the gas-dynamics solver.
     """
 
-    _interface_init_ = ('cecnd', 'cevol', 'sfmrc')
+    _interface_init_ = ('cecnd', 'cevol')
     _solution_array_ = ('solt', 'sol', 'soln', 'dsol', 'dsoln')
 
     def __init__(self, blk, **kw):
@@ -74,6 +74,31 @@ class GasSolver(sc.MeshSolver):
         self.neq = blk.ndim + 2
         super(GasSolver, self).__init__(blk, **kw)
         self.substep_run = 2
+        # multi-rate marching; see set_multirate().
+        self.mrsolt = None
+        self.mrsolb = None
+        self.mrsoltb = None
+        self.mrtimeb = None
+        #: The class of every cell including the ghost cells.  Those of the
+        #: ghost cells of interfaces come from the related blocks.
+        self.mrcllevels = None
+        #: Ghost cells of interfaces in each class, and those bordering each
+        #: class from the coarser classes.
+        self.mrgclasses = None
+        self.mrghalos = None
+        #: Non-interface BCs restricted to the boundary faces of each class.
+        self.mrbclists = None
+        # the classes of the interface ghost cells need an exchange.
+        self._mrexchange = False
+        #: Derived quantities in :py:attr:`der
+        #: <solvcon.solver.MeshSolver.der>` requested by output, mapping the
+        #: names to the sets of step intervals to update them.  An empty set
+        #: means the quantity is updated only on demand.  See
+        #: :py:meth:`request_derived`.
+        self.derived_requests = dict()
+        #: Callable taking a sequence of names to bring the derived
+        #: quantities up to date; set by :py:class:`.physics.PhysicsAnchor`.
+        self.derived_updater = None
         ndim = blk.ndim
         ncell = blk.ncell
         ngstcell = blk.ngstcell
@@ -87,11 +112,19 @@ class GasSolver(sc.MeshSolver):
         self.taumin = float(kw.pop('taumin', 0.0))
         self.tauscale = float(kw.pop('tauscale', 1.0))
         # dual mesh.
+        #: Do not store the sub-face metric but recalculate it in
+        #: :py:meth:`calcsoln`.  Trades arithmetic for the memory of
+        #: ``CLMFC*FCMND*2*ndim`` doubles per cell.
+        self.recompute_sfmrc = bool(kw.pop('recompute_sfmrc', False))
+        #: Use the kernels specialized for the cell type when the mesh has a
+        #: single type.  ``False`` forces the generic kernels.
+        self.specialize_shape = bool(kw.pop('specialize_shape', True))
         self.tbcecnd = sc.Table(ngstcell, ncell, blk.CLMFC+1, ndim,
                                 dtype=fpdtype)
         self.tbcevol = sc.Table(ngstcell, ncell, blk.CLMFC+1, dtype=fpdtype)
-        self.tbsfmrc = sc.Table(0, ncell, blk.CLMFC, blk.FCMND, 2, ndim,
-                                dtype=fpdtype)
+        # an empty table leaves a NULL pointer to the algorithm.
+        self.tbsfmrc = sc.Table(0, 0 if self.recompute_sfmrc else ncell,
+                                blk.CLMFC, blk.FCMND, 2, ndim, dtype=fpdtype)
         # parameters.
         self.grpda = np.empty((self.ngroup, 1), dtype=fpdtype)
         nsca = kw.pop('nsca', 1)
@@ -108,7 +141,7 @@ class GasSolver(sc.MeshSolver):
         self.tbstm = sc.Table(ngstcell, ncell, neq, dtype=fpdtype)
         self.tbcfl = sc.Table(ngstcell, ncell, dtype=fpdtype)
         self.tbocfl = sc.Table(ngstcell, ncell, dtype=fpdtype)
-        for name in (self._interface_init_ + ('amsca', 'amvec')
+        for name in (self._interface_init_ + ('sfmrc', 'amsca', 'amvec')
                    + self._solution_array_ + ('stm', 'cfl', 'ocfl')):
             setattr(self, name, getattr(self, 'tb'+name).F)
         # algorithm object.
@@ -131,8 +164,9 @@ class GasSolver(sc.MeshSolver):
         super(GasSolver, self).init(**kw)
         self._debug_check_array('soln', 'dsoln')
         # prepare sub-face metric data.
-        self.sfmrc.fill(0.0)
-        self.alg.prepare_sf()
+        if not self.recompute_sfmrc:
+            self.sfmrc.fill(0.0)
+            self.alg.prepare_sf()
         self._debug_check_array('sfmrc')
 
     def provide(self):
@@ -149,6 +183,173 @@ class GasSolver(sc.MeshSolver):
         self.call_non_interface_bc('soln')
         self.call_non_interface_bc('dsoln')
 
+    ###########################################################################
+    # Begin derived quantities.
+    def request_derived(self, names, steps=None):
+        """
+        Declare the derived quantities needed by an output and the interval
+        in step to need them.
+
+        >>> from solvcon.testing import create_trivial_2d_blk
+        >>> blk = create_trivial_2d_blk()
+        >>> blk.clgrp.fill(0)
+        >>> blk.grpnames.append('blank')
+        >>> svr = GasSolver(blk)
+        >>> svr.request_derived(['rho', 'p'], steps=10)
+        >>> svr.request_derived(['p'], steps=1)
+        >>> svr.request_derived(['M'])
+        >>> sorted((k, sorted(v)) for k, v in svr.derived_requests.items())
+        [('M', []), ('p', [1, 10]), ('rho', [10])]
+
+        :param names: Names of the quantities.
+        :type names: sequence of str
+        :param steps: Interval in step; ``None`` for on-demand update through
+            :py:meth:`update_derived`.
+        :type steps: int
+        :return: Nothing.
+        """
+        for name in names:
+            intvs = self.derived_requests.setdefault(name, set())
+            if steps:
+                intvs.add(int(steps))
+
+    def update_derived(self, names):
+        """
+        Bring the specified derived quantities up to date before reading them.
+        Nothing is done if no :py:attr:`derived_updater` is set.
+
+        :param names: Names of the quantities.
+        :type names: sequence of str
+        :return: Nothing.
+        """
+        if self.derived_updater is not None:
+            self.derived_updater(names)
+    # End derived quantities.
+    ###########################################################################
+
+    ###########################################################################
+    # Begin multi-rate marching.
+    def set_multirate(self, levels, nclass):
+        super(GasSolver, self).set_multirate(levels, nclass)
+        if self.mrclasses is None:
+            self.mrsolt = self.mrsolb = self.mrsoltb = self.mrtimeb = None
+            self.mrcllevels = self.mrgclasses = self.mrghalos = None
+            self.mrbclists = None
+            self._mrexchange = False
+            return
+        # cells for calc_solt: the class, its halo, and all ghost cells.
+        ghosts = np.arange(-self.ngstcell, 0, dtype='int32')
+        self.mrsolt = [np.concatenate([ghosts, halo, cls])
+                       for cls, halo in zip(self.mrclasses, self.mrhalos)]
+        # solution of each cell at the beginning of its class step.
+        if self.mrsolb is None:
+            self.mrsolb = self.soln.copy()
+            self.mrsoltb = self.solt.copy()
+        self.mrtimeb = np.zeros(nclass, dtype='float64')
+        self.mrtimeb.fill(self.time)
+        # a ghost cell takes the class of the body cell it borders, until the
+        # classes of the interface ghost cells are exchanged.
+        ngstcell = self.ngstcell
+        bndfcs = self.blk.bndfcs[:,0]
+        icl = self.blk.fccls[bndfcs,0]
+        jcl = self.blk.fccls[bndfcs,1]
+        self.mrcllevels = np.empty(ngstcell+self.ncell, dtype='int32')
+        self.mrcllevels[ngstcell:] = levels
+        self.mrcllevels[jcl+ngstcell] = levels[icl]
+        self._set_multirate_ghosts()
+        self._mrexchange = True
+        # the BCs only update the ghost cells of the marching class.
+        self.mrbclists = list()
+        for iclass in range(nclass):
+            bclist = list()
+            for bc in self.bclist:
+                if isinstance(bc, sc.boundcond.interface):
+                    continue
+                faces = np.flatnonzero(
+                    self.mrlevels[self.blk.fccls[bc.facn[:,0],0]] == iclass)
+                if faces.shape[0]:
+                    bclist.append(bc.subset(faces))
+            self.mrbclists.append(bclist)
+
+    def _set_multirate_ghosts(self):
+        """
+        Find the ghost cells of interfaces of each class and those bordering
+        each class from the coarser classes.
+        """
+        ngstcell = self.ngstcell
+        gst = list()
+        icl = list()
+        for bc in self.bclist:
+            if isinstance(bc, sc.boundcond.interface):
+                gst.append(bc.rclp[:,0])
+                icl.append(bc.rclp[:,2])
+        gst = np.concatenate(gst+[np.empty(0, dtype='int32')])
+        icl = np.concatenate(icl+[np.empty(0, dtype='int32')])
+        glevels = self.mrcllevels[gst+ngstcell]
+        ilevels = self.mrlevels[icl]
+        self.mrgclasses = list()
+        self.mrghalos = list()
+        for iclass in range(self.mrnclass):
+            self.mrgclasses.append(
+                np.unique(gst[glevels == iclass]).astype('int32'))
+            self.mrghalos.append(np.unique(
+                gst[(ilevels == iclass) & (glevels < iclass)]).astype('int32'))
+
+    def _march_multirate(self, time_current, time_increment, worker):
+        """
+        Exchange the classes of the interface ghost cells after the cells are
+        reclassified, and then march as :py:meth:`MeshSolver._march_multirate
+        <solvcon.solver.MeshSolver._march_multirate>` does.
+        """
+        if worker and self._mrexchange:
+            self.exchangeibc('mrcllevels', worker=worker)
+            self._set_multirate_ghosts()
+        self._mrexchange = False
+        return super(GasSolver, self)._march_multirate(
+            time_current, time_increment, worker)
+
+    def begin_multirate_class(self, iclass, time):
+        cells = np.concatenate([self.mrgclasses[iclass],
+                                self.mrclasses[iclass]]) + self.ngstcell
+        self.mrsolb[cells] = self.soln[cells]
+        self.mrsoltb[cells] = self.solt[cells]
+        self.mrtimeb[iclass] = time
+        self.alg.set_cell_subset(self.mrclasses[iclass])
+
+    def end_multirate_step(self):
+        self.alg.set_cell_subset(None)
+
+    def _interpolate_multirate(self):
+        """
+        Set the solution of the cells bordering the marching class from the
+        coarser classes, including the ghost cells of interfaces, by Taylor
+        expansion in time.
+        """
+        halo = np.concatenate([self.mrghalos[self.mrclass_current],
+                               self.mrhalos[self.mrclass_current]])
+        if not halo.shape[0]:
+            return
+        halo = halo + self.ngstcell
+        tau = self.time - self.mrtimeb[self.mrcllevels[halo]]
+        self.sol[halo] = self.mrsolb[halo] + tau[:,None]*self.mrsoltb[halo]
+
+    def _call_marching_bc(self, name):
+        """
+        Call the non-interface BCs of the marching class, or all of them
+        outside multi-rate marching.
+        """
+        if self.mrclass_current is None:
+            self.call_non_interface_bc(name)
+            return
+        for bc in self.mrbclists[self.mrclass_current]:
+            try:
+                getattr(bc, name)()
+            except Exception as e:
+                e.args = tuple([str(bc), name] + list(e.args))
+                raise
+    # End multi-rate marching.
+    ###########################################################################
+
     ###########################################################################
     # Begin marching algorithm.
     _MMNAMES = sc.MeshSolver.new_method_list()
@@ -159,12 +360,19 @@ class GasSolver(sc.MeshSolver):
         self.alg.update(self.time, self.time_increment)
         self.sol[:,:] = self.soln[:,:]
         self.dsol[:,:,:] = self.dsoln[:,:,:]
+        if self.mrclass_current is not None:
+            self._interpolate_multirate()
         self._debug_check_array('sol', 'dsol')
 
     @_MMNAMES.register
     def calcsolt(self, worker=None):
         self._debug_check_array('sol', 'dsol')
-        self.alg.calc_solt()
+        if self.mrclass_current is None:
+            self.alg.calc_solt()
+        else:
+            self.alg.set_cell_subset(self.mrsolt[self.mrclass_current])
+            self.alg.calc_solt()
+            self.alg.set_cell_subset(self.mrclasses[self.mrclass_current])
         self._debug_check_array('solt')
 
     @_MMNAMES.register
@@ -182,7 +390,7 @@ class GasSolver(sc.MeshSolver):
     @_MMNAMES.register
     def bcsoln(self, worker=None):
         self._debug_check_array('sol', 'dsol')
-        self.call_non_interface_bc('soln')
+        self._call_marching_bc('soln')
         if self.debug:
             self._debug_check_array('soln', 'dsoln')
             self._debug_check_array(self.soln[self.ngstcell:,0]<=0)
@@ -206,7 +414,7 @@ class GasSolver(sc.MeshSolver):
     @_MMNAMES.register
     def bcdsoln(self, worker=None):
         self._debug_check_array('sol', 'dsol')
-        self.call_non_interface_bc('dsoln')
+        self._call_marching_bc('dsoln')
         if self.debug:
             self._debug_check_array('soln', 'dsoln')
             self._debug_check_array(self.soln[self.ngstcell:,0]<=0)
@@ -67,4 +67,26 @@ const int ggerng[8][2] = {
 #define NDIM 3
 #include "sc_gas_calc_dsoln.c_body"
 
+// specialized for meshes of a single element shape.
+#undef NDIM
+#define NDIM 2
+#define SC_CLTPN 2
+#include "_algorithm_shape.h"
+#include "sc_gas_calc_dsoln.c_body"
+#undef SC_CLTPN
+#define SC_CLTPN 3
+#include "_algorithm_shape.h"
+#include "sc_gas_calc_dsoln.c_body"
+#undef NDIM
+#define NDIM 3
+#undef SC_CLTPN
+#define SC_CLTPN 4
+#include "_algorithm_shape.h"
+#include "sc_gas_calc_dsoln.c_body"
+#undef SC_CLTPN
+#define SC_CLTPN 5
+#include "_algorithm_shape.h"
+#include "sc_gas_calc_dsoln.c_body"
+#undef SC_CLTPN
+
 // vim: set ts=4 et:
@@ -13,4 +13,155 @@ class TestGasCase(unittest.TestCase):
             return blk
         cse = case.GasCase(mesher=mesher)
 
+def create_oblique_case(**kw):
+    """
+    Create a case of the supersonic flow over a wedge in oblique.neu.
+    """
+    import solvcon as sc
+    from solvcon.io.gambit import GambitNeutral
+    from .. import inout, physics
+    bcmap = {
+        'wall': (sc.bctregy.GasWall, {}),
+        'farfield': (sc.bctregy.GasNonrefl, {}),
+        'inlet': (sc.bctregy.GasInlet, {
+            'rho': 1.0, 'v1': 2.0, 'v2': 0.0, 'p': 1.0, 'gamma': 1.4}),
+        'outlet': (sc.bctregy.GasNonrefl, {}),
+    }
+    def mesher(cse):
+        neu = GambitNeutral(testing.loadfile('oblique.neu'))
+        return neu.toblock(bcname_mapper=cse.condition.bcmap)
+    cse = case.GasCase(mesher=mesher, bcmap=bcmap, **kw)
+    cse.info.muted = True
+    cse.defer(inout.FillAnchor, mappers={
+        'soln': 1.e-200, 'dsoln': 0.0, 'amsca': 1.4})
+    cse.defer(physics.DensityInitAnchor, rho=1.0)
+    return cse
+
+class TestTimeStepHook(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+        self.basedir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.basedir)
+
+    def _run(self, time_increment, **kw):
+        from .. import inout
+        cse = create_oblique_case(basefn='timestep', basedir=self.basedir,
+                                  time_increment=time_increment, steps_run=4)
+        cse.defer(inout.TimeStepHook, psteps=1, cfltarget=0.5, **kw)
+        cse.init()
+        cse.run()
+        return [hok for hok in cse.runhooks
+                if isinstance(hok, inout.TimeStepHook)][0]
+
+    def test_shrink_over_cflmax(self):
+        # the first time increment is too large, but the hook reduces it
+        # instead of stopping with the default fullstop.
+        hok = self._run(0.2)
+        dts = [row[2] for row in hok.history]
+        xcfls = [row[3] for row in hok.history]
+        self.assertTrue(xcfls[0] >= 1.0)
+        self.assertTrue(dts[1] < dts[0])
+        self.assertTrue(xcfls[-1] < 1.0)
+
+    def test_stop_at_dtmin(self):
+        # the time increment cannot be reduced below dtmin.
+        self.assertRaises(RuntimeError, self._run, 0.2, dtmin=0.2)
+
+class TestThreaded(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+        self.basedir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.basedir)
+
+    def _run(self, threaded):
+        import solvcon as sc
+        arrs = dict()
+        class CollectHook(sc.MeshHook):
+            def postloop(self):
+                for name in ('soln', 'dsoln'):
+                    arrs[name] = self._collect_interior(name)
+        # the worker processes load the sub-blocks from files.
+        cse = create_oblique_case(
+            basefn='threaded', basedir=self.basedir,
+            domaintype=sc.Collective, npart=2, threaded=threaded,
+            scratchdir=None if threaded else self.basedir,
+            time_increment=2.e-3, steps_run=10)
+        cse.runhooks.append(CollectHook)
+        cse.init()
+        cse.run()
+        return arrs
+
+    def test_same_as_processes(self):
+        import numpy as np
+        arrs0 = self._run(False)
+        arrs1 = self._run(True)
+        for name in ('soln', 'dsoln'):
+            self.assertTrue(np.array_equal(arrs0[name], arrs1[name]), name)
+
+class TestIbcStat(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+        self.basedir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.basedir)
+
+    def test_exchange(self):
+        import solvcon as sc
+        nstep = 4
+        cse = create_oblique_case(
+            basefn='ibcstat', basedir=self.basedir,
+            domaintype=sc.Collective, npart=2, threaded=True,
+            time_increment=2.e-3, steps_run=nstep)
+        cse.runhooks.append(sc.IbcStatHook, psteps=nstep)
+        cse.init()
+        cse.run()
+        stats = sorted([mr['ibcstat'] for mr in cse.execution.marchret],
+                       key=lambda st: st['svrn'])
+        self.assertEqual([0, 1], [st['svrn'] for st in stats])
+        stat0, stat1 = stats[0]['stat'], stats[1]['stat']
+        self.assertEqual(sorted(name for peer, name in stat0),
+                         sorted(name for peer, name in stat1))
+        self.assertTrue(all(1 == peer for peer, name in stat0))
+        self.assertTrue(all(0 == peer for peer, name in stat1))
+        for peer, name in stat0:
+            nsend, bsend, nrecv, brecv, tsend, trecv = stat0[peer, name]
+            # what is sent by one end of the interface is received by the
+            # other.
+            self.assertEqual([nrecv, brecv, nsend, bsend],
+                             stat1[0, name][:4])
+            self.assertEqual((nsend, bsend), (nrecv, brecv))
+            self.assertTrue(tsend >= 0.0 and trecv >= 0.0)
+        # the solutions are exchanged in the preparation and in each of the
+        # two half steps, in the same size as the prepared arrays.
+        for name, pname in (('soln', 'sol'), ('dsoln', 'dsol')):
+            nsend, bsend = stat0[1, name][:2]
+            self.assertEqual(2*nstep+1, nsend)
+            self.assertEqual(1, stat0[1, pname][0])
+            self.assertEqual(nsend*stat0[1, pname][1], bsend)
+        # the report.
+        lines = sc.IbcStatHook.tabulate(cse.execution.marchret, nhot=2)
+        self.assertEqual(8, len(lines))
+        self.assertEqual('Interface communication (hottest 2):\n', lines[0])
+        self.assertEqual(['blk', 'peer', 'array', 'msgs', 'sent(B)',
+                          'recv(B)', 'wait(s)'], lines[1].split())
+        for line in lines[2:4]:
+            blk, peer, name, msgs, sent, recv = line.split()[:6]
+            svrn = int(blk)
+            self.assertEqual(1-svrn, int(peer))
+            nsend, bsend, nrecv, brecv = stats[svrn]['stat'][1-svrn, name][:4]
+            self.assertEqual((nsend+nrecv, bsend, brecv),
+                             (int(msgs), int(sent), int(recv)))
+        self.assertEqual(['blk', 'march(s)', 'wait(s)', 'share'],
+                         lines[4].split())
+        self.assertEqual(['0', '1'], [line.split()[0] for line in lines[5:7]])
+        self.assertTrue(lines[7].startswith('  critical path: block '))
+
 # vim: set ff=unix fenc=utf8 nobomb et sw=4 ts=4 tw=79:
@@ -0,0 +1,54 @@
+import unittest
+
+import numpy as np
+
+from solvcon import testing
+
+from .. import solver
+from .. import physics
+
+class TestPhysicsAnchor(unittest.TestCase):
+    def _make_solver(self):
+        blk = testing.create_trivial_2d_blk()
+        blk.clgrp.fill(0)
+        blk.grpnames.append('blank')
+        svr = solver.GasSolver(blk)
+        svr.cecnd.fill(0.0)
+        svr.cevol.fill(0.0)
+        svr.alg.prepare_ce()
+        svr.amsca.fill(1.4)
+        svr.soln.fill(0.0)
+        svr.soln[:,0] = 1.0
+        svr.soln[:,1] = np.arange(svr.soln.shape[0])
+        svr.soln[:,3] = 10.0
+        svr.dsoln.fill(0.0)
+        svr.dsoln[:,0,:] = 0.5
+        return svr
+
+    def test_requested(self):
+        svr = self._make_solver()
+        svr.request_derived(['rho', 'M'], steps=2)
+        svr.runanchors.append(physics.PhysicsAnchor)
+        svr.runanchors('provide')
+        self.assertEqual(['M', 'rho'], sorted(svr.der))
+        # allocated lazily on demand.
+        svr.update_derived(['sch'])
+        self.assertEqual(['M', 'rho', 'sch'], sorted(svr.der))
+
+    def test_fused(self):
+        svr = self._make_solver()
+        ank = physics.PhysicsAnchor(svr)
+        svr.runanchors.append(ank)
+        svr.runanchors('provide')
+        nelm = svr.ngstcell + svr.ncell
+        names = ['v', 'w', 'wm', 'rho', 'p', 'T', 'ke', 'a', 'M']
+        arrs = dict((name, np.zeros((nelm, 2) if name in 'vw' else nelm))
+                    for name in names + ['sch'])
+        svr.alg.process_physics(1.0, *[arrs[name] for name in names])
+        svr.alg.process_schlieren_rhog(arrs['sch'])
+        svr.alg.process_schlieren_sch(1.0, 0.0, 1.0, arrs['sch'])
+        self.assertEqual(sorted(arrs), sorted(svr.der))
+        for name in arrs:
+            self.assertTrue(np.allclose(arrs[name], svr.der[name]), name)
+
+# vim: set ff=unix fenc=utf8 nobomb et sw=4 ts=4 tw=79:
@@ -0,0 +1,156 @@
+# -*- coding: UTF-8 -*-
+#
+# Copyright (c) 2014, Yung-Yu Chen <yyc@solvcon.net>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+
+from __future__ import absolute_import, division, print_function
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import solvcon as sc
+
+from .. import probe
+
+class TestProbe(unittest.TestCase):
+    def _rows(self, start, stop):
+        return np.arange(start*3, stop*3, dtype='float64').reshape((-1, 3))
+
+    def test_take(self):
+        pt = probe.Probe(0.0, 0.0, speclst=['rho', 'p'], capacity=4)
+        pt.extend(self._rows(0, 3))
+        self.assertEqual(self._rows(0, 3).tolist(), pt.take().tolist())
+        self.assertEqual((0, 3), pt.take().shape)
+        # taken rows make room before the array grows.
+        pt.extend(self._rows(3, 8))
+        self.assertEqual(self._rows(3, 8).tolist(), pt.take().tolist())
+        self.assertEqual(8, len(pt.buf))
+
+    def test_spill(self):
+        tdir = tempfile.mkdtemp()
+        try:
+            pt = probe.Probe(0.0, 0.0, speclst=['rho', 'p'], capacity=4,
+                             spillfn=os.path.join(tdir, 'pt_%04d.npy'))
+            pt.extend(self._rows(0, 10))
+            self.assertEqual(2, len(pt.spills))
+            self.assertEqual(4, len(pt.buf))
+            self.assertEqual(10, pt.nsample)
+            self.assertEqual(self._rows(0, 10).tolist(), pt.vals.tolist())
+            ptfn = os.path.join(tdir, 'pt.npy')
+            pt.save(ptfn)
+            self.assertEqual(['pt.npy'], os.listdir(tdir))
+            self.assertEqual(self._rows(0, 10).tolist(),
+                             np.load(ptfn).tolist())
+            self.assertEqual(self._rows(0, 10).tolist(), pt.vals.tolist())
+        finally:
+            shutil.rmtree(tdir)
+
+class TestProbeHook(unittest.TestCase):
+    COORDS = (('a', -0.95, 0.11), ('b', 0.26, 0.55), ('out', 5.0, 5.0))
+
+    def setUp(self):
+        self.basedir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.basedir)
+
+    def _create_case(self, **kw):
+        from .test_case import create_oblique_case
+        cse = create_oblique_case(basefn='probe', basedir=self.basedir,
+                                  time_increment=2.e-3, **kw)
+        cse.defer(probe.ProbeHook, name='pt', psteps=2, speclst=[0, 1],
+                  coords=self.COORDS, capacity=2)
+        return cse
+
+    def test_owner(self):
+        hok = probe.ProbeHook(self._create_case(), psteps=1, speclst=[0],
+                              coords=self.COORDS)
+        # point 0 is located by both solvers, point 1 by the second one,
+        # and point 2 by none.
+        released = hok._setup([[5, -1, -1], [7, 3, -1]])
+        self.assertEqual([(0, [0]), (1, [1])], hok.owners)
+        self.assertEqual([[], [0]], released)
+        self.assertEqual(['a', 'b'], [pt.name for pt in hok.points])
+        self.assertEqual([5, 3], [pt.pcl for pt in hok.points])
+
+    def test_release(self):
+        from solvcon.testing import create_trivial_2d_blk
+        from solvcon.solver import MeshSolver
+        class DummySolver(MeshSolver):
+            def request_derived(self, names, steps=None):
+                pass
+        svr = DummySolver(create_trivial_2d_blk())
+        ank = probe.ProbeAnchor(svr, speclst=[0], coords=self.COORDS)
+        for point, pcl in zip(ank.points, (0, 1, -1)):
+            point.pcl = pcl
+        ank.release([0])
+        self.assertEqual([-1, 1, -1], ank.pcls)
+
+    def test_serial(self):
+        steps_run = 5
+        cse = self._create_case(steps_run=steps_run)
+        cse.init()
+        ank = cse.solver.solverobj.runanchors['pt']
+        hok = [hok for hok in cse.runhooks
+               if isinstance(hok, probe.ProbeHook)][0]
+        ntaken = list()
+        class TakenHook(sc.MeshHook):
+            # the samples in the anchor not taken by the probe hook.
+            def postmarch(self):
+                ntaken.append([pt.nbuf - pt.ntaken for pt in ank.points])
+        cse.runhooks.append(TakenHook)
+        cse.run()
+        # the point outside the mesh is not sampled.
+        self.assertEqual([(0, [0, 1])], hok.owners)
+        self.assertEqual(-1, ank.points[2].pcl)
+        # the samples are taken every 2 steps; the first ones include the
+        # sample in preloop.
+        self.assertEqual([[2, 2, 0], [0, 0, 0], [1, 1, 0], [0, 0, 0],
+                          [1, 1, 0]], ntaken)
+        soln = cse.solver.solverobj.soln
+        ngstcell = cse.solver.solverobj.ngstcell
+        times = 2.e-3 * np.arange(steps_run+1)
+        for point in hok.points:
+            vals = np.load(os.path.join(
+                self.basedir, 'probe_pt_pt_%s.npy' % point.name))
+            self.assertEqual((steps_run+1, 3), vals.shape)
+            self.assertTrue(np.allclose(times, vals[:,0]))
+            self.assertEqual(soln[ngstcell+point.pcl,:2].tolist(),
+                             vals[-1,1:].tolist())
+        # the spilled chunks are consolidated.
+        self.assertEqual(['probe_pt_pt_a.npy', 'probe_pt_pt_b.npy'],
+                         sorted(fn for fn in os.listdir(self.basedir)
+                                if fn.startswith('probe_pt_')))
+
+# vim: set ff=unix fenc=utf8 nobomb et sw=4 ts=4 tw=79:
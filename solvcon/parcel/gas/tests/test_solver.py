@@ -18,4 +18,142 @@ class TestGasSolver(unittest.TestCase):
         svr = solver.GasSolver(blk)
         self.assertEqual(4, svr.neq)
 
+    def test_cflstat(self):
+        import numpy as np
+        from solvcon.io.gambit import GambitNeutral
+        blk = GambitNeutral(testing.loadfile('oblique.neu')).toblock()
+        svr = solver.GasSolver(blk)
+        svr.init()
+        ngstcell = svr.ngstcell
+        rng = np.random.RandomState(0)
+        svr.amsca.fill(1.4)
+        svr.soln[:,0] = 1.0 + rng.rand(svr.soln.shape[0])
+        svr.soln[:,1:3] = rng.rand(svr.soln.shape[0], 2)
+        svr.soln[:,3] = 5.0
+        # null pressure makes the CFL number adjusted to 1.
+        svr.soln[ngstcell::7,3] = 0.0
+        svr.alg.update(0.0, 1.e-3)
+        svr.alg.calc_cfl()
+        ocfl = svr.ocfl[ngstcell:]
+        nadjcfl = (svr.cfl[ngstcell:] == 1).sum()
+        self.assertTrue(nadjcfl > 0)
+        self.assertEqual((ocfl.min(), ocfl.max(), nadjcfl), svr.alg.cflstat)
+
+
+class TestMultiRate(unittest.TestCase):
+    @staticmethod
+    def _make_solver():
+        import solvcon as sc
+        from solvcon.io.gambit import GambitNeutral
+        from .. import case as gcase, inout, physics
+        bcmap = {
+            'wall': (sc.bctregy.GasWall, {}),
+            'farfield': (sc.bctregy.GasNonrefl, {}),
+            'inlet': (sc.bctregy.GasInlet, {
+                'rho': 1.0, 'v1': 2.0, 'v2': 0.0, 'p': 1.0, 'gamma': 1.4}),
+            'outlet': (sc.bctregy.GasNonrefl, {}),
+        }
+        def mesher(cse):
+            neu = GambitNeutral(testing.loadfile('oblique.neu'))
+            return neu.toblock(bcname_mapper=cse.condition.bcmap)
+        cse = gcase.GasCase(mesher=mesher, bcmap=bcmap, basefn='multirate',
+                            time_increment=2.e-3, steps_run=0)
+        cse.info.muted = True
+        cse.defer(inout.FillAnchor, mappers={
+            'soln': solver.GasSolver.ALMOST_ZERO, 'dsoln': 0.0,
+            'amsca': 1.4})
+        cse.defer(physics.DensityInitAnchor, rho=1.0)
+        cse.init()
+        cse.run()
+        return cse.solver.solverobj
+
+    def _march(self, time_increment, steps_run, level=None):
+        import numpy as np
+        svr = self._make_solver()
+        if level is not None:
+            svr.set_multirate(np.full(svr.ncell, level, dtype='int32'), 2)
+        svr.march(0.0, time_increment, steps_run)
+        return svr
+
+    def _assert_same(self, svr0, svr1):
+        import numpy as np
+        for name in ('soln', 'dsoln'):
+            self.assertTrue(np.allclose(getattr(svr0, name),
+                getattr(svr1, name), rtol=1.e-14, atol=0), name)
+
+    def test_all_coarse(self):
+        self._assert_same(self._march(2.e-3, 3),
+                          self._march(2.e-3, 3, level=0))
+
+    def test_all_fine(self):
+        self._assert_same(self._march(1.e-3, 6),
+                          self._march(2.e-3, 3, level=1))
+
+def march_bump(ndim, cltpn, **kw):
+    """
+    March a density bump in a box of a single cell type by 5 steps.
+    """
+    import numpy as np
+    from .. import boundcond
+    blk = testing.create_structured_blk([4]*ndim, cltpn=cltpn,
+                                        unspec_type=boundcond.GasNonrefl)
+    blk.clgrp.fill(0)
+    blk.grpnames.append('blank')
+    svr = solver.GasSolver(blk, **kw)
+    svr.init()
+    svr.provide()
+    svr.amsca.fill(1.4)
+    svr.soln.fill(0.0)
+    svr.dsoln.fill(0.0)
+    dist2 = ((blk.shclcnd - 0.5)**2).sum(axis=1)
+    svr.soln[:,0] = 1.0 + 0.2*np.exp(-20*dist2)
+    svr.soln[:,ndim+1] = svr.soln[:,0] / 0.4
+    svr.apply_bc()
+    svr.march(0.0, 0.02, 5)
+    return svr
+
+
+class TestRecomputeSfmrc(unittest.TestCase):
+    def _assert_same(self, ndim, cltpn):
+        import numpy as np
+        svr0 = march_bump(ndim, cltpn)
+        svr1 = march_bump(ndim, cltpn, recompute_sfmrc=True)
+        self.assertEqual(0, svr1.sfmrc.size)
+        for name in ('soln', 'dsoln'):
+            self.assertTrue(np.array_equal(getattr(svr0, name),
+                                           getattr(svr1, name)), name)
+
+    def test_2d(self):
+        self._assert_same(2, 3)
+
+    def test_3d(self):
+        self._assert_same(3, 4)
+
+
+class TestShapeKernels(unittest.TestCase):
+    def _assert_same(self, ndim, cltpn):
+        import numpy as np
+        svr0 = march_bump(ndim, cltpn, specialize_shape=False)
+        svr1 = march_bump(ndim, cltpn)
+        self.assertEqual(0, svr0.alg.cltpn)
+        self.assertEqual(cltpn, svr1.alg.cltpn)
+        for name in ('soln', 'dsoln'):
+            arr0 = getattr(svr0, name)
+            arr1 = getattr(svr1, name)
+            self.assertTrue(np.allclose(arr0, arr1, rtol=1.e-14,
+                atol=1.e-14*np.abs(arr0).max()), name)
+
+    def test_tri(self):
+        self._assert_same(2, 3)
+
+    def test_quad(self):
+        self._assert_same(2, 2)
+
+    def test_tet(self):
+        self._assert_same(3, 5)
+
+    def test_hex(self):
+        self._assert_same(3, 4)
+
+
 # vim: set ff=unix fenc=utf8 nobomb et sw=4 ts=4 tw=79:
@@ -38,7 +38,7 @@ from __future__ import absolute_import, division, print_function
 
 # this module should only import necessary entites.
 from .case import LinearCase
-from .solver import LinearSolver, LinearPeriodic
+from .solver import LinearSolver, LinearPeriodic, LinearNonrefl
 from .planewave import PlaneWaveSolution, PlaneWaveAnchor, PlaneWaveHook
 from .inout import (MeshInfoHook, ProgressHook, FillAnchor, CflAnchor, CflHook,
                     MarchSaveAnchor, PMarchSave)
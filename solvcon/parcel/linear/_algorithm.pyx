@@ -49,15 +49,23 @@ cdef extern:
         sc_mesh_t *msd, sc_linear_algorithm_t *alg,
         double *asol, double *adsol, double *amp, double *ctr, double *wvec,
         double afreq)
-    # algorithm calculators.
-    void sc_linear_calc_cfl_2d(sc_mesh_t *msd, sc_linear_algorithm_t *alg)
-    void sc_linear_calc_cfl_3d(sc_mesh_t *msd, sc_linear_algorithm_t *alg)
-    void sc_linear_calc_solt_2d(sc_mesh_t *msd, sc_linear_algorithm_t *alg)
-    void sc_linear_calc_solt_3d(sc_mesh_t *msd, sc_linear_algorithm_t *alg)
-    void sc_linear_calc_soln_2d(sc_mesh_t *msd, sc_linear_algorithm_t *alg)
-    void sc_linear_calc_soln_3d(sc_mesh_t *msd, sc_linear_algorithm_t *alg)
-    void sc_linear_calc_dsoln_2d(sc_mesh_t *msd, sc_linear_algorithm_t *alg)
-    void sc_linear_calc_dsoln_3d(sc_mesh_t *msd, sc_linear_algorithm_t *alg)
+    # algorithm calculators; they release the GIL for threaded marching.
+    void sc_linear_calc_cfl_2d(
+        sc_mesh_t *msd, sc_linear_algorithm_t *alg) nogil
+    void sc_linear_calc_cfl_3d(
+        sc_mesh_t *msd, sc_linear_algorithm_t *alg) nogil
+    void sc_linear_calc_solt_2d(
+        sc_mesh_t *msd, sc_linear_algorithm_t *alg) nogil
+    void sc_linear_calc_solt_3d(
+        sc_mesh_t *msd, sc_linear_algorithm_t *alg) nogil
+    void sc_linear_calc_soln_2d(
+        sc_mesh_t *msd, sc_linear_algorithm_t *alg) nogil
+    void sc_linear_calc_soln_3d(
+        sc_mesh_t *msd, sc_linear_algorithm_t *alg) nogil
+    void sc_linear_calc_dsoln_2d(
+        sc_mesh_t *msd, sc_linear_algorithm_t *alg) nogil
+    void sc_linear_calc_dsoln_3d(
+        sc_mesh_t *msd, sc_linear_algorithm_t *alg) nogil
 
 cdef extern from "stdlib.h":
     void* malloc(size_t size)
@@ -68,6 +76,8 @@ cdef class LinearAlgorithm(Mesh):
     """
     def __cinit__(self):
         self._alg = <sc_linear_algorithm_t *>malloc(sizeof(sc_linear_algorithm_t))
+        self._alg.mincfl = self._alg.maxcfl = 0.0
+        self._alg.nadjcfl = 0
 
     def set_alg_double_array_2d(self,
             cnp.ndarray[double, ndim=2, mode="c"] nda, name, int shift):
@@ -168,28 +178,41 @@ cdef class LinearAlgorithm(Mesh):
                 self._msd, self._alg,
                 &asol[0,0], &adsol[0,0,0], &amp[0], &ctr[0], &wvec[0], afreq)
 
+    @property
+    def cflstat(self):
+        """
+        Minimum and maximum CFL number and the number of adjusted CFL number
+        over the non-ghost cells, from the latest :py:meth:`calc_cfl`.
+        """
+        return (self._alg.mincfl, self._alg.maxcfl, self._alg.nadjcfl)
+
     def calc_cfl(self):
-        if self._msd.ndim == 3:
-            sc_linear_calc_cfl_3d(self._msd, self._alg)
-        else:
-            sc_linear_calc_cfl_2d(self._msd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_linear_calc_cfl_3d(self._msd, self._alg)
+            else:
+                sc_linear_calc_cfl_2d(self._msd, self._alg)
+        return self.cflstat
 
     def calc_solt(self):
-        if self._msd.ndim == 3:
-            sc_linear_calc_solt_3d(self._msd, self._alg)
-        else:
-            sc_linear_calc_solt_2d(self._msd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_linear_calc_solt_3d(self._msd, self._alg)
+            else:
+                sc_linear_calc_solt_2d(self._msd, self._alg)
 
     def calc_soln(self):
-        if self._msd.ndim == 3:
-            sc_linear_calc_soln_3d(self._msd, self._alg)
-        else:
-            sc_linear_calc_soln_2d(self._msd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_linear_calc_soln_3d(self._msd, self._alg)
+            else:
+                sc_linear_calc_soln_2d(self._msd, self._alg)
 
     def calc_dsoln(self):
-        if self._msd.ndim == 3:
-            sc_linear_calc_dsoln_3d(self._msd, self._alg)
-        else:
-            sc_linear_calc_dsoln_2d(self._msd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_linear_calc_dsoln_3d(self._msd, self._alg)
+            else:
+                sc_linear_calc_dsoln_2d(self._msd, self._alg)
 
 # vim: set fenc=utf8 ft=pyrex ff=unix ai et sw=4 ts=4 tw=79:
@@ -98,6 +98,8 @@ class MeshInfoHook(hook.MeshHook):
         if isinstance(self.cse.execution.npart, int):
             out('  %g Mcells/seconds/computer.\n' % (perf/npart))
             out('  %g Mvariables/seconds/computer.\n' % (perf*neq/npart))
+        # interface communication, if IbcStatHook is used.
+        pf.writelines(hook.IbcStatHook.tabulate(self.cse.execution.marchret))
         pf.close()
 
     def postmarch(self):
@@ -195,13 +197,8 @@ class CflAnchor(anchor.MeshAnchor):
         istep = svr.step_global
         rsteps = self.rsteps
         if istep > 0 and istep%rsteps == 0:
-            # download data.
-            ocfl = svr.ocfl[svr.ngstcell:]
-            cfl = svr.cfl[svr.ngstcell:]
-            # determine extremum.
-            mincfl = ocfl.min()
-            maxcfl = ocfl.max()
-            nadj = (cfl==1).sum()
+            # reduced by the kernel.
+            mincfl, maxcfl, nadj = svr.cflstat
             # store.
             lst = svr.marchret.setdefault('cfl', [0.0, 0.0, 0, 0])
             lst[0] = mincfl
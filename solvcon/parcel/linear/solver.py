@@ -55,7 +55,7 @@ class LinearSolver(solver.MeshSolver):
     <._algorithm.LinearAlgorithm>`.
     """
 
-    _interface_init_ = ['cecnd', 'cevol', 'sfmrc']
+    _interface_init_ = ['cecnd', 'cevol']
     _solution_array_ = ['solt', 'sol', 'soln', 'dsol', 'dsoln']
 
     def __init__(self, blk, **kw):
@@ -123,6 +123,9 @@ class LinearSolver(solver.MeshSolver):
         self.stm = np.empty((ngstcell+ncell, neq), dtype=fpdtype)
         self.cfl = np.empty(ngstcell+ncell, dtype=fpdtype)
         self.ocfl = np.empty(ngstcell+ncell, dtype=fpdtype)
+        #: Minimum and maximum CFL number and the number of adjusted CFL
+        #: number, calculated in :py:meth:`provide`.
+        self.cflstat = None
 
     @property
     def gdlen(self):
@@ -161,7 +164,7 @@ class LinearSolver(solver.MeshSolver):
         # fill group data array.
         self._make_grpda()
         # pre-calculate CFL.
-        self.create_alg().calc_cfl()
+        self.cflstat = self.create_alg().calc_cfl()
         self.ocfl[:] = self.cfl[:]
         # super method.
         super(LinearSolver, self).provide()
@@ -217,8 +220,24 @@ class LinearSolver(solver.MeshSolver):
 class LinearPeriodic(boundcond.periodic):
     """
     General periodic boundary condition for sequential runs.
+
+    Only translational periodicity is supported.  The solution holds the
+    components of vectors and tensors, which cannot be rotated without
+    knowing the equations, so a rotated pair (with :py:attr:`rotation
+    <solvcon.boundcond.periodic.rotation>` set) is rejected:
+
+    >>> bc = LinearPeriodic()
+    >>> bc.rotation = [[0.0, -1.0], [1.0, 0.0]]
+    >>> bc.init()
+    Traceback (most recent call last):
+        ...
+    ValueError: LinearPeriodic does not support rotational periodicity
     """
     def init(self, **kw):
+        if self.rotation is not None:
+            raise ValueError(
+                '%s does not support rotational periodicity' %
+                self.__class__.__name__)
         svr = self.svr
         blk = svr.blk
         ngstcell = blk.ngstcell
@@ -229,20 +248,33 @@ class LinearPeriodic(boundcond.periodic):
         # move coordinates.
         shf = svr.cecnd[slctr,0,:] - blk.shfccnd[facn[:,2]+ngstface,:]
         svr.cecnd[slctm,0,:] = blk.shfccnd[facn[:,0]+ngstface,:] + shf
+        #: The compiled copier with the cell pairs.
+        self.cpd = self.create_copy()
 
     def soln(self):
-        svr = self.svr
-        blk = svr.blk
-        slctm = self.rclp[:,0] + blk.ngstcell
-        slctr = self.rclp[:,1] + blk.ngstcell
-        svr.soln[slctm,:] = svr.soln[slctr,:]
+        self.cpd.copy_ghost([self.svr.soln])
 
     def dsoln(self):
-        svr = self.svr
-        blk = svr.blk
-        slctm = self.rclp[:,0] + blk.ngstcell
-        slctr = self.rclp[:,1] + blk.ngstcell
-        svr.dsoln[slctm,:,:] = svr.dsoln[slctr,:,:]
+        self.cpd.copy_ghost([self.svr.dsoln])
+
+
+class LinearNonrefl(boundcond.BC):
+    """
+    Non-reflective boundary condition by extrapolating the solution and its
+    gradient of the interior cells to the ghost cells.
+    """
+    def _cell_pairs(self):
+        ngstcell = self.svr.blk.ngstcell
+        fccls = self.svr.blk.fccls[self.facn[:,0]]
+        return fccls[:,0] + ngstcell, fccls[:,1] + ngstcell
+
+    def soln(self):
+        icl, jcl = self._cell_pairs()
+        self.svr.soln[jcl] = self.svr.soln[icl]
+
+    def dsoln(self):
+        icl, jcl = self._cell_pairs()
+        self.svr.dsoln[jcl] = self.svr.dsoln[icl]
 
 
 # vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
@@ -58,6 +58,9 @@ cdef public:
         double *stm
         double *cfl
         double *ocfl
+        # CFL statistics of the non-ghost cells from the latest calculation.
+        double mincfl, maxcfl
+        int nadjcfl
 
 from solvcon.mesh cimport Mesh
 cdef class VewaveAlgorithm(Mesh):
@@ -52,15 +52,23 @@ cdef extern:
     void sc_vewave_calc_physics(sc_mesh_t *msd, sc_vewave_algorithm_t *alg,
         double *s11, double *s22, double *s33, double *s23, double *s13,
         double *s12)
-    # algorithm calculators.
-    void sc_vewave_calc_cfl_2d(sc_mesh_t *msd, sc_vewave_algorithm_t *alg)
-    void sc_vewave_calc_cfl_3d(sc_mesh_t *msd, sc_vewave_algorithm_t *alg)
-    void sc_vewave_calc_solt_2d(sc_mesh_t *msd, sc_vewave_algorithm_t *alg)
-    void sc_vewave_calc_solt_3d(sc_mesh_t *msd, sc_vewave_algorithm_t *alg)
-    void sc_vewave_calc_soln_2d(sc_mesh_t *msd, sc_vewave_algorithm_t *alg)
-    void sc_vewave_calc_soln_3d(sc_mesh_t *msd, sc_vewave_algorithm_t *alg)
-    void sc_vewave_calc_dsoln_2d(sc_mesh_t *msd, sc_vewave_algorithm_t *alg)
-    void sc_vewave_calc_dsoln_3d(sc_mesh_t *msd, sc_vewave_algorithm_t *alg)
+    # algorithm calculators; they release the GIL for threaded marching.
+    void sc_vewave_calc_cfl_2d(
+        sc_mesh_t *msd, sc_vewave_algorithm_t *alg) nogil
+    void sc_vewave_calc_cfl_3d(
+        sc_mesh_t *msd, sc_vewave_algorithm_t *alg) nogil
+    void sc_vewave_calc_solt_2d(
+        sc_mesh_t *msd, sc_vewave_algorithm_t *alg) nogil
+    void sc_vewave_calc_solt_3d(
+        sc_mesh_t *msd, sc_vewave_algorithm_t *alg) nogil
+    void sc_vewave_calc_soln_2d(
+        sc_mesh_t *msd, sc_vewave_algorithm_t *alg) nogil
+    void sc_vewave_calc_soln_3d(
+        sc_mesh_t *msd, sc_vewave_algorithm_t *alg) nogil
+    void sc_vewave_calc_dsoln_2d(
+        sc_mesh_t *msd, sc_vewave_algorithm_t *alg) nogil
+    void sc_vewave_calc_dsoln_3d(
+        sc_mesh_t *msd, sc_vewave_algorithm_t *alg) nogil
     # ghost information calculators.
     void sc_vewave_ghostgeom_mirror_2d(
         sc_mesh_t *msd, sc_vewave_algorithm_t *alg, int nbnd, int *facn)
@@ -96,6 +104,8 @@ cdef class VewaveAlgorithm(Mesh):
     """
     def __cinit__(self):
         self._alg = <sc_vewave_algorithm_t *>malloc(sizeof(sc_vewave_algorithm_t))
+        self._alg.mincfl = self._alg.maxcfl = 0.0
+        self._alg.nadjcfl = 0
 
     def __dealloc__(self):
         if NULL != self._alg:
@@ -214,29 +224,42 @@ cdef class VewaveAlgorithm(Mesh):
         sc_vewave_calc_physics(self._msd, self._alg, 
             &s11[0], &s22[0], &s33[0], &s23[0], &s13[0], &s12[0])
 
+    @property
+    def cflstat(self):
+        """
+        Minimum and maximum CFL number and the number of adjusted CFL number
+        over the non-ghost cells, from the latest :py:meth:`calc_cfl`.
+        """
+        return (self._alg.mincfl, self._alg.maxcfl, self._alg.nadjcfl)
+
     def calc_cfl(self):
-        if self._msd.ndim == 3:
-            sc_vewave_calc_cfl_3d(self._msd, self._alg)
-        else:
-            sc_vewave_calc_cfl_2d(self._msd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_vewave_calc_cfl_3d(self._msd, self._alg)
+            else:
+                sc_vewave_calc_cfl_2d(self._msd, self._alg)
+        return self.cflstat
 
     def calc_solt(self):
-        if self._msd.ndim == 3:
-            sc_vewave_calc_solt_3d(self._msd, self._alg)
-        else:
-            sc_vewave_calc_solt_2d(self._msd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_vewave_calc_solt_3d(self._msd, self._alg)
+            else:
+                sc_vewave_calc_solt_2d(self._msd, self._alg)
 
     def calc_soln(self):
-        if self._msd.ndim == 3:
-            sc_vewave_calc_soln_3d(self._msd, self._alg)
-        else:
-            sc_vewave_calc_soln_2d(self._msd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_vewave_calc_soln_3d(self._msd, self._alg)
+            else:
+                sc_vewave_calc_soln_2d(self._msd, self._alg)
 
     def calc_dsoln(self):
-        if self._msd.ndim == 3:
-            sc_vewave_calc_dsoln_3d(self._msd, self._alg)
-        else:
-            sc_vewave_calc_dsoln_2d(self._msd, self._alg)
+        with nogil:
+            if self._msd.ndim == 3:
+                sc_vewave_calc_dsoln_3d(self._msd, self._alg)
+            else:
+                sc_vewave_calc_dsoln_2d(self._msd, self._alg)
 
     def ghostgeom_mirror(self, cnp.ndarray[int, ndim=2, mode="c"] facn):
         if self._msd.ndim == 3:
@@ -237,8 +237,24 @@ class VewaveSolver(solver.MeshSolver):
 class VewavePeriodic(boundcond.periodic):
     """
     General periodic boundary condition for sequential runs.
+
+    Only translational periodicity is supported.  The solution holds the
+    components of vectors and tensors, which cannot be rotated without
+    knowing the equations, so a rotated pair (with :py:attr:`rotation
+    <solvcon.boundcond.periodic.rotation>` set) is rejected:
+
+    >>> bc = VewavePeriodic()
+    >>> bc.rotation = [[0.0, -1.0], [1.0, 0.0]]
+    >>> bc.init()
+    Traceback (most recent call last):
+        ...
+    ValueError: VewavePeriodic does not support rotational periodicity
     """
     def init(self, **kw):
+        if self.rotation is not None:
+            raise ValueError(
+                '%s does not support rotational periodicity' %
+                self.__class__.__name__)
         svr = self.svr
         blk = svr.blk
         ngstcell = blk.ngstcell
@@ -249,20 +265,14 @@ class VewavePeriodic(boundcond.periodic):
         # move coordinates.
         shf = svr.cecnd[slctr,0,:] - blk.shfccnd[facn[:,2]+ngstface,:]
         svr.cecnd[slctm,0,:] = blk.shfccnd[facn[:,0]+ngstface,:] + shf
+        #: The compiled copier with the cell pairs.
+        self.cpd = self.create_copy()
 
     def soln(self):
-        svr = self.svr
-        blk = svr.blk
-        slctm = self.rclp[:,0] + blk.ngstcell
-        slctr = self.rclp[:,1] + blk.ngstcell
-        svr.soln[slctm,:] = svr.soln[slctr,:]
+        self.cpd.copy_ghost([self.svr.soln])
 
     def dsoln(self):
-        svr = self.svr
-        blk = svr.blk
-        slctm = self.rclp[:,0] + blk.ngstcell
-        slctr = self.rclp[:,1] + blk.ngstcell
-        svr.dsoln[slctm,:,:] = svr.dsoln[slctr,:,:]
+        self.cpd.copy_ghost([self.svr.dsoln])
 
 
 class VewaveBC(boundcond.BC):
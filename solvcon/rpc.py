@@ -315,6 +315,18 @@ class Worker(object):
         conn = Client(address=address, authkey=authkey)
         self.pconns[peern] = conn
 
+    def attach_peer(self, peern, conn):
+        """
+        Use the given connection to the specified peer.  It is for workers
+        running in threads of the same process.
+
+        @param peern: index of the peer.
+        @type peern: int
+        @param conn: connection to the peer.
+        @type conn: solvcon.connection.ThreadConnection
+        """
+        self.pconns[peern] = conn
+
     def set_peer(self, src, dst):
         """
         Create MPI proxy for a pair of p2p connection.
@@ -495,6 +507,34 @@ class Dealer(list):
         shadow.remote_setattr('serial', len(self))
         self.append(shadow)
 
+    def hire_thread(self, worker):
+        """
+        Run a worker object in a daemon thread of the current process.
+        Commands and data are passed to the worker without serialization, and
+        the peers of the worker, if also in threads, are bridged in memory.
+        The connections of the worker are closed when its event loop ends, so
+        that whoever waits for it gets an EOFError rather than hangs.
+
+        @param worker: worker object.
+        @type worker: Worker
+        """
+        from threading import Thread
+        from .connection import ThreadPipe
+        conn, worker.conn = ThreadPipe()
+        def run():
+            try:
+                worker.eventloop()
+            finally:
+                worker.conn.close()
+                for pconn in worker.pconns.values():
+                    pconn.close()
+        thread = Thread(target=run)
+        thread.daemon = True
+        thread.start()
+        shadow = Shadow(conn=conn)
+        shadow.remote_setattr('serial', len(self))
+        self.append(shadow)
+
     def appoint(self, inetaddr, port, authkey):
         """
         @param inetaddr: the IP/DN of the machine to build the worker.
@@ -511,12 +551,115 @@ class Dealer(list):
         shadow.remote_setattr('serial', len(self))
         self.append(shadow)
 
+    def appoint_all(self, launch, nworker, authkey, nthread=8, retries=2,
+                    notify=None, terminate=None):
+        """
+        Launch and appoint remote workers concurrently.  At most *nthread*
+        workers are being launched or connected at a time, and a failed
+        launch or connection is retried.  A failed connection is retried to
+        the worker already launched; the worker is launched again only after
+        *terminate* stops it, so that no worker is left behind without a
+        dealer.  Workers are connected in the order
+        they come up, but the i-th worker always takes the i-th position
+        after the existing shadows, so that the assignment of blocks to
+        workers is deterministic.
+
+        @param launch: callable taking the index of the worker (0-based) to
+            start the worker; returns the IP/DN and the port to connect to.
+        @type launch: callable
+        @param nworker: number of workers to launch.
+        @type nworker: int
+        @param authkey: the authkey for the workers.
+        @type authkey: str
+        @keyword nthread: maximum number of concurrent launches.
+        @type nthread: int
+        @keyword retries: number of retries for a failed launch, and for a
+            failed connection to a launched worker.
+        @type retries: int
+        @keyword notify: callable taking the index of the worker, the
+            address, and the number of attempts, called in the order of
+            arrival.
+        @type notify: callable
+        @keyword terminate: callable taking the index of the worker and the
+            address, to stop a launched worker that cannot be connected.
+            Without it such a worker is not launched again.
+        @type terminate: callable
+        @return: nothing
+        """
+        from threading import Thread, Lock
+        from .connection import Client
+        base = len(self)
+        shadows = [None] * nworker
+        pending = list(range(nworker-1, -1, -1))
+        errors = list()
+        lock = Lock()
+        failures = (EnvironmentError, EOFError, ValueError)
+        def connect(iworker, address):
+            conn = Client(address=address, authkey=authkey)
+            try:
+                shadow = Shadow(conn=conn, address=address)
+                shadow.remote_setattr('serial', base+iworker)
+            except:
+                conn.close()
+                raise
+            return shadow
+        def appoint_one(iworker):
+            nattempt = 0
+            for ilaunch in range(retries+1):
+                nattempt += 1
+                try:
+                    address = tuple(launch(iworker))
+                except failures:
+                    if ilaunch == retries:
+                        raise
+                    continue
+                for iconn in range(retries+1):
+                    if iconn:
+                        nattempt += 1
+                    try:
+                        return connect(iworker, address), address, nattempt
+                    except failures:
+                        if iconn == retries and (
+                                terminate is None or ilaunch == retries):
+                            raise
+                # the launched worker is given up; stop it before launching
+                # another one.
+                terminate(iworker, address)
+        def run():
+            while True:
+                with lock:
+                    if errors or not pending:
+                        return
+                    iworker = pending.pop()
+                try:
+                    shadow, address, nattempt = appoint_one(iworker)
+                except Exception as e:
+                    with lock:
+                        errors.append(e)
+                    return
+                with lock:
+                    shadows[iworker] = shadow
+                    if notify is not None:
+                        notify(iworker, address, nattempt)
+        threads = [Thread(target=run) for it in range(min(nthread, nworker))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            for shadow in shadows:
+                if shadow is not None:
+                    shadow.conn.close()
+            raise errors[0]
+        self.extend(shadows)
+
     def bridge(self, peers, wait_for_accept=None):
         """
         Tell two peering worker to establish a connection.
         """
         from time import sleep
         from .conf import env
+        from .connection import ThreadConnection, ThreadPipe
         plow, phigh = peers
         assert plow != phigh    # makes no sense.
         if plow > phigh:
@@ -526,6 +669,11 @@ class Dealer(list):
         if env.mpi:
             self[phigh].set_peer(phigh, plow)
             self[plow].set_peer(plow, phigh)
+        elif (isinstance(self[plow].conn, ThreadConnection) and
+              isinstance(self[phigh].conn, ThreadConnection)):
+            conn0, conn1 = ThreadPipe()
+            self[phigh].attach_peer(plow, conn0)
+            self[plow].attach_peer(phigh, conn1)
         else:
             # ask higher to accept connection.
             self[phigh].accept_peer(plow, self.family, self.authkey)
@@ -0,0 +1,279 @@
+# -*- coding: UTF-8 -*-
+#
+# Copyright (c) 2014, Yung-Yu Chen <yyc@solvcon.net>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Strong- and weak-scaling harness of parallel cases.  A case is run with a
+structured mesh from :py:func:`solvcon.testing.create_structured_blk` for each
+number of local workers, and :py:class:`solvcon.hook.PhaseTimeHook` breaks
+its wall time into phases.  The parallel efficiency of each phase is
+calculated against the run with the fewest workers, and the records can be
+appended to a history file in JSON or CSV.
+"""
+
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import json
+import time
+import socket
+import shutil
+import tempfile
+
+
+#: Fields in a scaling record.
+FIELDS = ('stamp', 'host', 'tag', 'mode', 'shape', 'size', 'ncell', 'nworker',
+          'phase', 'time', 'efficiency')
+
+
+def create_gas_case(nworker, shape, size, steps, basedir):
+    """
+    Create a :py:class:`~solvcon.parcel.gas.GasCase` of a still gas in a unit
+    box with non-reflective boundaries.  The sub-blocks are shipped to the
+    workers through files in *basedir*, because the solvers cannot be
+    pickled.
+
+    :param nworker: Number of local workers.
+    :type nworker: int
+    :param shape: Name of the cell shape, one of the keys of
+        :py:data:`solvcon.bench.SHAPES`.
+    :type shape: str
+    :param size: Number of cells along each axis.
+    :type size: int
+    :param steps: Number of time steps to run.
+    :type steps: int
+    :param basedir: Directory for the output of the case.
+    :type basedir: str
+    :return: The case.
+    :rtype: solvcon.case.MeshCase
+    """
+    from . import domain
+    from .bench import SHAPES
+    from .testing import create_structured_blk
+    from .parcel import gas
+    ndim, cltpn = SHAPES[shape]
+    def mesher(cse):
+        blk = create_structured_blk([size]*ndim, cltpn=cltpn,
+                                    unspec_type=gas.GasNonrefl)
+        blk.clgrp.fill(0)
+        blk.grpnames.append('blank')
+        return blk
+    cse = gas.GasCase(
+        basedir=basedir, basefn='scaling', mesher=mesher,
+        domaintype=domain.Collective, npart=nworker,
+        time_increment=0.5/size, steps_run=steps, scratchdir=basedir)
+    cse.defer(gas.FillAnchor, mappers={'soln': gas.GasSolver.ALMOST_ZERO,
+                                       'dsoln': 0.0, 'amsca': 1.4})
+    cse.defer(gas.DensityInitAnchor, rho=1.0)
+    return cse
+
+
+class ScalingHarness(object):
+    """
+    Run a case for each number of local workers and tabulate the time and
+    parallel efficiency of each phase.  In strong scaling the mesh is fixed;
+    in weak scaling the number of cells grows with the number of workers.
+
+    The efficiency of a run with :math:`n` workers against the base run with
+    :math:`n_0` workers is :math:`n_0 t_0 / (n t)` for strong scaling and
+    :math:`t_0 / t` for weak scaling.  It is ``None`` when either time is
+    zero.
+
+    >>> harness = ScalingHarness(mode='weak', nworkers=(1, 2, 4), shape='hex',
+    ...                          size=10)
+    >>> [harness.get_size(nworker) for nworker in harness.nworkers]
+    [10, 13, 16]
+    >>> harness.efficiency(2, 1.0, 4, 2.0)
+    0.5
+    >>> ScalingHarness(mode='strong').efficiency(2, 1.0, 4, 1.0)
+    0.5
+    """
+
+    MODES = ('strong', 'weak')
+
+    def __init__(self, create_case=create_gas_case, mode='strong',
+                 nworkers=(1, 2, 4), shape='quad', size=64, steps=20,
+                 basedir=None, tag=''):
+        """
+        :keyword create_case: Callable taking the number of workers, shape,
+            size, steps and base directory to create a case.  Default is
+            :py:func:`create_gas_case`.
+        :keyword mode: ``strong`` or ``weak``.
+        :type mode: str
+        :keyword nworkers: Numbers of local workers.
+        :type nworkers: sequence of int
+        :keyword shape: Name of the cell shape.
+        :type shape: str
+        :keyword size: Number of cells along each axis for the fewest workers.
+        :type size: int
+        :keyword steps: Number of time steps to run.
+        :type steps: int
+        :keyword basedir: Directory for the output of the cases.  Default is a
+            temporary directory.
+        :type basedir: str
+        :keyword tag: Label of the records, e.g., the revision under test.
+        :type tag: str
+        """
+        from .bench import SHAPES
+        if mode not in self.MODES:
+            raise ValueError('mode must be one of %s' % str(self.MODES))
+        #: Callable to create a case.
+        self.create_case = create_case
+        #: ``strong`` or ``weak``.
+        self.mode = mode
+        #: Numbers of local workers, in increasing order.
+        self.nworkers = sorted(int(num) for num in nworkers)
+        #: Name of the cell shape.
+        self.shape = shape
+        #: Spatial dimension.
+        self.ndim = SHAPES[shape][0]
+        #: Number of cells along each axis for the fewest workers.
+        self.size = int(size)
+        #: Number of time steps to run.
+        self.steps = int(steps)
+        #: Directory for the output of the cases.
+        self.basedir = basedir
+        #: Label of the records.
+        self.tag = tag
+
+    def get_size(self, nworker):
+        """
+        :param nworker: Number of workers.
+        :type nworker: int
+        :return: Number of cells along each axis.
+        :rtype: int
+        """
+        if self.mode == 'strong':
+            return self.size
+        ratio = nworker / self.nworkers[0]
+        return int(round(self.size * ratio**(1.0/self.ndim)))
+
+    def efficiency(self, nbase, tbase, nworker, tval):
+        """
+        :param nbase: Number of workers of the base run.
+        :type nbase: int
+        :param tbase: Time of the base run.
+        :type tbase: float
+        :param nworker: Number of workers of the run.
+        :type nworker: int
+        :param tval: Time of the run.
+        :type tval: float
+        :return: Parallel efficiency.
+        :rtype: float
+        """
+        if tbase <= 0 or tval <= 0:
+            return None
+        if self.mode == 'strong':
+            return nbase * tbase / (nworker * tval)
+        return tbase / tval
+
+    def run_case(self, nworker):
+        """
+        :param nworker: Number of workers.
+        :type nworker: int
+        :return: Number of cells and time of each phase.
+        :rtype: tuple
+        """
+        from .hook import PhaseTimeHook
+        size = self.get_size(nworker)
+        tmpdir = None
+        basedir = self.basedir
+        if basedir is None:
+            basedir = tmpdir = tempfile.mkdtemp(prefix='solvcon_scaling_')
+        basedir = os.path.join(basedir, '%s_%d' % (self.mode, nworker))
+        try:
+            cse = self.create_case(nworker, self.shape, size, self.steps,
+                                   basedir)
+            cse.defer(PhaseTimeHook)
+            cse.init()
+            cse.run()
+        finally:
+            # the temporary output is not needed after the run.
+            if tmpdir is not None:
+                shutil.rmtree(tmpdir)
+        hook = [hok for hok in cse.runhooks
+                if isinstance(hok, PhaseTimeHook)][0]
+        return cse.blk.ncell, hook.phases
+
+    def __call__(self):
+        """
+        :return: The scaling records, one for each phase of each run.
+        :rtype: list of dict
+        """
+        from .hook import PhaseTimeHook
+        stamp = time.strftime('%Y-%m-%dT%H:%M:%S')
+        host = socket.gethostname()
+        records = []
+        base = None
+        for nworker in self.nworkers:
+            ncell, phases = self.run_case(nworker)
+            if base is None:
+                base = nworker, phases
+            for phase in PhaseTimeHook.PHASES:
+                records.append(dict(
+                    stamp=stamp, host=host, tag=self.tag, mode=self.mode,
+                    shape=self.shape, size=self.get_size(nworker),
+                    ncell=ncell, nworker=nworker, phase=phase,
+                    time=phases[phase],
+                    efficiency=self.efficiency(
+                        base[0], base[1][phase], nworker, phases[phase]),
+                ))
+        return records
+
+
+def append_history(records, filename):
+    """
+    Append records to a history file.  A file name ending with ``.csv`` is
+    written in CSV, and otherwise in JSON as a list of records.
+
+    :param records: The records.
+    :type records: list of dict
+    :param filename: Name of the history file.
+    :type filename: str
+    :return: Nothing.
+    """
+    if filename.endswith('.csv'):
+        import csv
+        exists = os.path.exists(filename)
+        with open(filename, 'a') as fobj:
+            writer = csv.DictWriter(fobj, FIELDS)
+            if not exists:
+                writer.writeheader()
+            writer.writerows(records)
+    else:
+        history = []
+        if os.path.exists(filename):
+            with open(filename) as fobj:
+                history = json.load(fobj)
+        history.extend(records)
+        with open(filename, 'w') as fobj:
+            json.dump(history, fobj, indent=1)
+
+# vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
@@ -116,6 +116,10 @@ class MeshSolver(object):
 
     ALMOST_ZERO = solver_core.ALMOST_ZERO
 
+    #: Fields of :py:attr:`ibcstat`: the number of messages and bytes sent,
+    #: those received, and the time blocked in sending and in receiving.
+    IBCSTAT_FIELDS = ('nsend', 'bsend', 'nrecv', 'brecv', 'tsend', 'trecv')
+
     def __init__(self, blk, time=0.0, time_increment=0.0, enable_mesg=False,
             debug=False, **kw):
         """
@@ -163,6 +167,22 @@ class MeshSolver(object):
         self.substep_run = 1
         #: The current sub-step of the solver.  It is initialized to ``0``.
         self.substep_current = 0
+        # multi-rate marching.
+        #: Number of time-step classes for multi-rate marching.  Cells in
+        #: class ``k`` march with :py:attr:`time_increment` / 2**k.  ``1``
+        #: means all cells march together.  See :py:meth:`set_multirate`.
+        self.mrnclass = 1
+        #: The class of each body cell, or ``None``.
+        self.mrlevels = None
+        #: Body cell indices of each class, or ``None`` when multi-rate
+        #: marching is disabled.
+        self.mrclasses = None
+        #: Body cell indices of coarser classes bordering each class.  The
+        #: solution of these cells needs to be interpolated in time when the
+        #: class is marching.
+        self.mrhalos = None
+        #: The class being marched, or ``None`` outside multi-rate marching.
+        self.mrclass_current = None
         # set meta data.
         #: 0-based serial number of this solver in a parallel execution.
         self.svrn = self.blk.blkn
@@ -175,6 +195,14 @@ class MeshSolver(object):
         self.der = dict()
         # reporting facility.
         self.timer = gendata.Timer(vtype=float)
+        #: A :py:class:`solvcon.gendata.SpanRecorder` to record the spans of
+        #: marching, anchors, and interface exchange.  ``None`` (default)
+        #: disables the recording.
+        self.tracer = None
+        #: Statistics of the interface exchange, keyed by the serial number of
+        #: the peer and the name of the array.  Each value is a
+        #: :py:class:`list` of the fields in :py:attr:`IBCSTAT_FIELDS`.
+        self.ibcstat = dict()
         self.enable_mesg = enable_mesg
         self._mesg = None
         #: Debugging flag.
@@ -225,6 +253,15 @@ class MeshSolver(object):
     @property
     def ngstcell(self):
         return self.blk.ngstcell
+
+    @property
+    def memory(self):
+        """
+        The memory held by the solver, as reported by
+        :py:func:`solvcon.memory.solver_memory`.
+        """
+        from .memory import solver_memory
+        return solver_memory(self)
     # Meta data.
     ############################################################################
 
@@ -328,7 +365,9 @@ class MeshSolver(object):
         the inner loop), the increment of the attribute :py:attr:`time` is
         :py:attr:`time_increment`/:py:attr:`substep_run`.  The temporal
         increment per time step is effectively :py:attr:`time_increment`, with
-        a slight error because of round-off.
+        a slight error because of round-off.  When multi-rate marching is
+        enabled by :py:meth:`set_multirate`, the inner loop is run for each
+        time-step class (see :py:meth:`_march_multirate`).
 
         Before entering and after leaving the outer loop, :py:meth:`premarch
         <solvcon.anchor.Anchor.premarch>` and :py:meth:`postmarch
@@ -357,34 +396,17 @@ class MeshSolver(object):
             self.substep_current = 0
             self.runanchors('prefull')
             t0 = time.time()
-            while self.substep_current < self.substep_run:
-                # set up time.
-                self.time = time_current
-                self.time_increment = time_increment
-                self.runanchors('presub')
-                # run marching methods.
-                for mmname in self.mmnames:
-                    method = getattr(self, mmname)
-                    t1 = time.time()
-                    self.runanchors('pre'+mmname)
-                    t2 = time.time()
-                    if self.debug:
-                        self.mesg("step %d substep %d enter %s\n" % (
-                            self.step_current, self.substep_current, mmname))
-                    method(worker=worker)
-                    if self.debug:
-                        self.mesg("step %d substep %d left %s\n" % (
-                            self.step_current, self.substep_current, mmname))
-                    self.timer.increase(mmname, time.time() - t2)
-                    self.runanchors('post'+mmname)
-                    self.timer.increase(mmname+'_a', time.time() - t1)
-                # increment time.
-                time_current += self.time_increment/self.substep_run
-                self.time = time_current
-                self.time_increment = time_increment
-                self.substep_current += 1
-                self.runanchors('postsub')
-            self.timer.increase('march', time.time() - t0)
+            if self.mrclasses is None:
+                time_current = self._march_substeps(
+                    time_current, time_increment, worker)
+            else:
+                time_current = self._march_multirate(
+                    time_current, time_increment, worker)
+            t3 = time.time()
+            self.timer.increase('march', t3 - t0)
+            if self.tracer is not None:
+                self.tracer.add('step', 'step', t0, t3,
+                                {'step': self.step_global})
             self.step_global += 1
             self.step_current += 1
             self.runanchors('postfull')
@@ -393,6 +415,207 @@ class MeshSolver(object):
             worker.conn.send(self.marchret)
         return self.marchret
 
+    def _march_substeps(self, time_current, time_increment, worker):
+        """
+        :return: The time after the sub-steps.
+        :rtype: float
+
+        Run the inner loop of sub-steps of :py:meth:`march`.
+        """
+        self.substep_current = 0
+        while self.substep_current < self.substep_run:
+            # set up time.
+            self.time = time_current
+            self.time_increment = time_increment
+            self.runanchors('presub')
+            # run marching methods.
+            for mmname in self.mmnames:
+                method = getattr(self, mmname)
+                t1 = time.time()
+                self.runanchors('pre'+mmname)
+                t2 = time.time()
+                if self.debug:
+                    self.mesg("step %d substep %d enter %s\n" % (
+                        self.step_current, self.substep_current, mmname))
+                method(worker=worker)
+                if self.debug:
+                    self.mesg("step %d substep %d left %s\n" % (
+                        self.step_current, self.substep_current, mmname))
+                t3 = time.time()
+                self.timer.increase(mmname, t3 - t2)
+                if self.tracer is not None:
+                    self.tracer.add(mmname, 'exchange'
+                        if mmname.startswith('ibc') else 'march', t2, t3)
+                self.runanchors('post'+mmname)
+                self.timer.increase(mmname+'_a', time.time() - t1)
+            # increment time.
+            time_current += self.time_increment/self.substep_run
+            self.time = time_current
+            self.time_increment = time_increment
+            self.substep_current += 1
+            self.runanchors('postsub')
+        return time_current
+
+    def _march_multirate(self, time_current, time_increment, worker):
+        """
+        :return: The time after the time step.
+        :rtype: float
+
+        Run one time step of *time_increment* with multi-rate marching.  The
+        step is divided into 2**(:py:attr:`mrnclass`-1) cycles.  Class ``k``
+        runs the full set of sub-steps with *time_increment* / 2**k in the
+        cycles that are multiples of 2**(:py:attr:`mrnclass`-1-k).  In a cycle
+        the coarser classes run first, so that they see their finer neighbors
+        at the beginning of the cycle.
+
+        Every solver runs the same schedule regardless of the population of
+        each class, so that interface exchanges stay paired in parallel runs.
+        """
+        nclass = self.mrnclass
+        ncycle = 1 << (nclass-1)
+        for icyc in range(ncycle):
+            for iclass in range(nclass):
+                if icyc % (1 << (nclass-1-iclass)):
+                    continue
+                tclass = time_current + time_increment*icyc/ncycle
+                self.mrclass_current = iclass
+                self.begin_multirate_class(iclass, tclass)
+                self._march_substeps(
+                    tclass, time_increment/(1 << iclass), worker)
+        self.mrclass_current = None
+        self.end_multirate_step()
+        time_current += time_increment
+        self.time = time_current
+        self.time_increment = time_increment
+        return time_current
+
+    def begin_multirate_class(self, iclass, time):
+        """
+        :param iclass: The class to march.
+        :type iclass: int
+        :param time: The time the class starts to march from.
+        :type time: float
+        :return: Nothing.
+
+        Called by multi-rate marching before the sub-steps of a class.
+        Subclasses override it to restrict the calculation to the class and to
+        store what is needed for interpolation at class boundaries.
+        """
+        pass
+
+    def end_multirate_step(self):
+        """
+        :return: Nothing.
+
+        Called by multi-rate marching after all classes finish a time step.
+        """
+        pass
+
+    def make_multirate_levels(self, cfl, nclass, cflmax=1.0):
+        """
+        :param cfl: CFL number of each body cell evaluated with the time
+            increment of the coarsest class.
+        :type cfl: numpy.ndarray
+        :param nclass: Number of classes.
+        :type nclass: int
+        :keyword cflmax: The CFL number allowed in a class.
+        :type cflmax: float
+        :return: The class of each body cell.
+        :rtype: numpy.ndarray
+
+        A cell goes to the coarsest class in which its CFL number does not
+        exceed *cflmax*.  Classes of neighboring cells then are raised to differ
+        by at most one.
+
+        >>> from . import testing
+        >>> svr = MeshSolver(testing.create_trivial_2d_blk())
+        >>> svr.make_multirate_levels(np.array([0.5, 1.5, 0.2]), 3).tolist()
+        [0, 1, 0]
+        >>> svr.make_multirate_levels(np.array([0.5, 3.5, 0.2]), 4).tolist()
+        [1, 2, 1]
+        >>> svr.make_multirate_levels(np.array([0.5, 9.0, 0.2]), 2).tolist()
+        [0, 1, 0]
+        """
+        cfl = np.asarray(cfl, dtype='float64')
+        if cfl.shape != (self.ncell,):
+            raise ValueError('cfl.shape = %s != (%d,)' % (
+                str(cfl.shape), self.ncell))
+        ratio = cfl / cflmax
+        ratio[np.isnan(ratio)] = np.inf
+        ratio = np.minimum(np.maximum(ratio, 1.0), 2.0**nclass)
+        levels = np.ceil(np.log2(ratio)).astype('int32')
+        levels = np.minimum(levels, nclass-1)
+        # smooth the class jumps across body faces.
+        icl, jcl = self._multirate_face_pairs()
+        while True:
+            olevels = levels.copy()
+            np.maximum.at(levels, icl, levels[jcl]-1)
+            np.maximum.at(levels, jcl, levels[icl]-1)
+            if (olevels == levels).all():
+                break
+        return levels
+
+    def _multirate_face_pairs(self):
+        """
+        :return: The two body cells of each face between body cells.
+        :rtype: tuple of numpy.ndarray
+        """
+        fccls = self.blk.fccls
+        inner = fccls[:,1] >= 0
+        return fccls[inner,0], fccls[inner,1]
+
+    def set_multirate(self, levels, nclass):
+        """
+        :param levels: The class of each body cell.
+        :type levels: numpy.ndarray
+        :param nclass: Number of classes.
+        :type nclass: int
+        :return: Nothing.
+
+        Set up the cell lists for multi-rate marching.  Setting *nclass* to
+        ``1`` disables multi-rate marching.
+
+        >>> from . import testing
+        >>> svr = MeshSolver(testing.create_trivial_2d_blk())
+        >>> svr.set_multirate(np.array([0, 1, 0]), 2)
+        >>> [it.tolist() for it in svr.mrclasses]
+        [[0, 2], [1]]
+        >>> [it.tolist() for it in svr.mrhalos]
+        [[], [0, 2]]
+        >>> svr.set_multirate(np.array([0, 2, 0]), 2)
+        Traceback (most recent call last):
+            ...
+        ValueError: class of cells must be in [0, 2)
+        >>> svr.set_multirate(np.zeros(3, dtype='int32'), 1)
+        >>> svr.mrclasses is None
+        True
+        """
+        nclass = int(nclass)
+        levels = np.asarray(levels, dtype='int32')
+        if nclass < 1:
+            raise ValueError('nclass = %d < 1' % nclass)
+        if levels.shape != (self.ncell,):
+            raise ValueError('levels.shape = %s != (%d,)' % (
+                str(levels.shape), self.ncell))
+        if levels.min() < 0 or levels.max() >= nclass:
+            raise ValueError('class of cells must be in [0, %d)' % nclass)
+        self.mrnclass = nclass
+        self.mrlevels = levels
+        if nclass == 1:
+            self.mrclasses = self.mrhalos = None
+            return
+        self.mrclasses = [np.flatnonzero(levels == iclass).astype('int32')
+                          for iclass in range(nclass)]
+        icl, jcl = self._multirate_face_pairs()
+        ilevel = levels[icl]
+        jlevel = levels[jcl]
+        self.mrhalos = list()
+        for iclass in range(nclass):
+            halo = np.concatenate([
+                jcl[(ilevel == iclass) & (jlevel < iclass)],
+                icl[(jlevel == iclass) & (ilevel < iclass)]])
+            self.mrhalos.append(np.unique(halo).astype('int32'))
+
     def init(self, **kw):
         """
         :return: Nothing.
@@ -442,12 +665,21 @@ class MeshSolver(object):
         """
         return setattr(self, name, var)
 
-    def pull(self, arrname, inder=False, worker=None):
+    def remote_getattr(self, name, worker=None):
+        """
+        Send an attribute of any type to dealer (rpc) through worker object.
+        """
+        worker.conn.send(getattr(self, name))
+
+    def pull(self, arrname, inder=False, start=0, worker=None):
         """
         :param arrname: The namd of the array to pull to master.
         :type arrname: str
         :param inder: The data array is derived data array.  Default is False.
         :type inder: bool
+        :keyword start: The starting index of pulling, e.g., the number of
+            ghost cells to skip.  Default is 0.
+        :type start: int
         :keyword worker: The worker object for communication.  Default is None.
         :type worker: solvcon.rpc.Worker
         :return: Nothing.
@@ -459,7 +691,7 @@ class MeshSolver(object):
             arr = self.der[arrname]
         else:
             arr = getattr(self, arrname)
-        conn.send(arr)
+        conn.send(arr[start:])
 
     def push(self, marr, arrname, start=0, inder=False):
         """
@@ -473,20 +705,28 @@ class MeshSolver(object):
         :type inder: bool
         :return: Nothing.
 
-        Push data array received from dealer (rpc) into self.
+        Push data array received from dealer (rpc) into self.  The passed-in
+        array can either be as long as the whole array, or hold only the part
+        from *start*.
         """
         if inder:
             arr = self.der[arrname]
         else:
             arr = getattr(self, arrname)
-        arr[start:] = marr[start:]
+        if len(marr) == len(arr) - start:
+            arr[start:] = marr
+        else:
+            arr[start:] = marr[start:]
 
-    def pullank(self, ankname, objname, worker=None):
+    def pullank(self, ankname, objname, callargs=None, worker=None):
         """
         :param ankname: The name of related anchor.
         :type ankname: str
         :param objname: The object to pull to master.
         :type objname: str
+        :keyword callargs: If not None, call the object with these arguments
+            and pull the result instead.
+        :type callargs: tuple
         :keyword worker: The worker object for communication.  Default is None.
         :type worker: solvcon.rpc.Worker
         :return: Nothing.
@@ -495,13 +735,16 @@ class MeshSolver(object):
         """
         conn = worker.conn
         obj = getattr(self.runanchors[ankname], objname)
+        if callargs is not None:
+            obj = obj(*callargs)
         conn.send(obj)
 
     def init_exchange(self, ifacelist):
         # grab peer index.
         ibclist = list()
+        self._ibccopies = dict()
         for pair in ifacelist:
-            if pair < 0:
+            if isinstance(pair, float) and pair < 0:
                 ibclist.append(pair)
             else:
                 assert len(pair) == 2
@@ -514,13 +757,17 @@ class MeshSolver(object):
             it = ibclist.index(bc.rblkn)
             sendn, recvn = ifacelist[it]
             ibclist[it] = bc, sendn, recvn
+            self._ibccopies[bc.rblkn] = bc.create_copy()
         self.ibclist = ibclist
 
     def exchangeibc(self, arrname, worker=None):
+        # an empty (not stored) array has nothing to exchange.
+        if 0 == getattr(self, arrname).size:
+            return
         threads = list()
         for ibc in self.ibclist:
             # check if sleep or not.
-            if ibc < 0:
+            if isinstance(ibc, float) and ibc < 0:
                 continue 
             bc, sendn, recvn = ibc
             # determine callable and arguments.
@@ -535,7 +782,36 @@ class MeshSolver(object):
                     bc.rblkn, sendn, recvn))
             kwargs = {'worker': worker}
             # call to data transfer.
-            target(*args, **kwargs)
+            if self.tracer is None:
+                target(*args, **kwargs)
+            else:
+                t0 = time.time()
+                target(*args, **kwargs)
+                self.tracer.add(target.__name__, 'exchange', t0, time.time(),
+                                {'array': arrname, 'peer': bc.rblkn})
+
+    def _count_ibc(self, peer, arrname, sarr, tsend, rarr, trecv):
+        """
+        Accumulate the statistics of an interface exchange into
+        :py:attr:`ibcstat`.
+
+        >>> from . import testing
+        >>> svr = MeshSolver(testing.create_trivial_2d_blk())
+        >>> arr = np.zeros(4, dtype='float64')
+        >>> svr._count_ibc(1, 'soln', arr, 0.5, arr, 1.0)
+        >>> svr._count_ibc(1, 'soln', arr, 0.5, arr, 1.0)
+        >>> svr.ibcstat
+        {(1, 'soln'): [2, 64, 2, 64, 1.0, 2.0]}
+        """
+        stat = self.ibcstat.get((peer, arrname))
+        if stat is None:
+            stat = self.ibcstat[peer, arrname] = [0, 0, 0, 0, 0.0, 0.0]
+        stat[0] += 1
+        stat[1] += sarr.nbytes
+        stat[2] += 1
+        stat[3] += rarr.nbytes
+        stat[4] += tsend
+        stat[5] += trecv
 
     def pushibc(self, arrname, bc, recvn, worker=None):
         """
@@ -553,18 +829,22 @@ class MeshSolver(object):
         serial number than myself.
         """
         conn = worker.pconns[bc.rblkn]
-        ngstcell = self.ngstcell
+        cpd = self._ibccopies[bc.rblkn]
         arr = getattr(self, arrname)
         # ask the receiver for data.
         shape = list(arr.shape)
         shape[0] = bc.rclp.shape[0]
         rarr = np.empty(shape, dtype=arr.dtype)
+        t0 = time.time()
         conn.recvarr(rarr)  # comm.
-        slct = bc.rclp[:,0] + ngstcell
-        arr[slct] = rarr[:]
+        trecv = time.time() - t0
+        cpd.scatter(arr, rarr)
         # provide the receiver with data.
-        slct = bc.rclp[:,2] + ngstcell
-        conn.sendarr(arr[slct]) # comm.
+        sarr = cpd.gather(arr)
+        t0 = time.time()
+        conn.sendarr(sarr) # comm.
+        tsend = time.time() - t0
+        self._count_ibc(bc.rblkn, arrname, sarr, tsend, rarr, trecv)
 
     def pullibc(self, arrname, bc, sendn, worker=None):
         """
@@ -581,18 +861,22 @@ class MeshSolver(object):
         Pull data from the interface determined by the serial of peer.
         """
         conn = worker.pconns[bc.rblkn]
-        ngstcell = self.ngstcell
+        cpd = self._ibccopies[bc.rblkn]
         arr = getattr(self, arrname)
         # provide sender the data.
-        slct = bc.rclp[:,2] + ngstcell
-        conn.sendarr(arr[slct]) # comm.
+        sarr = cpd.gather(arr)
+        t0 = time.time()
+        conn.sendarr(sarr) # comm.
+        tsend = time.time() - t0
         # ask data from sender.
         shape = list(arr.shape)
         shape[0] = bc.rclp.shape[0]
         rarr = np.empty(shape, dtype=arr.dtype)
+        t0 = time.time()
         conn.recvarr(rarr)  # comm.
-        slct = bc.rclp[:,0] + ngstcell
-        arr[slct] = rarr[:]
+        trecv = time.time() - t0
+        cpd.scatter(arr, rarr)
+        self._count_ibc(bc.rblkn, arrname, sarr, tsend, rarr, trecv)
 
     def _debug_check_array(self, *arrnames, **kw):
         """
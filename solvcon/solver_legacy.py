@@ -624,7 +624,7 @@ class BlockSolver(BaseSolver):
         # grab peer index.
         ibclist = list()
         for pair in ifacelist:
-            if pair < 0:
+            if isinstance(pair, float) and pair < 0:
                 ibclist.append(pair)
             else:
                 assert len(pair) == 2
@@ -645,7 +645,7 @@ class BlockSolver(BaseSolver):
         threads = list()
         for ibc in self.ibclist:
             # check if sleep or not.
-            if ibc < 0:
+            if isinstance(ibc, float) and ibc < 0:
                 continue 
             bc, sendn, recvn = ibc
             # determine callable and arguments.
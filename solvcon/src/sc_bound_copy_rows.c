@@ -0,0 +1,92 @@
+/*
+ * Copyright (c) 2011, Yung-Yu Chen <yyc@solvcon.net>
+ *
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are met:
+ *
+ * - Redistributions of source code must retain the above copyright notice,
+ *   this list of conditions and the following disclaimer.
+ * - Redistributions in binary form must reproduce the above copyright notice,
+ *   this list of conditions and the following disclaimer in the documentation
+ *   and/or other materials provided with the distribution.
+ * - Neither the name of the SOLVCON nor the names of its contributors may be
+ *   used to endorse or promote products derived from this software without
+ *   specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+ * AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+ * IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ * ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+ * LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+ * CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+ * SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+ * INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+ * CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ * ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+ * POSSIBILITY OF SUCH DAMAGE.
+ */
+
+#include <Python.h>
+#include <string.h>
+
+#include "mesh.h"
+
+/*
+ * Copy rows of arrays for the cells of a boundary condition in one pass.  The
+ * mode selects the row indices on both sides:
+ *
+ * - SC_BOUND_COPY_GHOST: row clsrc[i] of srcs to row clgst[i] of dsts.
+ * - SC_BOUND_COPY_GATHER: row clsrc[i] of srcs to row i of dsts.
+ * - SC_BOUND_COPY_SCATTER: row i of srcs to row clgst[i] of dsts.
+ *
+ * A row of the iarr-th array has rowsizes[iarr] bytes.  If bcd->rotation
+ * isn't NULL and rotates[iarr] is non-zero, the row is taken as consecutive
+ * vectors of ndim doubles, each rotated by the ndim x ndim matrix.
+ */
+int sc_bound_copy_rows(sc_bound_t *bcd, int mode, int ndim, int narr,
+        char **dsts, char **srcs, int *rowsizes, int *rotates) {
+    // pointers.
+    char *pdst, *psrc;
+    double *pvdst, *pvsrc, *prot;
+    // scalars.
+    int nrow, nvec;
+    // iterators.
+    int icp, iarr, ivec, idm, jdm;
+    int irow, jrow;
+    if (mode < SC_BOUND_COPY_GHOST || mode > SC_BOUND_COPY_SCATTER) return -1;
+    nrow = bcd->ncopy;
+    #pragma omp parallel for private(pdst, psrc, pvdst, pvsrc, prot, nvec, \
+    icp, iarr, ivec, idm, jdm, irow, jrow)
+    for (icp=0; icp<nrow; icp++) {
+        irow = mode == SC_BOUND_COPY_GATHER ? icp : bcd->clgst[icp];
+        jrow = mode == SC_BOUND_COPY_SCATTER ? icp : bcd->clsrc[icp];
+        for (iarr=0; iarr<narr; iarr++) {
+            pdst = dsts[iarr] + (size_t)irow * rowsizes[iarr];
+            psrc = srcs[iarr] + (size_t)jrow * rowsizes[iarr];
+            if (NULL == bcd->rotation || !rotates[iarr]) {
+                memcpy(pdst, psrc, rowsizes[iarr]);
+                continue;
+            };
+            pvdst = (double *)pdst;
+            pvsrc = (double *)psrc;
+            nvec = rowsizes[iarr] / (sizeof(double) * ndim);
+            for (ivec=0; ivec<nvec; ivec++) {
+                prot = bcd->rotation;
+                for (idm=0; idm<ndim; idm++) {
+                    pvdst[idm] = 0.0;
+                    for (jdm=0; jdm<ndim; jdm++) {
+                        pvdst[idm] += prot[jdm] * pvsrc[jdm];
+                    };
+                    prot += ndim;
+                };
+                pvdst += ndim;
+                pvsrc += ndim;
+            };
+        };
+    };
+    return 0;
+};
+
+// vim: set ts=4 et:
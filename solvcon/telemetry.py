@@ -0,0 +1,173 @@
+# -*- coding: UTF-8 -*-
+#
+# Copyright (c) 2014, Yung-Yu Chen <yyc@solvcon.net>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Live telemetry of a running case.  :py:class:`TelemetryServer` serves the
+latest snapshot of a run as JSON over HTTP, on either a local TCP port or a
+Unix domain socket, from a daemon thread of the process driving the case.
+The snapshot is composed by :py:class:`solvcon.hook.TelemetryHook` from what
+the solvers already return through :py:attr:`MeshSolver.marchret
+<solvcon.solver.MeshSolver.marchret>`, and is replaced as a whole, so that
+the serving thread never blocks the time-marching loop.
+"""
+
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import json
+
+
+def get_rss():
+    """
+    :return: The resident set size of the current process in bytes, or
+        ``None`` if it cannot be determined.
+    :rtype: int
+
+    >>> get_rss() is None or get_rss() > 0
+    True
+    """
+    try:
+        with open('/proc/self/statm') as fobj:
+            return int(fobj.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # the peak value in kilobytes; it is the closest we can get.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class TelemetryServer(object):
+    """
+    Serve a snapshot :py:class:`dict` as JSON.  A ``GET`` request to ``/`` or
+    ``/telemetry`` returns the snapshot, and any other path gets 404.  The
+    server runs in a daemon thread after :py:meth:`start`.
+
+    >>> import json
+    >>> from six.moves.urllib.request import urlopen
+    >>> server = TelemetryServer(('127.0.0.1', 0))
+    >>> server.start()
+    >>> server.snapshot = {'step': 10}
+    >>> json.loads(urlopen(server.url).read().decode())
+    {'step': 10}
+    >>> server.stop()
+    """
+
+    def __init__(self, address):
+        """
+        :param address: A (host, port) tuple for TCP, or a path for a Unix
+            domain socket.  Port 0 picks a free port.
+        :type address: :py:class:`tuple` or :py:class:`str`
+        """
+        #: The address to listen on.
+        self.address = address
+        #: The latest snapshot to serve.  Replace it rather than modify it.
+        self.snapshot = dict()
+        self._server = None
+        self._thread = None
+
+    @property
+    def is_unix(self):
+        return not isinstance(self.address, tuple)
+
+    @property
+    def url(self):
+        """
+        The URL of the endpoint, or the path of the Unix domain socket.
+        """
+        if self.is_unix:
+            return self.address
+        host, port = self._server.server_address[:2]
+        return 'http://%s:%d/telemetry' % (host, port)
+
+    def _make_handler(self):
+        from six.moves.BaseHTTPServer import BaseHTTPRequestHandler
+        server = self
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/telemetry'):
+                    self.send_error(404)
+                    return
+                body = json.dumps(server.snapshot).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            def address_string(self):
+                # the client address of a Unix domain socket is empty.
+                return str(self.client_address)
+            def log_message(self, *args):
+                pass
+        return Handler
+
+    def start(self):
+        """
+        Bind the address and start serving in a daemon thread.
+
+        :return: Nothing.
+        """
+        from threading import Thread
+        from six.moves import socketserver
+        if self.is_unix:
+            if os.path.exists(self.address):
+                os.unlink(self.address)
+            class Server(socketserver.ThreadingMixIn,
+                         socketserver.UnixStreamServer):
+                daemon_threads = True
+        else:
+            class Server(socketserver.ThreadingMixIn,
+                         socketserver.TCPServer):
+                daemon_threads = True
+                allow_reuse_address = True
+        self._server = Server(self.address, self._make_handler())
+        self._thread = Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop serving and release the address.
+
+        :return: Nothing.
+        """
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = self._thread = None
+        if self.is_unix and os.path.exists(self.address):
+            os.unlink(self.address)
+
+# vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
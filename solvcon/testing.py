@@ -89,6 +89,90 @@ def create_trivial_2d_blk():
     blk.build_ghost()
     return blk
 
+def create_structured_blk(shape, cltpn=None, lengths=None,
+                          unspec_type=None, fpdtype=None):
+    """
+    Create a block of a box filled with structured cells.  Quadrilaterals are
+    split into 2 triangles and hexahedra into 6 tetrahedra when asked.  All the
+    boundary faces are put in a single BC of *unspec_type*.
+
+    >>> blk = create_structured_blk((4, 3), cltpn=3)
+    >>> blk.ncell, blk.nnode, bool((blk.clvol > 0).all())
+    (24, 20, True)
+    >>> blk = create_structured_blk((2, 2, 2), cltpn=5, lengths=(2, 1, 1))
+    >>> blk.ncell, float(round(blk.clvol.sum(), 10))
+    (48, 2.0)
+    >>> bool((blk.clvol > 0).all())
+    True
+
+    :param shape: Number of intervals along each axis; its length is the
+        spatial dimension.
+    :type shape: sequence of int
+    :keyword cltpn: Cell type; 2 (quadrilateral, default) or 3 (triangle) for
+        2D, and 4 (hexahedron, default) or 5 (tetrahedron) for 3D.
+    :type cltpn: int
+    :keyword lengths: Lengths of the box along each axis.  Default is 1.
+    :type lengths: sequence of float
+    :keyword unspec_type: BC type of the boundary faces.
+    :type unspec_type: type
+    :keyword fpdtype: dtype for floating-point.
+    :return: The block.
+    :rtype: solvcon.block.Block
+    """
+    import numpy as np
+    from .block import Block
+    shape = [int(num) for num in shape]
+    ndim = len(shape)
+    if ndim not in (2, 3):
+        raise ValueError('shape must be 2D or 3D')
+    cltpn = (2 if ndim == 2 else 4) if cltpn is None else cltpn
+    if cltpn not in ((2, 3) if ndim == 2 else (4, 5)):
+        raise ValueError('cltpn %d is not supported in %dD' % (cltpn, ndim))
+    lengths = [1.0]*ndim if lengths is None else lengths
+    # nodes.
+    axes = [np.linspace(0.0, lengths[it], shape[it]+1) for it in range(ndim)]
+    ndcrd = np.array([crd.ravel() for crd in
+                      np.meshgrid(*axes, indexing='ij')]).T
+    nid = np.arange(ndcrd.shape[0], dtype='int32').reshape(
+        [num+1 for num in shape])
+    # cells.
+    if ndim == 2:
+        corners = [nid[:-1,:-1], nid[1:,:-1], nid[1:,1:], nid[:-1,1:]]
+        corners = np.array([crn.ravel() for crn in corners]).T
+        if cltpn == 2:
+            clnds = corners
+        else:
+            clnds = np.concatenate([corners[:,[0,1,2]], corners[:,[0,2,3]]])
+    else:
+        corners = [nid[:-1,:-1,:-1], nid[1:,:-1,:-1], nid[1:,1:,:-1],
+                   nid[:-1,1:,:-1], nid[:-1,:-1,1:], nid[1:,:-1,1:],
+                   nid[1:,1:,1:], nid[:-1,1:,1:]]
+        corners = np.array([crn.ravel() for crn in corners]).T
+        if cltpn == 4:
+            clnds = corners
+        else:
+            # split along the diagonal from corner 0 to 6.
+            clnds = np.concatenate([corners[:,path] for path in (
+                [0,1,2,6], [0,2,3,6], [0,3,7,6],
+                [0,7,4,6], [0,4,5,6], [0,5,1,6])])
+            crd = ndcrd[clnds]
+            vol = np.einsum('ij,ij->i', np.cross(crd[:,1]-crd[:,0],
+                crd[:,2]-crd[:,0]), crd[:,3]-crd[:,0])
+            slct = vol < 0
+            clnds[slct,1], clnds[slct,2] = \
+                clnds[slct,2].copy(), clnds[slct,1].copy()
+    # block.
+    blk = Block(ndim=ndim, nnode=ndcrd.shape[0], ncell=clnds.shape[0],
+                fpdtype=fpdtype)
+    blk.ndcrd[:,:] = ndcrd
+    blk.cltpn[:] = cltpn
+    blk.clnds[:,0] = clnds.shape[1]
+    blk.clnds[:,1:clnds.shape[1]+1] = clnds
+    blk.build_interior()
+    blk.build_boundary(unspec_type=unspec_type)
+    blk.build_ghost()
+    return blk
+
 def get_blk_from_sample_neu(fpdtype=None, use_incenter=None):
     """
     Read data from sample.neu file and convert it into Block.
@@ -0,0 +1,21 @@
+# -*- coding: UTF-8 -*-
+
+
+from __future__ import absolute_import, division, print_function
+
+
+from unittest import TestCase
+
+class TestBenches(TestCase):
+    def test_every_bench(self):
+        from ..bench import BENCHES, SHAPES
+        for parcel, bcls in sorted(BENCHES.items()):
+            for shape in sorted(SHAPES):
+                if SHAPES[shape][0] not in bcls.ndims:
+                    continue
+                records = bcls(shape, 2, repeat=1)()
+                self.assertTrue(records, (parcel, shape))
+                for rec in records:
+                    self.assertEqual(parcel, rec['parcel'])
+                    self.assertEqual(shape, rec['shape'])
+                    self.assertFalse(rec['kernel'].startswith('ibc'))
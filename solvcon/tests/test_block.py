@@ -141,6 +141,17 @@ class TestCreation(TestCase):
         self.assertEqual(blk.clvol[2], .5)
         self.assertEqual(blk.clvol.sum(), 2)
 
+    def test_csr_faces(self):
+        blk = get_blk_from_sample_neu()
+        xadj, adjncy = blk.create_msh().create_csr()
+        fcs = blk.csr_faces()
+        self.assertEqual(len(adjncy), len(fcs))
+        # each edge connects the cell of the row and the other cell.
+        icl = np.repeat(np.arange(blk.ncell), np.diff(xadj))
+        fccls = blk.fccls[fcs,:2]
+        self.assertTrue(((fccls[:,0] == icl) | (fccls[:,1] == icl)).all())
+        self.assertTrue((fccls.sum(axis=1) - icl == adjncy).all())
+
     def test_insanity(self):
         from ..block import Block
         # build a simple 2D triangle with 4 subtriangles.
@@ -125,3 +125,29 @@ class TestMeshCase(TestCase):
             domaintype=Domain, solvertype=MeshSolver)
         cse.info.muted = True
         cse.init()
+
+    def _run_trivial(self, **kw):
+        from solvcon.testing import create_trivial_2d_blk
+        from solvcon.domain import Domain
+        from solvcon.solver import MeshSolver
+        from solvcon.case import MeshCase
+        class StillSolver(MeshSolver):
+            _MMNAMES = MeshSolver.new_method_list()
+        blk = create_trivial_2d_blk()
+        cse = MeshCase(basefn='meshcase', mesher=lambda *arg: blk,
+            domaintype=Domain, solvertype=StillSolver, time_increment=0.5,
+            steps_run=6, **kw)
+        cse.info.muted = True
+        cse.init()
+        cse.run()
+        return cse
+
+    def test_restart_time(self):
+        cse = self._run_trivial(step_init=4)
+        self.assertEqual(cse.execution.step_current, 6)
+        self.assertEqual(cse.execution.time, 3.0)
+        self.assertEqual(cse.solver.solverobj.time, 3.0)
+
+    def test_restart_restored_time(self):
+        cse = self._run_trivial(step_init=4, time=1.5)
+        self.assertEqual(cse.execution.time, 2.5)
@@ -96,6 +96,13 @@ class TestCollective(TestCase):
                     nfc += len(sbc)
         self.assertEqual(nfc, dom.edgecut*2)
 
+    def test_interface_stats(self):
+        dom = self.dom
+        nifc, nnbr = dom.interface_stats()
+        for iblk, blk in enumerate(dom):
+            self.assertEqual(nifc[iblk], (blk.fccls[:,2]!=-1).sum())
+            self.assertEqual(nnbr[iblk], len(set(blk.fccls[:,2])-set([-1])))
+
     def test_bcs(self):
         from ..boundcond import bctregy
         for blk in self.dom:
@@ -140,6 +147,69 @@ class TestCollective(TestCase):
             writers[-1].write('test%d.vtk'%iblk)
             iblk += 1
 
+class TestThreadedSplit(TestCase):
+    BLKARRS = ('ndcrd', 'fccls', 'fcnds', 'clfcs', 'clnds', 'cltpn',
+               'clgrp', 'shndcrd', 'shfccls', 'shclfcs')
+
+    @staticmethod
+    def _split(nthread):
+        from ..domain import Collective
+        dom = Collective(blk=get_sample_neu())
+        dom.split(4, nthread=nthread)
+        return dom
+
+    def test_same_as_sequential(self):
+        import numpy as np
+        dom0 = self._split(1)
+        dom1 = self._split(4)
+        # the partition is deterministic.
+        self.assertTrue((dom0.part == dom1.part).all())
+        self.assertEqual(4, len(dom1))
+        self.assertTrue((dom0.shapes == dom1.shapes).all())
+        self.assertTrue((dom0.ifparr == dom1.ifparr).all())
+        for info0, info1 in zip(dom0.idxinfo, dom1.idxinfo):
+            for arr0, arr1 in zip(info0, info1):
+                self.assertTrue(np.array_equal(arr0, arr1))
+        for blk0, blk1 in zip(dom0, dom1):
+            for name in self.BLKARRS:
+                self.assertTrue(np.array_equal(getattr(blk0, name),
+                                               getattr(blk1, name)), name)
+            self.assertEqual(len(blk0.bclist), len(blk1.bclist))
+            for bc0, bc1 in zip(blk0.bclist, blk1.bclist):
+                self.assertEqual((type(bc0), bc0.name, bc0.sern),
+                                 (type(bc1), bc1.name, bc1.sern))
+                self.assertTrue(np.array_equal(bc0.facn, bc1.facn))
+                # interfaces.
+                self.assertEqual(getattr(bc0, 'rblkn', None),
+                                 getattr(bc1, 'rblkn', None))
+                if hasattr(bc0, 'rclp'):
+                    self.assertTrue(np.array_equal(bc0.rclp, bc1.rclp))
+
+class TestRunThreaded(TestCase):
+    def test_bounded(self):
+        import threading
+        from ..domain import run_threaded, MAX_THREADS
+        names = set()
+        lock = threading.Lock()
+        def work(iitem):
+            with lock:
+                names.add(threading.current_thread().name)
+        run_threaded(work, 4*MAX_THREADS)
+        self.assertEqual(MAX_THREADS, len(names))
+        names.clear()
+        run_threaded(work, 10, nthread=3)
+        self.assertEqual(3, len(names))
+
+    def test_error(self):
+        from ..domain import run_threaded
+        done = list()
+        def work(iitem):
+            if iitem == 1:
+                raise ValueError(iitem)
+            done.append(iitem)
+        self.assertRaises(ValueError, run_threaded, work, 4, nthread=4)
+        self.assertEqual([0, 2, 3], sorted(done))
+
 class TestInterface(TestCase):
     def test_oblique2(self):
         from ..domain import Collective
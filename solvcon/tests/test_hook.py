@@ -87,3 +87,237 @@ class TestMarchSave(BlockHookTest):
         self.assertEqual(MarchSave.premarch, Hook.premarch)
         self.assertNotEqual(MarchSave.postmarch, Hook.postmarch)
         self.assertEqual(MarchSave.postloop, Hook.postloop)
+
+from ..solver import MeshSolver
+
+class BalancedSolver(MeshSolver):
+    """
+    Solver with the names of the marching methods of the gas solver, at
+    module level for the workers in other processes to import.
+    """
+    _MMNAMES = MeshSolver.new_method_list()
+    @_MMNAMES.register
+    def calcsoln(self, worker=None):
+        pass
+    @_MMNAMES.register
+    def ibcsoln(self, worker=None):
+        pass
+
+class TestLoadBalanceHook(TestCase):
+    def test_measure(self):
+        from ..gendata import Timer
+        from ..hook import LoadBalanceHook
+        timers = [Timer(), Timer()]
+        for timer, val in zip(timers, (1.0, 3.0)):
+            # the marching methods of the gas solver.
+            for name in ('calcsoln', 'ibcsoln', 'bcsoln', 'calccfl',
+                         'calcdsoln', 'ibcdsoln', 'bcdsoln'):
+                timer.increase(name, val)
+                timer.increase(name+'_a', val)
+            timer.increase('march', 7*val)
+        mmnames, mmtime = LoadBalanceHook.measure(timers)
+        self.assertEqual(['bcdsoln', 'bcsoln', 'calccfl', 'calcdsoln',
+                          'calcsoln'], mmnames)
+        self.assertEqual([[1.0]*5, [3.0]*5], mmtime.tolist())
+
+    def test_estimate_cost(self):
+        from ..testing import create_trivial_2d_blk
+        from ..hook import LoadBalanceHook
+        # each triangle has one boundary face.
+        cost = LoadBalanceHook.estimate_cost(create_trivial_2d_blk())
+        self.assertEqual([4.0, 4.0, 4.0], cost.tolist())
+
+    def test_sequential(self):
+        import os
+        import shutil
+        import tempfile
+        import numpy as np
+        from ..testing import create_trivial_2d_blk
+        from ..case import MeshCase
+        from ..domain import Domain
+        from ..solver import MeshSolver
+        from ..hook import LoadBalanceHook
+        blk = create_trivial_2d_blk()
+        tdir = tempfile.mkdtemp()
+        try:
+            cse = MeshCase(basefn='meshcase', basedir=tdir,
+                           mesher=lambda *arg: blk, domaintype=Domain,
+                           solvertype=MeshSolver)
+            cse.info.muted = True
+            cse.runhooks.append(LoadBalanceHook)
+            cse.init()
+            cse.run()
+            res = cse.runhooks[-1].result
+            self.assertEqual(1.0, res['before'])
+            self.assertEqual(1.0, res['after'])
+            vwgt = np.load(os.path.join(tdir, 'meshcase_vwgt.npy'))
+            self.assertEqual([100, 100, 100], vwgt.tolist())
+        finally:
+            shutil.rmtree(tdir)
+
+    def _run_parallel(self, threaded):
+        import shutil
+        import tempfile
+        from ..io.gambit import GambitNeutral
+        from ..testing import loadfile
+        from ..case import MeshCase
+        from ..domain import Collective
+        from ..hook import LoadBalanceHook
+        blk = GambitNeutral(loadfile('oblique.neu')).toblock()
+        tdir = tempfile.mkdtemp()
+        try:
+            # the worker processes load the sub-blocks from files.
+            cse = MeshCase(basefn='meshcase', basedir=tdir,
+                           mesher=lambda *arg: blk, domaintype=Collective,
+                           npart=2, solvertype=BalancedSolver,
+                           threaded=threaded,
+                           scratchdir=None if threaded else tdir,
+                           time_increment=0.1, steps_run=2)
+            cse.info.muted = True
+            cse.runhooks.append(LoadBalanceHook)
+            cse.init()
+            cse.run()
+            cse.cleanup()
+            # the timers are collected from both of the workers.
+            res = cse.runhooks[-1].result
+            self.assertEqual(['calcsoln'], res['mmnames'])
+            self.assertEqual((2, 1), res['mmtime'].shape)
+            self.assertEqual(2, res['npart'])
+            self.assertEqual(blk.ncell, len(res['vwgt']))
+        finally:
+            shutil.rmtree(tdir)
+
+    def test_threaded(self):
+        self._run_parallel(True)
+
+    def test_processes(self):
+        self._run_parallel(False)
+
+class TestTraceHook(TestCase):
+    def test_sequential(self):
+        import os
+        import json
+        import shutil
+        import tempfile
+        from ..testing import create_trivial_2d_blk
+        from ..case import MeshCase
+        from ..domain import Domain
+        from ..solver import MeshSolver
+        from ..anchor import MeshAnchor
+        from ..hook import TraceHook
+        class TracedSolver(MeshSolver):
+            _MMNAMES = MeshSolver.new_method_list()
+            @_MMNAMES.register
+            def calcsome(self, worker=None):
+                pass
+        class TracedAnchor(MeshAnchor):
+            def postfull(self):
+                pass
+        blk = create_trivial_2d_blk()
+        tdir = tempfile.mkdtemp()
+        try:
+            cse = MeshCase(basefn='meshcase', basedir=tdir,
+                           mesher=lambda *arg: blk, domaintype=Domain,
+                           solvertype=TracedSolver, time_increment=0.1,
+                           steps_run=2)
+            cse.info.muted = True
+            cse.runhooks.append(TraceHook)
+            cse.runhooks.append(TracedAnchor)
+            cse.init()
+            cse.run()
+            with open(os.path.join(tdir, 'meshcase_trace.json')) as fobj:
+                events = json.load(fobj)['traceEvents']
+            names = dict((evt['pid'], evt['args']['name'])
+                         for evt in events if evt['ph'] == 'M')
+            self.assertEqual({0: 'case', 1: 'solver #0'}, names)
+            spans = [(evt['pid'], evt['cat'], evt['name'])
+                     for evt in events if evt['ph'] == 'X']
+            self.assertEqual(2, spans.count((1, 'step', 'step')))
+            self.assertEqual(2, spans.count((1, 'march', 'calcsome')))
+            self.assertEqual(2, spans.count(
+                (1, 'anchor', 'TracedAnchor.postfull')))
+            self.assertIn((0, 'case', 'init'), spans)
+            self.assertIn((0, 'case', 'run_march'), spans)
+            # no-op methods are not recorded.
+            self.assertNotIn((1, 'anchor', 'TracedAnchor.premarch'), spans)
+        finally:
+            shutil.rmtree(tdir)
+
+class TestTelemetryHook(TestCase):
+    def test_sequential(self):
+        import os
+        import json
+        import shutil
+        import tempfile
+        from six.moves.urllib.request import urlopen
+        from ..testing import create_trivial_2d_blk
+        from ..case import MeshCase
+        from ..domain import Domain
+        from ..solver import MeshSolver
+        from ..hook import MeshHook, TelemetryHook
+        class SomeSolver(MeshSolver):
+            _MMNAMES = MeshSolver.new_method_list()
+            @_MMNAMES.register
+            def calcsome(self, worker=None):
+                pass
+        snapshots = list()
+        class FetchHook(MeshHook):
+            def postmarch(self):
+                urlfn = os.path.join(self.cse.io.basedir,
+                                     'meshcase_telemetry.url')
+                with open(urlfn) as fobj:
+                    url = fobj.read().strip()
+                snapshots.append(json.loads(urlopen(url).read().decode()))
+        blk = create_trivial_2d_blk()
+        tdir = tempfile.mkdtemp()
+        try:
+            cse = MeshCase(basefn='meshcase', basedir=tdir,
+                           mesher=lambda *arg: blk, domaintype=Domain,
+                           solvertype=SomeSolver, time_increment=0.1,
+                           steps_run=2)
+            cse.info.muted = True
+            cse.runhooks.append(TelemetryHook)
+            cse.runhooks.append(FetchHook)
+            cse.init()
+            cse.run()
+            self.assertEqual([1, 2], [snap['step'] for snap in snapshots])
+            snap = snapshots[-1]
+            self.assertEqual('running', snap['state'])
+            self.assertAlmostEqual(0.2, snap['time'])
+            self.assertEqual(blk.ncell, snap['ncell'])
+            self.assertEqual([0], [wkr['svrn'] for wkr in snap['workers']])
+            self.assertTrue(snap['steps_per_second'] > 0)
+        finally:
+            shutil.rmtree(tdir)
+
+class TestMemoryHook(TestCase):
+    def test_sequential(self):
+        import shutil
+        import tempfile
+        from ..testing import create_trivial_2d_blk
+        from ..case import MeshCase
+        from ..domain import Domain
+        from ..solver import MeshSolver
+        from ..memory import block_memory
+        from ..hook import MemoryHook
+        class SomeSolver(MeshSolver):
+            _MMNAMES = MeshSolver.new_method_list()
+            @_MMNAMES.register
+            def calcsome(self, worker=None):
+                pass
+        blk = create_trivial_2d_blk()
+        tdir = tempfile.mkdtemp()
+        try:
+            cse = MeshCase(basefn='meshcase', basedir=tdir,
+                           mesher=lambda *arg: blk, domaintype=Domain,
+                           solvertype=SomeSolver, time_increment=0.1,
+                           steps_run=1)
+            cse.info.muted = True
+            cse.runhooks.append(MemoryHook)
+            cse.init()
+            cse.run()
+            hook = cse.runhooks[-1]
+            self.assertEqual([0], [mem['svrn'] for mem in hook.memories])
+            self.assertEqual(block_memory(blk), hook.memories[0]['block'])
+        finally:
+            shutil.rmtree(tdir)
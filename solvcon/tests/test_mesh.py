@@ -35,7 +35,7 @@ import unittest
 import numpy as np
 
 from .. import py3kcompat
-from ..mesh import Table
+from ..mesh import Table, Bound
 
 
 class TestTableCreation(unittest.TestCase):
@@ -119,4 +119,43 @@ class TestTableParts(unittest.TestCase):
         self.assertEqual(list(range(4*5,3*4*5)), list(tbl.B.ravel()))
         self.assertEqual(list(range(4*5,3*4*5)), list(tbl._bodypart.ravel()))
 
+class TestBoundCopy(unittest.TestCase):
+    def setUp(self):
+        self.bcd = Bound()
+        self.bcd.setup_copy([0, 1, 2], [5, 3, 4])
+
+    def test_copy_ghost_multiple(self):
+        soln = np.arange(6*4, dtype='float64').reshape((6, 4))
+        dsoln = np.arange(6*4*2, dtype='float64').reshape((6, 4, 2))
+        clgrp = np.arange(6, dtype='int32')
+        gsoln = soln.copy()
+        gsoln[[0, 1, 2]] = gsoln[[5, 3, 4]]
+        gdsoln = dsoln.copy()
+        gdsoln[[0, 1, 2]] = gdsoln[[5, 3, 4]]
+        self.bcd.copy_ghost([soln, dsoln, clgrp])
+        self.assertEqual(gsoln.tolist(), soln.tolist())
+        self.assertEqual(gdsoln.tolist(), dsoln.tolist())
+        self.assertEqual([5, 3, 4, 3, 4, 5], clgrp.tolist())
+
+    def test_gather_scatter(self):
+        arr = np.arange(6*3, dtype='float64').reshape((6, 3))
+        rows = self.bcd.gather(arr)
+        self.assertEqual(arr[[5, 3, 4]].tolist(), rows.tolist())
+        self.bcd.scatter(arr, -rows)
+        self.assertEqual((-rows).tolist(), arr[:3].tolist())
+
+    def test_rotation(self):
+        self.bcd.setup_copy([0], [1], rotation=[[0.0, -1.0], [1.0, 0.0]])
+        dsoln = np.arange(2*3*2, dtype='float64').reshape((2, 3, 2))
+        self.bcd.copy_ghost([dsoln], rotate=[True])
+        self.assertEqual([[-7.0, 6.0], [-9.0, 8.0], [-11.0, 10.0]],
+                         dsoln[0].tolist())
+
+    def test_mismatch(self):
+        arr = np.zeros((6, 3), dtype='float64')
+        with self.assertRaises(ValueError):
+            self.bcd.scatter(arr, np.zeros((3, 2), dtype='float64'))
+        with self.assertRaises(ValueError):
+            Bound().gather(arr)
+
 # vim: set fenc=utf8 ff=unix nobomb ai et sw=4 ts=4 tw=79:
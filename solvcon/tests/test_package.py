@@ -49,3 +49,61 @@ class TestAllImport(unittest.TestCase):
             except Exception as e:
                 e.args = ['modname = %s'%mod.__name__] + list(e.args)
                 raise
+
+
+class TestImportTime(unittest.TestCase):
+    """
+    Time importing solvcon in a fresh interpreter, as a spawned worker or an
+    ``scg`` command does.
+    """
+
+    def setUp(self):
+        import sys
+        if sys.version_info < (3, 7):
+            raise unittest.SkipTest('no lazy loading before Python 3.7')
+
+    @staticmethod
+    def _run(stmt, repeat=3):
+        """
+        :return: The best wall time of running *stmt* and the modules loaded
+            by it.
+        """
+        import os
+        import sys
+        import json
+        import subprocess
+        import solvcon
+        code = '\n'.join([
+            'import sys, json, time',
+            'before = set(sys.modules)',
+            'timer = time.time()',
+            stmt,
+            'elapsed = time.time() - timer',
+            'print(json.dumps([elapsed, sorted(set(sys.modules)-before)]))',
+        ])
+        env = dict(os.environ)
+        path = os.path.dirname(os.path.dirname(os.path.abspath(
+            solvcon.__file__)))
+        env['PYTHONPATH'] = os.pathsep.join(
+            [path] + [env['PYTHONPATH']] if env.get('PYTHONPATH') else [path])
+        best = None
+        for it in range(repeat):
+            out = subprocess.check_output([sys.executable, '-c', code],
+                                          env=env, stderr=subprocess.PIPE)
+            elapsed, mods = json.loads(out.decode().strip().split('\n')[-1])
+            best = elapsed if best is None else min(best, elapsed)
+        return best, mods
+
+    def test_lazy(self):
+        elapsed, mods = self._run('import solvcon')
+        for name in ('numpy', 'solvcon.block', 'solvcon.case',
+                     'solvcon.parcel', 'solvcon.parcel.gas'):
+            self.assertNotIn(name, mods)
+
+    def test_faster_than_eager(self):
+        lazy, mods = self._run('import solvcon')
+        eager, mods = self._run('import solvcon\n'
+            'for name in solvcon.__all__: getattr(solvcon, name)\n'
+            'for name in solvcon.parcel.__all__: getattr(solvcon.parcel, name)')
+        self.assertTrue('solvcon.parcel.gas' in mods)
+        self.assertLess(lazy, eager)
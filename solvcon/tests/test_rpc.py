@@ -109,4 +109,144 @@ class TestWorker(TestCase):
         dealer.barrier()
         dealer.terminate()
 
+    def test_hire_thread(self):
+        from ..rpc import Worker, Dealer
+        dealer = Dealer()
+        muscles = [Solver("solver0", "solver1"), Solver("solver1", "solver0")]
+        for iproc in range(2):
+            dealer.hire_thread(Worker(None))
+            dealer[iproc].remote_setattr('muscle', muscles[iproc])
+        dealer.bridge((0,1))
+        dealer.barrier()
+        dealer[0].cmd.send_msg(with_worker=True)
+        dealer[1].cmd.recv_msg(with_worker=True)
+        dealer.barrier()
+        dealer.terminate()
+
+    def test_appoint_all(self):
+        import sys
+        from multiprocessing import Process
+        from nose.plugins.skip import SkipTest
+        if sys.platform.startswith('win'): raise SkipTest
+        from ..connection import pick_unused_port
+        from ..rpc import Worker, Dealer, DEFAULT_AUTHKEY
+        dealer = Dealer(family='AF_INET')
+        # forking in the launching threads may deadlock the children, so
+        # start the worker processes beforehand.
+        addresses = list()
+        for iworker in range(3):
+            address = ('127.0.0.1', pick_unused_port())
+            muscle = Solver('solver%d' % iworker, None)
+            proc = Process(target=Worker(muscle).run,
+                           args=(address, DEFAULT_AUTHKEY))
+            proc.start()
+            addresses.append(address)
+        attempts = dict()
+        def launch(iworker):
+            attempts[iworker] = attempts.get(iworker, 0) + 1
+            if iworker == 1 and attempts[iworker] == 1:
+                raise IOError('failed launch')
+            return addresses[iworker]
+        arrived = list()
+        dealer.appoint_all(launch, 3, DEFAULT_AUTHKEY, nthread=3, retries=1,
+                           notify=lambda *args: arrived.append(args))
+        self.assertEqual([0, 1, 2], sorted(args[0] for args in arrived))
+        self.assertEqual(2, [args[2] for args in arrived
+                             if args[0] == 1][0])
+        for iworker in range(3):
+            dealer[iworker].cmd.assert_msg('solver%d' % iworker)
+        dealer.barrier()
+        dealer.terminate()
+
+
+class TestAppointRetry(TestCase):
+    """
+    Retries of L{solvcon.rpc.Dealer.appoint_all}, with the connections to the
+    workers faked by L{FakeConnection}.
+    """
+
+    class FakeConnection(object):
+        def __init__(self, address, broken):
+            self.address = address
+            self.broken = broken
+            self.closed = False
+        def send(self, obj):
+            if self.broken:
+                raise EOFError('broken connection')
+        def close(self):
+            self.closed = True
+
+    def setUp(self):
+        from .. import connection
+        self.client = connection.Client
+        self.conns = list()
+        #: addresses to refuse and connections to break, for each attempt.
+        self.refused = list()
+        self.breaks = list()
+        def fake_client(address, authkey):
+            if address in self.refused:
+                self.refused.remove(address)
+                raise IOError('connection refused')
+            broken = address in self.breaks
+            if broken:
+                self.breaks.remove(address)
+            conn = self.FakeConnection(address, broken)
+            self.conns.append(conn)
+            return conn
+        connection.Client = fake_client
+
+    def tearDown(self):
+        from .. import connection
+        connection.Client = self.client
+
+    def _appoint(self, **kw):
+        from ..rpc import Dealer, DEFAULT_AUTHKEY
+        self.launched = list()
+        def launch(iworker):
+            address = ('127.0.0.1', 10000+len(self.launched))
+            self.launched.append((iworker, address))
+            return address
+        arrived = list()
+        dealer = Dealer(family='AF_INET')
+        dealer.appoint_all(launch, 2, DEFAULT_AUTHKEY, nthread=1,
+                           notify=lambda *args: arrived.append(args), **kw)
+        return dealer, arrived
+
+    def test_reconnect(self):
+        self.refused.append(('127.0.0.1', 10001))
+        self.breaks.append(('127.0.0.1', 10001))
+        dealer, arrived = self._appoint(retries=2)
+        # the worker is connected again without being launched again.
+        self.assertEqual([(0, ('127.0.0.1', 10000)),
+                          (1, ('127.0.0.1', 10001))], self.launched)
+        self.assertEqual([(0, ('127.0.0.1', 10000), 1),
+                          (1, ('127.0.0.1', 10001), 3)], arrived)
+        # the broken connection is closed.
+        self.assertEqual([False, True, False],
+                         [conn.closed for conn in self.conns])
+        self.assertEqual([self.conns[0], self.conns[2]],
+                         [shadow.conn for shadow in dealer])
+
+    def test_no_relaunch(self):
+        self.breaks.extend([('127.0.0.1', 10001)]*2)
+        self.assertRaises(EOFError, self._appoint, retries=1)
+        self.assertEqual(2, len(self.launched))
+        self.assertTrue(all(conn.closed for conn in self.conns))
+
+    def test_terminate(self):
+        self.breaks.extend([('127.0.0.1', 10001)]*2)
+        terminated = list()
+        def terminate(iworker, address):
+            # the worker is stopped before launching another one.
+            self.assertEqual(2, len(self.launched))
+            terminated.append((iworker, address))
+        dealer, arrived = self._appoint(retries=1, terminate=terminate)
+        self.assertEqual([(1, ('127.0.0.1', 10001))], terminated)
+        self.assertEqual([(0, ('127.0.0.1', 10000)),
+                          (1, ('127.0.0.1', 10001)),
+                          (1, ('127.0.0.1', 10002))], self.launched)
+        self.assertEqual((1, ('127.0.0.1', 10002), 3), arrived[1])
+        self.assertEqual([False, True, True, False],
+                         [conn.closed for conn in self.conns])
+
 # vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
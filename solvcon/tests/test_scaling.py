@@ -0,0 +1,91 @@
+# -*- coding: UTF-8 -*-
+#
+# Copyright (c) 2014, Yung-Yu Chen <yyc@solvcon.net>
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+
+from __future__ import absolute_import, division, print_function
+
+
+import os
+import glob
+import tempfile
+from unittest import TestCase
+
+class TestScalingHarness(TestCase):
+    @staticmethod
+    def _create_case(*args):
+        from ..scaling import create_gas_case
+        cse = create_gas_case(*args)
+        cse.info.muted = True
+        return cse
+
+    def _run(self, mode):
+        from ..hook import PhaseTimeHook
+        from ..scaling import ScalingHarness
+        harness = ScalingHarness(create_case=self._create_case, mode=mode,
+                                 nworkers=(1, 2), shape='quad', size=8,
+                                 steps=2)
+        records = harness()
+        self.assertEqual(2*len(PhaseTimeHook.PHASES), len(records))
+        self.assertEqual([1]*len(PhaseTimeHook.PHASES) +
+                         [2]*len(PhaseTimeHook.PHASES),
+                         [rec['nworker'] for rec in records])
+        return records
+
+    def test_strong(self):
+        before = set(glob.glob(os.path.join(tempfile.gettempdir(),
+                                            'solvcon_scaling_*')))
+        records = self._run('strong')
+        self.assertEqual(set([64]), set(rec['ncell'] for rec in records))
+        # the temporary directories are removed.
+        after = set(glob.glob(os.path.join(tempfile.gettempdir(),
+                                           'solvcon_scaling_*')))
+        self.assertEqual(before, after)
+
+    def test_weak(self):
+        records = self._run('weak')
+        self.assertEqual([64, 121], sorted(set(rec['ncell']
+                                               for rec in records)))
+
+    def test_basedir(self):
+        import shutil
+        from ..scaling import ScalingHarness
+        basedir = tempfile.mkdtemp()
+        try:
+            harness = ScalingHarness(create_case=self._create_case,
+                                     nworkers=(1,), shape='tri', size=4,
+                                     steps=1, basedir=basedir)
+            harness()
+            # the output is kept in the given directory, without the
+            # scratch blocks.
+            self.assertEqual(['strong_1'], os.listdir(basedir))
+        finally:
+            shutil.rmtree(basedir)
+
+# vim: set ff=unix fenc=utf8 ft=python ai et sw=4 ts=4 tw=79:
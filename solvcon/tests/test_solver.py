@@ -6,6 +6,9 @@ from __future__ import absolute_import, division, print_function
 
 import os
 from unittest import TestCase
+
+import numpy as np
+
 from ..testing import get_blk_from_sample_neu
 from ..solver import BaseSolver, BlockSolver
 
@@ -175,3 +178,35 @@ class TestBlock(TestCase):
     def test_blkn(self):
         svr = self._get_solver()
         self.assertEqual(svr.svrn, None)
+
+class TestMeshSolverTransfer(TestCase):
+    class _Conn(object):
+        def send(self, obj):
+            self.obj = obj
+
+    class _Worker(object):
+        def __init__(self):
+            self.conn = TestMeshSolverTransfer._Conn()
+
+    def _get_solver(self):
+        from ..testing import create_trivial_2d_blk
+        from ..solver import MeshSolver
+        svr = MeshSolver(create_trivial_2d_blk())
+        svr.arr = np.arange(6, dtype='float64')
+        return svr
+
+    def test_pull_interior(self):
+        svr = self._get_solver()
+        worker = self._Worker()
+        svr.pull('arr', start=3, worker=worker)
+        self.assertEqual([3., 4., 5.], worker.conn.obj.tolist())
+
+    def test_push_interior(self):
+        svr = self._get_solver()
+        svr.push(np.array([-3., -4., -5.]), 'arr', start=3)
+        self.assertEqual([0., 1., 2., -3., -4., -5.], svr.arr.tolist())
+
+    def test_push_whole(self):
+        svr = self._get_solver()
+        svr.push(-np.arange(6, dtype='float64'), 'arr', start=3)
+        self.assertEqual([0., 1., 2., -3., -4., -5.], svr.arr.tolist())